@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Dict
 
 from src.brain import AttentionFusionEngine
-from src.schemas import Signal
+from src.schemas import SignalRecord
 
 try:
     from src.brain_hybrid import HybridAttentionEngine
@@ -19,10 +19,10 @@ except ImportError:
     print("⚠️  Rust extension not available, skipping Rust benchmarks")
 
 
-def generate_signals(count: int) -> Dict[str, Signal]:
+def generate_signals(count: int) -> Dict[str, SignalRecord]:
     """Generate test signals"""
     return {
-        f"sensor_{i}": Signal(
+        f"sensor_{i}": SignalRecord(
             source=f"sensor_{i}",
             value=float(i % 100) / 100.0,
             timestamp=datetime.now(),
@@ -32,7 +32,7 @@ def generate_signals(count: int) -> Dict[str, Signal]:
     }
 
 
-def benchmark_attention_weights(engine, signals: Dict[str, Signal], iterations: int = 1000):
+def benchmark_attention_weights(engine, signals: Dict[str, SignalRecord], iterations: int = 1000):
     """Benchmark attention weight computation"""
     times = []
 
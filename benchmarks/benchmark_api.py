@@ -0,0 +1,147 @@
+"""
+API serialization benchmark: /status requests per second
+Compares the default FastAPI response path (jsonable_encoder + JSONResponse)
+against FastJSONResponse and the per-cycle response cache, in-process over ASGI
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+
+import main
+from src.response_cache import ResponseCache
+from src.schemas import DecisionChain, Signal, SystemState
+from src.serialization import ORJSON_AVAILABLE, FastJSONResponse, dumps
+
+
+def build_state(num_signals: int, num_decisions: int) -> SystemState:
+    """A system state with `num_signals` sources and a decision history"""
+    now = datetime.now()
+    signals = {
+        f"sensor_{i}": Signal(
+            source=f"sensor_{i}",
+            value=random.uniform(-1.0, 1.0),
+            timestamp=now - timedelta(seconds=i),
+            raw_content=f"Observation {i} from the field",
+        )
+        for i in range(num_signals)
+    }
+    decisions = [
+        DecisionChain(
+            timestamp=now - timedelta(seconds=5 * i),
+            weights={src: 1.0 / num_signals for src in signals},
+            action=random.choice(["BUY", "SELL", "HOLD"]),
+            reasoning="Weighted signal fusion",
+            is_safe=True,
+        )
+        for i in range(num_decisions)
+    ]
+    return SystemState(
+        latest_decision=decisions[0], latest_signals=signals, cycle_count=num_decisions
+    )
+
+
+def build_app(state: SystemState) -> FastAPI:
+    """Three /status variants over the same state"""
+    app = FastAPI()
+    cache = ResponseCache()
+    cache.publish(state.cycle_count, {"status": main.render_status(state, state.latest_decision)})
+
+    @app.get("/legacy")
+    async def legacy():
+        return main.render_status(state, state.latest_decision)
+
+    @app.get("/fast")
+    async def fast():
+        return FastJSONResponse(main.render_status(state, state.latest_decision))
+
+    @app.get("/cached")
+    async def cached(request: Request):
+        return cache.get("status").respond(request.headers.get("if-none-match"))
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int, headers=None) -> float:
+    """Requests per second for `requests` sequential GETs"""
+    for _ in range(50):  # Warm up
+        await client.get(path, headers=headers)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(path, headers=headers)
+    return requests / (time.perf_counter() - start)
+
+
+async def benchmark_status(num_signals: int, requests: int = 2000):
+    """Benchmark /status end to end"""
+    print(f"\n🌐 /status with {num_signals} signals ({requests} requests per variant)")
+    print("-" * 70)
+
+    state = build_state(num_signals, 10)
+    main.recent_decisions = lambda limit: []  # No journal: history is the latest decision
+    app = build_app(state)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        etag = (await client.get("/cached")).headers["etag"]
+        results = {
+            "jsonable_encoder + JSONResponse": await measure(client, "/legacy", requests),
+            "FastJSONResponse": await measure(client, "/fast", requests),
+            "Response cache": await measure(client, "/cached", requests),
+            "Response cache (304)": await measure(
+                client, "/cached", requests, headers={"If-None-Match": etag}
+            ),
+        }
+
+    baseline = results["jsonable_encoder + JSONResponse"]
+    for name, rps in results.items():
+        print(f"  {name:34s} {rps:8.0f} req/s   ({rps / baseline:.2f}x)")
+
+
+def benchmark_encoding(num_signals: int, iterations: int = 2000):
+    """Encode-only cost of one /status payload"""
+    print(f"\n🧮 Encoding one /status payload ({num_signals} signals)")
+    print("-" * 70)
+
+    state = build_state(num_signals, 10)
+    payload = main.render_status(state, state.latest_decision)
+
+    def legacy():
+        return json.dumps(jsonable_encoder(payload)).encode()
+
+    def fast():
+        return dumps(payload)
+
+    for name, encode in (("jsonable_encoder + json", legacy), ("serialization.dumps", fast)):
+        times = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            encode()
+            times.append(time.perf_counter() - start)
+        print(f"  {name:34s} {statistics.mean(times) * 1e6:8.1f} µs")
+
+
+def run_api_benchmark():
+    """Run API serialization benchmarks"""
+    print("⚡ Decisify API Serialization Benchmark")
+    print("=" * 70)
+    print(f"JSON backend: {'orjson' if ORJSON_AVAILABLE else 'stdlib json (install the fast extra)'}")
+
+    for num_signals in (3, 50):
+        benchmark_encoding(num_signals)
+        asyncio.run(benchmark_status(num_signals))
+
+    print("\n" + "=" * 70)
+    print("✅ API benchmark complete!")
+
+
+if __name__ == "__main__":
+    run_api_benchmark()
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Dict
 
 from src.brain import AttentionFusionEngine
-from src.schemas import Signal
+from src.schemas import SignalRecord
 
 try:
     from brain_hybrid import HybridAttentionEngine
@@ -20,7 +20,7 @@ except ImportError:
     print("⚠️  Rust extension not available")
 
 
-def generate_realistic_signals(count: int) -> Dict[str, Signal]:
+def generate_realistic_signals(count: int) -> Dict[str, SignalRecord]:
     """Generate realistic signal data"""
     import random
 
@@ -29,7 +29,7 @@ def generate_realistic_signals(count: int) -> Dict[str, Signal]:
 
     # Market signals
     for i in range(count // 3):
-        signals[f"market_{i}"] = Signal(
+        signals[f"market_{i}"] = SignalRecord(
             source=f"market_{i}",
             value=random.uniform(-0.8, 0.8),
             timestamp=now,
@@ -38,7 +38,7 @@ def generate_realistic_signals(count: int) -> Dict[str, Signal]:
 
     # Sentiment signals
     for i in range(count // 3):
-        signals[f"sentiment_{i}"] = Signal(
+        signals[f"sentiment_{i}"] = SignalRecord(
             source=f"sentiment_{i}",
             value=random.uniform(-1.0, 1.0),
             timestamp=now,
@@ -47,7 +47,7 @@ def generate_realistic_signals(count: int) -> Dict[str, Signal]:
 
     # Volatility signals
     for i in range(count - 2 * (count // 3)):
-        signals[f"volatility_{i}"] = Signal(
+        signals[f"volatility_{i}"] = SignalRecord(
             source=f"volatility_{i}",
             value=random.uniform(0.0, 1.0),
             timestamp=now,
@@ -57,7 +57,7 @@ def generate_realistic_signals(count: int) -> Dict[str, Signal]:
     return signals
 
 
-def benchmark_full_decision(engine, signals: Dict[str, Signal], iterations: int = 1000):
+def benchmark_full_decision(engine, signals: Dict[str, SignalRecord], iterations: int = 1000):
     """Benchmark complete decision pipeline"""
     times = []
 
@@ -0,0 +1,115 @@
+"""
+Tracing overhead benchmark
+Cost of a span when tracing is disabled (the default) and enabled, alone and
+around the cognition -> safety -> explanation stages of a decision cycle
+"""
+
+import random
+import time
+from datetime import datetime
+
+from src.brain import AttentionFusionEngine
+from src.safety import SafetyGate
+from src.schemas import SignalRecord
+from src.tracing import Tracer
+
+
+def per_call_ns(funcs, iterations: int, rounds: int = 7):
+    """
+    Mean nanoseconds per call for each of `funcs`, best of `rounds`.
+    Variants are interleaved within each round so drift affects all alike.
+    """
+    best = [float("inf")] * len(funcs)
+    for _ in range(rounds):
+        for i, func in enumerate(funcs):
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                func()
+            best[i] = min(best[i], (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def benchmark_span_cost(iterations: int = 200_000):
+    """One empty span, disabled vs enabled, against an empty function call"""
+    print(f"\n⏱️  Empty span ({iterations} iterations)")
+    print("-" * 70)
+
+    disabled = Tracer(enabled=False)
+    enabled = Tracer(enabled=True, capacity=4096)
+
+    def baseline():
+        pass
+
+    def disabled_span():
+        with disabled.span("stage"):
+            pass
+
+    def enabled_span():
+        with enabled.span("stage"):
+            pass
+
+    base, disabled_cost, enabled_cost = per_call_ns(
+        [baseline, disabled_span, enabled_span], iterations
+    )
+    for name, cost in (("Disabled span", disabled_cost), ("Enabled span", enabled_cost)):
+        print(f"  {name:34s} {cost - base:8.0f} ns per span")
+
+
+def benchmark_cycle_overhead(num_signals: int = 10, iterations: int = 5000):
+    """Decision stages with and without spans"""
+    print(f"\n🔄 Decision stages, {num_signals} signals ({iterations} cycles)")
+    print("-" * 70)
+
+    now = datetime.now()
+    signals = {
+        f"sensor_{i}": SignalRecord(f"sensor_{i}", random.uniform(-1.0, 1.0), now)
+        for i in range(num_signals)
+    }
+    brain = AttentionFusionEngine(temperature=1.0)
+    gate = SafetyGate()
+    gate.metrics = type(gate.metrics)()  # Keep the global collector untouched
+
+    def untraced():
+        decision = brain.decide(signals)
+        decision = gate.validate(decision, signals)
+        brain.explain_decision(decision, signals)
+
+    def traced(tracer: Tracer):
+        def cycle():
+            with tracer.span("cycle"):
+                with tracer.span("cognition"):
+                    decision = brain.decide(signals)
+                with tracer.span("safety"):
+                    decision = gate.validate(decision, signals)
+                with tracer.span("explanation"):
+                    brain.explain_decision(decision, signals)
+
+        return cycle
+
+    base, disabled_cost, enabled_cost = per_call_ns(
+        [untraced, traced(Tracer(enabled=False)), traced(Tracer(enabled=True))], iterations
+    )
+    print(f"  {'No spans':34s} {base / 1000:8.2f} µs per cycle")
+    for name, cost in (
+        ("4 spans, tracing disabled", disabled_cost),
+        ("4 spans, tracing enabled", enabled_cost),
+    ):
+        overhead = (cost - base) / base
+        print(f"  {name:34s} {cost / 1000:8.2f} µs per cycle   ({overhead:+.1%})")
+
+
+def run_tracing_benchmark():
+    """Run tracing overhead benchmarks"""
+    print("⚡ Decisify Tracing Overhead Benchmark")
+    print("=" * 70)
+
+    benchmark_span_cost()
+    for num_signals in (3, 50):
+        benchmark_cycle_overhead(num_signals)
+
+    print("\n" + "=" * 70)
+    print("✅ Tracing benchmark complete!")
+
+
+if __name__ == "__main__":
+    run_tracing_benchmark()
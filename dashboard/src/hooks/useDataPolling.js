@@ -1,6 +1,7 @@
 import { useState, useEffect, useCallback, useRef } from "react";
 import { createLogger } from "../utils/logger";
 import { generateLiveData } from "../utils/dataSimulator";
+import { applyDecision, applySignalDelta } from "../utils/streamEvents";
 
 const logger = createLogger('DataPolling');
 
@@ -8,7 +9,7 @@ const logger = createLogger('DataPolling');
  * useDataPolling - Agent Intelligence Data Polling Hook
  *
  * Core functionality:
- * 1. Poll backend API every 2 seconds for real-time data
+ * 1. Apply decisions pushed by the backend (/stream) directly, else poll every 2 seconds
  * 2. Detect new agent thoughts (by comparing IDs)
  * 3. Stream new thoughts one-by-one with delay (simulate real-time)
  * 4. Manage loading states and error handling
@@ -140,20 +141,73 @@ export const useDataPolling = (pollInterval = 2000) => {
     }
   }, [data, retryCount]);
 
+  // Latest fetchData for the push subscription (which must not reconnect on every render)
+  const fetchDataRef = useRef(fetchData);
+  fetchDataRef.current = fetchData;
+  const [isStreaming, setIsStreaming] = useState(false);
+  // Latest signal per source, kept current from the stream's `signals` deltas
+  const streamSignalsRef = useRef({});
+  const dataRef = useRef(data);
+  dataRef.current = data;
+
+  // Prefer server push: apply each pushed decision to state, no /status refetch
+  useEffect(() => {
+    if (typeof EventSource === "undefined") return undefined;
+
+    let opened = false;
+    const source = new EventSource("http://localhost:8000/stream");
+    source.addEventListener("signals", (event) => {
+      streamSignalsRef.current = applySignalDelta(
+        streamSignalsRef.current,
+        JSON.parse(event.data),
+      );
+    });
+    source.addEventListener("decision", (event) => {
+      const prevData = dataRef.current;
+      // Nothing to patch until the initial /status load lands
+      if (!prevData) return;
+      const nextData = applyDecision(
+        prevData,
+        JSON.parse(event.data),
+        streamSignalsRef.current,
+        event.lastEventId,
+      );
+      dataRef.current = nextData;
+      setData(nextData);
+      setNewThoughts((prev) => [nextData.agent_thoughts[0], ...prev]);
+      setError(null);
+      setIsLoading(false);
+    });
+    source.onopen = () => {
+      opened = true;
+      setIsStreaming(true);
+      logger.info("Subscribed to backend decision stream");
+    };
+    source.onerror = () => {
+      setIsStreaming(false);
+      // No backend at all (static / demo deployments): stop retrying and keep polling
+      if (!opened) source.close();
+    };
+
+    return () => source.close();
+  }, []);
+
   useEffect(() => {
     // Initial fetch
-    fetchData();
+    fetchDataRef.current();
 
-    // Set up polling interval
-    const interval = setInterval(fetchData, pollInterval);
+    // Poll only while the push stream is unavailable
+    const interval = isStreaming
+      ? null
+      : setInterval(() => fetchDataRef.current(), pollInterval);
 
     return () => {
-      clearInterval(interval);
+      if (interval) clearInterval(interval);
       // Clear all pending timeouts
       timeoutIdsRef.current.forEach(clearTimeout);
       timeoutIdsRef.current = [];
     };
-  }, [fetchData, pollInterval]);
+  }, [pollInterval, isStreaming]);
 
   // Clear new thoughts after they've been displayed
   const clearNewThoughts = useCallback(() => {
@@ -0,0 +1,123 @@
+/**
+ * streamEvents - Apply backend push events (/stream) to dashboard state
+ *
+ * The stream sends a `signals` delta ({updated, removed}) and then the
+ * `decision` (a DecisionChain) for every cycle; a new subscriber first gets
+ * the full signal set and the latest decision. These helpers patch the
+ * /status-shaped dashboard data with them, so a pushed decision never needs
+ * a /status refetch. Fields the backend derives only from its cycle counter
+ * (odds, PnL, indicators) keep their last polled values.
+ */
+
+const MAX_CONTEXT_EVENTS = 10;
+
+const sentimentOf = (value) =>
+  value > 0 ? "BULLISH" : value < 0 ? "BEARISH" : "NEUTRAL";
+
+/** Latest signals per source after applying a `signals` event. */
+export const applySignalDelta = (signals, delta) => {
+  const next = { ...signals, ...(delta.updated || {}) };
+  (delta.removed || []).forEach((source) => delete next[source]);
+  return next;
+};
+
+/**
+ * /status-shaped data after a `decision` event.
+ * `eventId` (the SSE message id) keeps thought and proposal ids increasing.
+ */
+export const applyDecision = (data, decision, signals, eventId) => {
+  const weights = decision.weights || {};
+  const weightValues = Object.values(weights);
+  const confidence = weightValues.length ? Math.max(...weightValues) : 0.5;
+  const reasoning = decision.explanation || decision.reasoning;
+  const now = new Date().toISOString();
+
+  const thought = {
+    id: `thought_${String(eventId).padStart(6, "0")}`,
+    timestamp: decision.timestamp,
+    type: "TRIANGULATION",
+    reasoning,
+    inputs: Object.fromEntries(
+      Object.entries(signals).map(([source, signal]) => [source, signal.value]),
+    ),
+    confidence,
+    human_feedback: null,
+  };
+
+  const proposalId = `proposal_stream_${eventId}`;
+  const savedDecision = localStorage.getItem(`proposal_${proposalId}_decision`);
+
+  const pastEvents = data.context_memory?.events || [];
+  const events = [
+    {
+      id: `event_${eventId}`,
+      type: "DECISION",
+      description: `${decision.action}: ${decision.override_reason || decision.reasoning}`,
+      timestamp: decision.timestamp,
+    },
+    ...pastEvents,
+  ]
+    .slice(0, MAX_CONTEXT_EVENTS)
+    .map((event, i) => ({ ...event, relevance_decay: 1.0 - i * 0.1 }));
+
+  const perception = data.perception || {};
+  const nautilus = perception.nautilus || {};
+
+  return {
+    ...data,
+    meta: { ...data.meta, timestamp: now, sync_timestamp: now, system_status: "LIVE" },
+    agent_thoughts: [thought],
+    triangulation_matrix: {
+      ...data.triangulation_matrix,
+      overall_alignment: weightValues.length
+        ? weightValues.reduce((sum, w) => sum + w, 0) / weightValues.length
+        : 0.5,
+      interpretation: `${decision.action}_SIGNAL`,
+    },
+    perception: {
+      ...perception,
+      x_intelligence: Object.entries(signals).map(([source, signal], i) => ({
+        id: `signal_${i}`,
+        handle: `@Source${i}`,
+        content: signal.raw_content || `Signal from ${source}`,
+        timestamp: signal.timestamp,
+        sentiment: sentimentOf(signal.value),
+        sentiment_score: Math.abs(signal.value),
+        agent_relevance_score: weights[source] || 0,
+        impact_score: Math.abs(signal.value) * 10,
+      })),
+      nautilus: {
+        ...nautilus,
+        position: decision.action,
+        signal_strength: confidence,
+        indicators: {
+          ...nautilus.indicators,
+          trend:
+            decision.action === "BUY"
+              ? "BULLISH"
+              : decision.action === "SELL"
+                ? "BEARISH"
+                : "NEUTRAL",
+        },
+      },
+    },
+    execution: {
+      ...data.execution,
+      current_proposal: {
+        id: proposalId,
+        action: decision.action,
+        asset: data.execution?.current_proposal?.asset || "BTC/USDT",
+        reasoning,
+        confidence,
+        risk_level: decision.is_safe ? "LOW" : "HIGH",
+        status: savedDecision
+          ? savedDecision === "approved"
+            ? "EXECUTING"
+            : "REJECTED"
+          : "ACTIVE",
+        human_decision: savedDecision,
+      },
+    },
+    context_memory: { ...data.context_memory, events },
+  };
+};
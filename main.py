@@ -6,18 +6,27 @@ Runs the decision loop and exposes REST API endpoints.
 import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 from src.brain import AttentionFusionEngine
+from src.broadcast import get_broadcaster
 from src.config import Settings, get_settings
+from src.journal import DecisionJournal, JournalReader
 from src.logger import get_logger, setup_logger
 from src.metrics import MetricsCollector, Timer, get_metrics
+from src.profiler import profile_loop
+from src.prometheus import CONTENT_TYPE, render_prometheus
+from src.response_cache import ResponseCache
 from src.safety import SafetyGate
-from src.schemas import Signal, SystemState
+from src.schemas import DecisionChain, Signal, SignalLike, SignalRecord, SystemState, as_signal
 from src.sensors import AsyncPerceptionHub
+from src.serialization import FastJSONResponse
+from src.tracing import Tracer, get_tracer
+from src.watchdog import get_watchdog
 
 # Initialize logger
 settings = get_settings()
@@ -40,13 +49,22 @@ class AgentOrchestrator:
         """
         self.settings = settings
         self.perception_hub = AsyncPerceptionHub()
-        self.brain = AttentionFusionEngine(temperature=settings.agent_temperature)
+        self.brain = AttentionFusionEngine(
+            temperature=settings.agent_temperature,
+            renormalize_every=settings.fusion_renormalize_every,
+            renormalize_interval=settings.fusion_renormalize_interval,
+        )
         self.safety_gate = SafetyGate(
             max_volatility_for_buy=settings.max_volatility_for_buy,
             max_volatility_for_sell=settings.max_volatility_for_sell,
             min_confidence_threshold=settings.min_confidence_threshold,
         )
         self.metrics = get_metrics()
+        self.journal = DecisionJournal(settings.journal_path) if settings.journal_path else None
+        self.broadcaster = get_broadcaster()
+        self.tracer = get_tracer()
+        # Hot-path copy of the current signals; system_state holds the API models
+        self.signals: Mapping[str, SignalLike] = {}
         self.running = False
         self.logger = get_logger(__name__)
 
@@ -54,69 +72,343 @@ class AgentOrchestrator:
         """Start the agent loop."""
         self.running = True
         self.logger.info("🚀 Agent Orchestrator started")
-        self.logger.info(f"⏱️  Cycle interval: {self.settings.cycle_interval}s")
 
         try:
-            while self.running:
-                await self._run_cycle()
-                await asyncio.sleep(self.settings.cycle_interval)
+            if self.settings.decision_mode == "event":
+                await self._run_event_loop()
+            else:
+                self.logger.info(f"⏱️  Cycle interval: {self.settings.cycle_interval}s")
+                while self.running:
+                    await self._run_cycle()
+                    await asyncio.sleep(self.settings.cycle_interval)
         finally:
             await self.perception_hub.close()
+            if self.journal is not None:
+                self.journal.close()
 
     async def stop(self):
         """Stop the agent loop."""
         self.running = False
         await self.perception_hub.close()
+        if self.journal is not None:
+            self.journal.close()
         self.logger.info("🛑 Agent Orchestrator stopped")
 
+    async def _run_event_loop(self):
+        """
+        Event-driven mode: every sensor streams into a queue and the
+        orchestrator re-decides as soon as new signals arrive.
+        """
+        self.logger.info(
+            f"⚡ Event-driven mode | debounce {self.settings.event_debounce_ms:.0f}ms, "
+            f"sensor interval {self.settings.sensor_poll_interval}s"
+        )
+        queue: asyncio.Queue[SignalRecord] = asyncio.Queue()
+        sensor_tasks = self.perception_hub.stream(queue, self.settings.sensor_poll_interval)
+
+        try:
+            while self.running:
+                updates = await self._collect_updates(queue)
+                self._run_event_cycle(updates)
+        finally:
+            for task in sensor_tasks:
+                task.cancel()
+            await asyncio.gather(*sensor_tasks, return_exceptions=True)
+
+    async def _collect_updates(
+        self, queue: "asyncio.Queue[SignalRecord]"
+    ) -> Dict[str, SignalRecord]:
+        """
+        Wait for the next signal, then coalesce everything arriving within the
+        debounce window into one update set (latest signal per source wins).
+        """
+        first = await queue.get()
+        updates = {first.source: first}
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.event_debounce_ms / 1000.0
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                signal = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            updates[signal.source] = signal
+
+        while not queue.empty():
+            signal = queue.get_nowait()
+            updates[signal.source] = signal
+
+        return updates
+
     async def _run_cycle(self):
         """
-        Execute one complete decision cycle:
+        Execute one complete polling cycle:
         1. Fetch signals from all sensors
-        2. Process through attention fusion
-        3. Validate with safety gate
-        4. Update shared state
+        2. Process the sources that changed (see _process_signals)
         """
-        with Timer() as cycle_timer:
-            cycle_start = datetime.now()
-
-            self.logger.info(f"{'=' * 60}")
-            self.logger.info(f"🔄 Cycle #{system_state.cycle_count + 1} | {cycle_start.strftime('%H:%M:%S')}")
-            self.logger.info(f"{'=' * 60}")
+        with Timer() as cycle_timer, self.tracer.span("cycle", mode="poll"):
+            self._log_cycle_header()
 
             # Step 1: Perception
             self.logger.info("📡 Fetching signals...")
-            signals = await self.perception_hub.fetch_all()
+            with self.tracer.span("perception"):
+                signals = await self.perception_hub.fetch_all()
 
-            for source, signal in signals.items():
-                content = signal.raw_content[:50] if signal.raw_content else 'N/A'
-                self.logger.info(f"  • {source}: {signal.value:.3f} | {content}")
+            previous = self.signals
+            changed = {src: sig for src, sig in signals.items() if previous.get(src) is not sig}
+            removed = [src for src in previous if src not in signals]
+            self._process_signals(signals, changed, removed)
+
+        # Record metrics
+        self.metrics.record_decision_latency(cycle_timer.elapsed_ms)
+        self.logger.info(f"⏱️  Cycle completed in {cycle_timer.elapsed_ms:.2f}ms")
 
-            # Step 2: Cognition
-            self.logger.info("🧠 Processing through attention fusion...")
-            decision = self.brain.decide(signals)
+    def _run_event_cycle(self, updates: Mapping[str, SignalLike]):
+        """Re-decide after an event-driven update, keeping unchanged sources."""
+        with Timer() as cycle_timer, self.tracer.span("cycle", mode="event"):
+            self._log_cycle_header()
+            signals = {**self.signals, **updates}
+            self._process_signals(signals, updates, ())
 
-            # Step 3: Safety validation
-            self.logger.info("🛡️  Validating with safety gate...")
+        self.metrics.record_decision_latency(cycle_timer.elapsed_ms)
+        self.logger.info(f"⏱️  Cycle completed in {cycle_timer.elapsed_ms:.2f}ms")
+
+    def _log_cycle_header(self):
+        """Log the banner that opens each decision cycle."""
+        self.logger.info(f"{'=' * 60}")
+        self.logger.info(
+            f"🔄 Cycle #{system_state.cycle_count + 1} | {datetime.now().strftime('%H:%M:%S')}"
+        )
+        self.logger.info(f"{'=' * 60}")
+
+    def _process_signals(
+        self,
+        signals: Mapping[str, SignalLike],
+        changed: Mapping[str, SignalLike],
+        removed: Sequence[str],
+    ):
+        """
+        Turn the current signals into a validated decision:
+        1. Process through attention fusion (only changed sources are rescored)
+        2. Validate with safety gate
+        3. Explain, update shared state, journal, render API responses and
+           push to stream clients
+        """
+        for source, signal in changed.items():
+            content = signal.raw_content[:50] if signal.raw_content else 'N/A'
+            self.logger.info(f"  • {source}: {signal.value:.3f} | {content}")
+
+        # Step 2: Cognition
+        self.logger.info("🧠 Processing through attention fusion...")
+        with self.tracer.span("cognition", changed=len(changed)):
+            decision = self.brain.decide_incremental(changed, removed)
+
+        # Step 3: Safety validation
+        self.logger.info("🛡️  Validating with safety gate...")
+        with self.tracer.span("safety"):
             validated_decision = self.safety_gate.validate(decision, signals)
 
-            # Step 4: Generate natural language explanation
+        # Step 4: Generate natural language explanation
+        with self.tracer.span("explanation"):
             explanation = self.brain.explain_decision(validated_decision, signals)
-            validated_decision.explanation = explanation
-            self.logger.info(f"💬 Explanation: {explanation[:100]}...")
+        validated_decision.explanation = explanation
+        self.logger.info(f"💬 Explanation: {explanation[:100]}...")
+
+        # Step 5: Update shared state
+        with self.tracer.span("publish"):
+            self._publish(validated_decision, signals, changed, removed)
+
+        # Log the decision
+        self.safety_gate.log_decision(validated_decision)
+
+    def _publish(
+        self,
+        validated_decision: DecisionChain,
+        signals: Mapping[str, SignalLike],
+        changed: Mapping[str, SignalLike],
+        removed: Sequence[str],
+    ):
+        """Update shared state, journal, render API responses and push to stream clients."""
+        system_state.latest_decision = validated_decision
+        system_state.recent_decisions.append(validated_decision)
+        self.signals = signals
+        # Only changed sources are converted to API models
+        latest = system_state.latest_signals
+        system_state.latest_signals = {
+            source: latest[source] if source in latest and source not in changed
+            else as_signal(signal)
+            for source, signal in signals.items()
+        }
+        system_state.cycle_count += 1
+        system_state.last_update = datetime.now()
+        if self.journal is not None:
+            self.journal.append(changed, validated_decision)
+        publish_responses(system_state)
+        self.broadcaster.publish_cycle(validated_decision, changed, removed)
 
-            # Step 5: Update shared state
-            system_state.latest_decision = validated_decision
-            system_state.latest_signals = signals
-            system_state.cycle_count += 1
-            system_state.last_update = datetime.now()
 
-            # Log the decision
-            self.safety_gate.log_decision(validated_decision)
+# Pre-encoded /status, /decision and /signals bodies for the latest cycle
+api_cache = ResponseCache()
+
+_journal_reader: Optional[JournalReader] = None
+
+
+def get_journal_reader() -> Optional[JournalReader]:
+    """Memory-mapped reader over the decision journal, if one is configured."""
+    global _journal_reader
+    path = get_settings().journal_path
+    if not path:
+        return None
+    try:
+        if _journal_reader is None or _journal_reader.path != path:
+            _journal_reader = JournalReader(path)
+        else:
+            _journal_reader.refresh()
+    except FileNotFoundError:
+        return None
+    return _journal_reader
+
+
+def recent_decisions(state: SystemState, limit: int) -> List[DecisionChain]:
+    """
+    The last `limit` decisions, newest first: from the journal when one is
+    configured, else from the in-memory history in `state`.
+    """
+    reader = get_journal_reader()
+    if reader is not None and len(reader):
+        return reader.recent(limit)[::-1]
+    return list(reversed(state.recent_decisions))[:limit]
+
+
+def render_status(state: SystemState, decision: DecisionChain) -> Dict[str, Any]:
+    """
+    Build the Dashboard-compatible /status payload for the current cycle.
+    Rendered once per cycle (see publish_responses); time fields reflect
+    when the cycle completed.
+    """
+    signals = state.latest_signals
+
+    # Generate agent thought from decision
+    thought = {
+        "id": f"thought_{state.cycle_count:03d}",
+        "timestamp": decision.timestamp,
+        "type": "TRIANGULATION",
+        "reasoning": decision.explanation or decision.reasoning,
+        "inputs": {src: sig.value for src, sig in signals.items()},
+        "confidence": max(decision.weights.values()) if decision.weights else 0.5,
+        "human_feedback": None
+    }
+
+    # Build response in Dashboard format
+    return {
+        "meta": {
+            "timestamp": datetime.now(),
+            "agent_status": "REASONING" if state.cycle_count % 2 == 0 else "ACTIVE",
+            "context_window_hours": 8,
+            "total_events_tracked": state.cycle_count * 3,
+            "system_status": "LIVE",
+            "sync_timestamp": state.last_update
+        },
+        "agent_thoughts": [thought],
+        "triangulation_matrix": {
+            "polymarket_x_correlation": 0.75 + (state.cycle_count % 10) * 0.02,
+            "polymarket_nautilus_correlation": 0.45 + (state.cycle_count % 8) * 0.03,
+            "x_nautilus_correlation": 0.60 + (state.cycle_count % 6) * 0.02,
+            "overall_alignment": sum(decision.weights.values()) / len(decision.weights) if decision.weights else 0.5,
+            "interpretation": f"{decision.action}_SIGNAL"
+        },
+        "perception": {
+            "polymarket": {
+                "event": "Market Decision Event",
+                "current_odds": 0.65 + (state.cycle_count % 20) * 0.01,
+                "delta_1h": signals.get("price_volatility", Signal(source="default", value=0.0)).value * 0.1,
+                "delta_24h": signals.get("price_volatility", Signal(source="default", value=0.0)).value * 0.3,
+                "volume_24h": 1250000 + state.cycle_count * 10000,
+                "liquidity": 3400000,
+                "last_trade": datetime.now(),
+                "history": [
+                    {"timestamp": datetime.now(), "odds": 0.65 + i * 0.01}
+                    for i in range(5)
+                ]
+            },
+            "x_intelligence": [
+                {
+                    "id": f"signal_{i}",
+                    "handle": f"@Source{i}",
+                    "content": sig.raw_content or f"Signal from {src}",
+                    "timestamp": sig.timestamp,
+                    "sentiment": "BULLISH" if sig.value > 0 else "BEARISH" if sig.value < 0 else "NEUTRAL",
+                    "sentiment_score": abs(sig.value),
+                    "agent_relevance_score": decision.weights.get(src, 0),
+                    "impact_score": abs(sig.value) * 10,
+                }
+                for i, (src, sig) in enumerate(signals.items())
+            ],
+            "nautilus": {
+                "strategy": "Keltner Channel Breakout",
+                "position": decision.action,
+                "signal_strength": max(decision.weights.values()) if decision.weights else 0.5,
+                "daily_pnl": (state.cycle_count % 100) - 50,
+                "status": "ACTIVE",
+                "indicators": {
+                    "keltner_upper": 45000 + state.cycle_count * 10,
+                    "keltner_middle": 43000,
+                    "atr": 850.5,
+                    "trend": "BULLISH" if decision.action == "BUY" else "BEARISH" if decision.action == "SELL" else "NEUTRAL"
+                }
+            }
+        },
+        "execution": {
+            "current_proposal": {
+                "id": f"proposal_{state.cycle_count}",
+                "action": decision.action,
+                "asset": "BTC/USDT",
+                "reasoning": decision.explanation or decision.reasoning,
+                "confidence": max(decision.weights.values()) if decision.weights else 0.5,
+                "risk_level": "LOW" if decision.is_safe else "HIGH",
+                "status": "ACTIVE",
+                "human_decision": None
+            }
+        },
+        "context_memory": {
+            "events": [
+                {
+                    "id": f"event_{i}",
+                    "type": "DECISION",
+                    "description": f"{past.action}: {past.override_reason or past.reasoning}",
+                    "timestamp": past.timestamp,
+                    "relevance_decay": 1.0 - (i * 0.1)
+                }
+                for i, past in enumerate(recent_decisions(state, 10) or [decision])
+            ]
+        }
+    }
 
-        # Record metrics
-        self.metrics.record_decision_latency(cycle_timer.elapsed_ms)
-        self.logger.info(f"⏱️  Cycle completed in {cycle_timer.elapsed_ms:.2f}ms")
+
+def render_signals(state: SystemState) -> Dict[str, Any]:
+    """Build the /signals payload for the current cycle."""
+    return {
+        source: {
+            "value": signal.value,
+            "timestamp": signal.timestamp,
+            "raw_content": signal.raw_content,
+        }
+        for source, signal in state.latest_signals.items()
+    }
+
+
+def publish_responses(state: SystemState) -> None:
+    """Render /status, /decision and /signals once for the cycle just completed."""
+    if state.latest_decision is None:
+        return
+    api_cache.publish(
+        state.cycle_count,
+        {
+            "status": render_status(state, state.latest_decision),
+            "decision": state.latest_decision,
+            "signals": render_signals(state),
+        },
+    )
 
 
 # Lifespan context manager for startup/shutdown
@@ -130,11 +422,15 @@ async def lifespan(app: FastAPI):
     orchestrator = AgentOrchestrator(settings)
 
     # Start the agent loop in the background
-    loop_task = asyncio.create_task(orchestrator.start())
+    loop_task = asyncio.create_task(orchestrator.start(), name="orchestrator")
+    if settings.watchdog_enabled:
+        get_watchdog().start()
 
     yield  # Application is running
 
-    # Shutdown: stop the agent loop
+    # Shutdown: end push streams and stop the agent loop
+    await get_watchdog().stop()
+    get_broadcaster().close_all()
     await orchestrator.stop()
     loop_task.cancel()
     try:
@@ -161,20 +457,24 @@ app.add_middleware(
 )
 
 
-@app.get("/")
+@app.get("/", response_class=FastJSONResponse)
 async def root():
     """Health check endpoint."""
-    return {"status": "running", "service": settings.app_name, "version": settings.app_version}
+    return FastJSONResponse(
+        {"status": "running", "service": settings.app_name, "version": settings.app_version}
+    )
 
 
 @app.get("/status")
-async def get_status():
+async def get_status(request: Request):
     """
     Get the latest decision and system state in Dashboard-compatible format.
     Returns the most recent DecisionChain and signal information.
+    Served from the per-cycle cache; send If-None-Match to get 304s.
     """
     with Timer() as timer:
-        if system_state.latest_decision is None:
+        rendered = api_cache.get("status")
+        if rendered is None:
             return JSONResponse(
                 status_code=503,
                 content={
@@ -182,156 +482,215 @@ async def get_status():
                     "message": "No decisions yet - agent loop is warming up",
                 },
             )
-
-        decision = system_state.latest_decision
-        signals = system_state.latest_signals
-
-        # Generate agent thought from decision
-        thought = {
-            "id": f"thought_{system_state.cycle_count:03d}",
-            "timestamp": decision.timestamp.isoformat(),
-            "type": "TRIANGULATION",
-            "reasoning": decision.explanation or decision.reasoning,
-            "inputs": {src: sig.value for src, sig in signals.items()},
-            "confidence": max(decision.weights.values()) if decision.weights else 0.5,
-            "human_feedback": None
-        }
-
-        # Build response in Dashboard format
-        response = {
-            "meta": {
-                "timestamp": datetime.now().isoformat(),
-                "agent_status": "REASONING" if system_state.cycle_count % 2 == 0 else "ACTIVE",
-                "context_window_hours": 8,
-                "total_events_tracked": system_state.cycle_count * 3,
-                "system_status": "LIVE",
-                "sync_timestamp": system_state.last_update.isoformat()
-            },
-            "agent_thoughts": [thought],
-            "triangulation_matrix": {
-                "polymarket_x_correlation": 0.75 + (system_state.cycle_count % 10) * 0.02,
-                "polymarket_nautilus_correlation": 0.45 + (system_state.cycle_count % 8) * 0.03,
-                "x_nautilus_correlation": 0.60 + (system_state.cycle_count % 6) * 0.02,
-                "overall_alignment": sum(decision.weights.values()) / len(decision.weights) if decision.weights else 0.5,
-                "interpretation": f"{decision.action}_SIGNAL"
-            },
-            "perception": {
-                "polymarket": {
-                    "event": "Market Decision Event",
-                    "current_odds": 0.65 + (system_state.cycle_count % 20) * 0.01,
-                    "delta_1h": signals.get("price_volatility", Signal(source="default", value=0.0)).value * 0.1,
-                    "delta_24h": signals.get("price_volatility", Signal(source="default", value=0.0)).value * 0.3,
-                    "volume_24h": 1250000 + system_state.cycle_count * 10000,
-                    "liquidity": 3400000,
-                    "last_trade": datetime.now().isoformat(),
-                    "history": [
-                        {"timestamp": (datetime.now()).isoformat(), "odds": 0.65 + i * 0.01}
-                        for i in range(5)
-                    ]
-                },
-                "x_intelligence": [
-                    {
-                        "id": f"signal_{i}",
-                        "handle": f"@Source{i}",
-                        "content": sig.raw_content or f"Signal from {src}",
-                        "timestamp": sig.timestamp.isoformat(),
-                        "sentiment": "BULLISH" if sig.value > 0 else "BEARISH" if sig.value < 0 else "NEUTRAL",
-                        "sentiment_score": abs(sig.value),
-                        "agent_relevance_score": decision.weights.get(src, 0),
-                        "impact_score": abs(sig.value) * 10,
-                    }
-                    for i, (src, sig) in enumerate(signals.items())
-                ],
-                "nautilus": {
-                    "strategy": "Keltner Channel Breakout",
-                    "position": decision.action,
-                    "signal_strength": max(decision.weights.values()) if decision.weights else 0.5,
-                    "daily_pnl": (system_state.cycle_count % 100) - 50,
-                    "status": "ACTIVE",
-                    "indicators": {
-                        "keltner_upper": 45000 + system_state.cycle_count * 10,
-                        "keltner_middle": 43000,
-                        "atr": 850.5,
-                        "trend": "BULLISH" if decision.action == "BUY" else "BEARISH" if decision.action == "SELL" else "NEUTRAL"
-                    }
-                }
-            },
-            "execution": {
-                "current_proposal": {
-                    "id": f"proposal_{system_state.cycle_count}",
-                    "action": decision.action,
-                    "asset": "BTC/USDT",
-                    "reasoning": decision.explanation or decision.reasoning,
-                    "confidence": max(decision.weights.values()) if decision.weights else 0.5,
-                    "risk_level": "LOW" if decision.is_safe else "HIGH",
-                    "status": "ACTIVE",
-                    "human_decision": None
-                }
-            },
-            "context_memory": {
-                "events": [
-                    {
-                        "id": f"event_{i}",
-                        "type": "DECISION",
-                        "description": f"Cycle {system_state.cycle_count - i}: {decision.action}",
-                        "timestamp": (datetime.now()).isoformat(),
-                        "relevance_decay": 1.0 - (i * 0.1)
-                    }
-                    for i in range(min(10, system_state.cycle_count))
-                ]
-            }
-        }
+        response = rendered.respond(request.headers.get("if-none-match"))
 
     get_metrics().record_api_request(timer.elapsed_ms)
     return response
 
 
 @app.get("/decision")
-async def get_latest_decision():
+async def get_latest_decision(request: Request):
     """
     Get only the latest decision (without full system state).
     Useful for lightweight polling.
     """
     with Timer() as timer:
-        if system_state.latest_decision is None:
+        rendered = api_cache.get("decision")
+        if rendered is None:
             return JSONResponse(status_code=503, content={"message": "No decisions available yet"})
-
-        response = system_state.latest_decision.model_dump()
+        response = rendered.respond(request.headers.get("if-none-match"))
 
     get_metrics().record_api_request(timer.elapsed_ms)
     return response
 
 
 @app.get("/signals")
-async def get_latest_signals():
+async def get_latest_signals(request: Request):
     """
     Get only the latest raw signals (without decision).
     Useful for monitoring sensor health.
     """
     with Timer() as timer:
-        if not system_state.latest_signals:
+        rendered = api_cache.get("signals")
+        if rendered is None or not system_state.latest_signals:
             return JSONResponse(status_code=503, content={"message": "No signals available yet"})
+        response = rendered.respond(request.headers.get("if-none-match"))
 
-        response = {
-            source: {
-                "value": signal.value,
-                "timestamp": signal.timestamp.isoformat(),
-                "raw_content": signal.raw_content,
-            }
-            for source, signal in system_state.latest_signals.items()
-        }
+    get_metrics().record_api_request(timer.elapsed_ms)
+    return response
+
+
+@app.get("/history", response_class=FastJSONResponse)
+async def get_history(
+    limit: int = Query(default=100, ge=1, le=10_000),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    Past decisions from the journal, newest first.
+    Optional `since` / `until` bound the time range (ISO 8601).
+    """
+    with Timer() as timer:
+        reader = get_journal_reader()
+        if reader is None:
+            return JSONResponse(status_code=404, content={"message": "Decision journal is disabled"})
+
+        decisions = reader.decisions(since=since, until=until, limit=limit)
+        response = FastJSONResponse(
+            {"total": len(reader), "decisions": decisions[::-1]}
+        )
 
     get_metrics().record_api_request(timer.elapsed_ms)
     return response
 
 
-@app.get("/metrics")
+@app.get("/stream")
+async def stream_decisions():
+    """
+    Server-Sent Events push of decisions and signal deltas.
+    Opens with a snapshot of the current state, then sends a "signals" and a
+    "decision" event per cycle. Clients that fall behind are disconnected
+    (after a final "dropped" event) and resync on reconnect.
+    """
+    hub = get_broadcaster()
+    try:
+        subscription = hub.subscribe(
+            hub.snapshot(system_state.latest_decision, system_state.latest_signals)
+        )
+    except OverflowError as e:
+        return JSONResponse(status_code=503, content={"message": str(e)})
+
+    heartbeat = get_settings().stream_heartbeat
+
+    async def events():
+        try:
+            while True:
+                try:
+                    message = await subscription.get(timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if message is None:
+                    break
+                yield message.sse
+            if subscription.dropped:
+                yield b"event: dropped\ndata: {}\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/ws")
+async def websocket_decisions(websocket: WebSocket):
+    """
+    WebSocket push of the same events as /stream, one JSON text frame each:
+    {"id": ..., "event": "signals" | "decision", "data": {...}}.
+    Slow clients are closed with code 1013 (try again later).
+    """
+    await websocket.accept()
+    hub = get_broadcaster()
+    try:
+        subscription = hub.subscribe(
+            hub.snapshot(system_state.latest_decision, system_state.latest_signals)
+        )
+    except OverflowError as e:
+        await websocket.close(code=1013, reason=str(e))
+        return
+
+    async def watch_disconnect():
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            subscription.close()
+
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        async for message in subscription:
+            await websocket.send_text(message.envelope())
+        if subscription.dropped:
+            await websocket.close(code=1013, reason="Client fell behind")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
+        watcher.cancel()
+
+
+@app.get("/metrics", response_class=FastJSONResponse)
 async def get_performance_metrics(metrics_collector: MetricsCollector = Depends(get_metrics)):
     """
     Get performance metrics for monitoring.
     Includes decision latency, sensor stats, safety stats, and API stats.
     """
-    return metrics_collector.get_all_stats()
+    return FastJSONResponse(metrics_collector.get_all_stats())
+
+
+@app.get("/trace", response_class=FastJSONResponse)
+async def get_trace(
+    limit: Optional[int] = Query(default=None, ge=1),
+    format: Literal["json", "chrome"] = "json",
+    tracer: Tracer = Depends(get_tracer),
+):
+    """
+    Recent spans from the cycle tracer (TRACING_ENABLED), oldest first.
+    `format=chrome` returns Chrome trace-event JSON for chrome://tracing or Perfetto.
+    """
+    spans = tracer.spans(limit)
+    if format == "chrome":
+        return FastJSONResponse(tracer.export_chrome(spans))
+    return FastJSONResponse(
+        {
+            "enabled": tracer.enabled,
+            "capacity": tracer.capacity,
+            "spans": [span.to_dict() for span in spans],
+        }
+    )
+
+
+@app.post("/admin/profile", response_class=PlainTextResponse)
+async def profile_event_loop(
+    seconds: float = Query(default=10.0, gt=0),
+    interval_ms: float = Query(default=5.0, ge=1, le=1000),
+):
+    """
+    Sample the event loop (orchestrator, sensor fetches, API handlers) for
+    `seconds` and return collapsed stacks for a flamegraph. Requires
+    PROFILER_ENABLED; one profile at a time, at most PROFILER_MAX_SECONDS long.
+    """
+    if not settings.profiler_enabled:
+        return JSONResponse(status_code=404, content={"message": "Profiler is disabled"})
+    seconds = min(seconds, settings.profiler_max_seconds)
+    try:
+        profiler = await profile_loop(seconds, interval_ms / 1000)
+    except RuntimeError as e:
+        return JSONResponse(status_code=409, content={"message": str(e)})
+
+    summary = profiler.summary()
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "X-Profile-Samples": str(summary["samples"]),
+            "X-Profile-Duration": f"{summary['duration_s']:.3f}",
+        },
+    )
+
+
+@app.get("/metrics/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics(metrics_collector: MetricsCollector = Depends(get_metrics)):
+    """
+    Metrics in the Prometheus text exposition format, for scraping.
+    Rendered from running counters; label values are bounded per source/host.
+    """
+    body = render_prometheus(metrics_collector, settings.metrics_max_label_values)
+    return PlainTextResponse(body, media_type=CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,343 @@
+use numpy::{
+    PyArray1, PyArray2, PyArrayMethods, PyReadonlyArray1, PyReadonlyArray2, PyReadwriteArray1,
+};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyFloat};
+use rayon::prelude::*;
 use std::collections::HashMap;
 
+/// Default rows per parallel work unit in `batch_decide_arrays`: large
+/// enough to amortize scheduling, small enough that a chunk's rows stay in
+/// cache while they are scored, normalized and summed.
+const DEFAULT_CHUNK_ROWS: usize = 256;
+
+/// Action codes (index into ACTION_NAMES in src/brain.py).
+const HOLD: u8 = 0;
+const BUY: u8 = 1;
+const SELL: u8 = 2;
+
+/// Override codes (index into OVERRIDE_REASONS in src/safety.py).
+const OVERRIDE_NONE: u8 = 0;
+const OVERRIDE_BUY_VOLATILITY: u8 = 1;
+const OVERRIDE_SELL_VOLATILITY: u8 = 2;
+const OVERRIDE_LOW_CONFIDENCE: u8 = 3;
+
+/// Weighted value → action, with the brain's ±0.3 thresholds.
+fn map_action(weighted_value: f64) -> u8 {
+    if weighted_value > 0.3 {
+        BUY
+    } else if weighted_value < -0.3 {
+        SELL
+    } else {
+        HOLD
+    }
+}
+
+/// The SafetyGate thresholds.
+#[derive(Clone, Copy)]
+struct SafetyLimits {
+    max_volatility_for_buy: f64,
+    max_volatility_for_sell: f64,
+    min_confidence_threshold: f64,
+}
+
+impl SafetyLimits {
+    /// Override code for one decision, checking rules in the same order as
+    /// `SafetyGate.validate`. `max_weight` is None for a decision without
+    /// weights (the confidence rule doesn't apply).
+    fn override_code(&self, action: u8, volatility: f64, max_weight: Option<f64>) -> u8 {
+        if action == BUY && volatility > self.max_volatility_for_buy {
+            return OVERRIDE_BUY_VOLATILITY;
+        }
+        if action == SELL && volatility > self.max_volatility_for_sell {
+            return OVERRIDE_SELL_VOLATILITY;
+        }
+        if let Some(max_weight) = max_weight {
+            if action != HOLD && max_weight < self.min_confidence_threshold {
+                return OVERRIDE_LOW_CONFIDENCE;
+            }
+        }
+        OVERRIDE_NONE
+    }
+}
+
+/// Stable softmax over a contiguous slice, computed in place.
+///
+/// Mirrors `src/softmax.py` operation for operation so the Python and Rust
+/// brains agree to the last few ulps:
+/// x_i = s_i / T, w_i = exp(x_i - max x) / Σ exp(x_j - max x)
+fn softmax_in_place(scores: &mut [f64], temperature: f64) {
+    if scores.is_empty() {
+        return;
+    }
+
+    let mut max_scaled = f64::NEG_INFINITY;
+    for s in scores.iter_mut() {
+        *s /= temperature;
+        if *s > max_scaled {
+            max_scaled = *s;
+        }
+    }
+
+    let mut total = 0.0;
+    for s in scores.iter_mut() {
+        *s = (*s - max_scaled).exp();
+        total += *s;
+    }
+
+    if total == 0.0 || !total.is_finite() {
+        // Fallback to uniform distribution
+        let uniform = 1.0 / scores.len() as f64;
+        scores.iter_mut().for_each(|s| *s = uniform);
+        return;
+    }
+
+    let inv_total = 1.0 / total;
+    scores.iter_mut().for_each(|s| *s *= inv_total);
+}
+
+/// Attention score for one signal: |value| × source boost × exp(-age/60).
+#[inline]
+fn attention_score(value: f64, boost: f64, age_seconds: f64) -> f64 {
+    value.abs() * boost * (-age_seconds / 60.0).exp()
+}
+
+/// Scores → softmax → weighted sum over contiguous columns.
+///
+/// `source_ids[i]` indexes `boosts` for signal i. Weights are written into
+/// `out` (same length as `values`); returns the weighted value.
+fn decide_columns(
+    temperature: f64,
+    values: &[f64],
+    ages: &[f64],
+    source_ids: &[i32],
+    boosts: &[f64],
+    out: &mut [f64],
+) -> Result<f64, String> {
+    let n = values.len();
+    if ages.len() != n || source_ids.len() != n || out.len() != n {
+        return Err(format!(
+            "values, ages, source_ids and out must have the same length \
+             (got {}, {}, {}, {})",
+            n,
+            ages.len(),
+            source_ids.len(),
+            out.len()
+        ));
+    }
+
+    for i in 0..n {
+        let boost = usize::try_from(source_ids[i])
+            .ok()
+            .and_then(|id| boosts.get(id))
+            .ok_or_else(|| format!("source id {} out of range", source_ids[i]))?;
+        out[i] = attention_score(values[i], *boost, ages[i]);
+    }
+
+    softmax_in_place(out, temperature);
+
+    Ok(out.iter().zip(values).map(|(w, v)| w * v).sum())
+}
+
+/// One batch row: masked scores → softmax → weighted value.
+///
+/// Cells with `mask[j] == false` get zero weight. A row with no present,
+/// non-zero signal is neutral: all-zero weights and a weighted value of 0.0
+/// (matching `AttentionFusionEngine.decide_arrays`).
+fn decide_row(
+    temperature: f64,
+    values: &[f64],
+    ages: &[f64],
+    mask: &[bool],
+    boosts: &[f64],
+    weights: &mut [f64],
+) -> f64 {
+    if !values
+        .iter()
+        .zip(mask)
+        .any(|(v, &present)| present && *v != 0.0)
+    {
+        weights.fill(0.0);
+        return 0.0;
+    }
+
+    for j in 0..values.len() {
+        weights[j] = if mask[j] {
+            attention_score(values[j], boosts[j], ages[j])
+        } else {
+            f64::NEG_INFINITY
+        };
+    }
+    softmax_in_place(weights, temperature);
+
+    weights
+        .iter()
+        .zip(values)
+        .zip(mask)
+        .filter(|(_, &present)| present)
+        .map(|((w, v), _)| w * v)
+        .sum()
+}
+
+/// Decide every row of an (n × k) batch in parallel, `chunk_rows` rows per
+/// rayon task. Inputs are row-major; `weights` is (n × k), `weighted` (n).
+#[allow(clippy::too_many_arguments)]
+fn decide_rows_parallel(
+    temperature: f64,
+    k: usize,
+    values: &[f64],
+    ages: &[f64],
+    mask: &[bool],
+    boosts: &[f64],
+    chunk_rows: usize,
+    weights: &mut [f64],
+    weighted: &mut [f64],
+) {
+    if k == 0 {
+        weighted.fill(0.0);
+        return;
+    }
+    let chunk_rows = chunk_rows.max(1);
+
+    weights
+        .par_chunks_mut(chunk_rows * k)
+        .zip(weighted.par_chunks_mut(chunk_rows))
+        .enumerate()
+        .for_each(|(chunk, (chunk_weights, chunk_weighted))| {
+            let first_row = chunk * chunk_rows;
+            for (r, out) in chunk_weighted.iter_mut().enumerate() {
+                let cells = (first_row + r) * k..(first_row + r + 1) * k;
+                *out = decide_row(
+                    temperature,
+                    &values[cells.clone()],
+                    &ages[cells.clone()],
+                    &mask[cells],
+                    boosts,
+                    &mut chunk_weights[r * k..(r + 1) * k],
+                );
+            }
+        });
+}
+
+/// Body of `NativeDecisionPipeline.decide` (see there for the contract).
+#[allow(clippy::too_many_arguments)]
+fn decide_and_validate(
+    temperature: f64,
+    limits: &SafetyLimits,
+    values: &[f64],
+    ages: &[f64],
+    source_ids: &[i32],
+    boosts: &[f64],
+    flags: &[bool],
+    out: &mut [f64],
+) -> Result<(f64, u8, u8, i64, f64), String> {
+    if flags.len() != boosts.len() {
+        return Err("volatility_flags and boosts must have one entry per source".to_string());
+    }
+    let mut weighted_value = decide_columns(temperature, values, ages, source_ids, boosts, out)?;
+
+    // First maximum wins ties, like max() over the weights dict
+    let mut dominant: Option<(usize, f64)> = None;
+    if values.iter().any(|v| *v != 0.0) {
+        for (row, &weight) in out.iter().enumerate() {
+            if dominant.map_or(true, |(_, best)| weight > best) {
+                dominant = Some((row, weight));
+            }
+        }
+    } else {
+        out.fill(0.0);
+        weighted_value = 0.0;
+    }
+
+    // Ids were range-checked against boosts, which flags matches
+    let volatility = source_ids
+        .iter()
+        .position(|&id| flags[id as usize])
+        .map_or(0.0, |row| values[row]);
+
+    let action = match dominant {
+        Some(_) => map_action(weighted_value),
+        None => HOLD,
+    };
+    let override_code = limits.override_code(action, volatility, dominant.map(|(_, w)| w));
+    let dominant_row = dominant.map_or(-1, |(row, _)| row as i64);
+
+    Ok((
+        weighted_value,
+        action,
+        override_code,
+        dominant_row,
+        volatility,
+    ))
+}
+
+/// Fully native per-decision path in one FFI call: scores → softmax →
+/// weighted value → BUY/SELL/HOLD → SafetyGate volatility and confidence
+/// rules. Strings (reasoning, override reasons) are left to the caller.
+#[pyclass]
+pub struct NativeDecisionPipeline {
+    temperature: f64,
+    limits: SafetyLimits,
+}
+
+#[pymethods]
+impl NativeDecisionPipeline {
+    #[new]
+    #[pyo3(signature = (
+        temperature,
+        max_volatility_for_buy = 0.05,
+        max_volatility_for_sell = 0.08,
+        min_confidence_threshold = 0.15
+    ))]
+    fn new(
+        temperature: f64,
+        max_volatility_for_buy: f64,
+        max_volatility_for_sell: f64,
+        min_confidence_threshold: f64,
+    ) -> Self {
+        NativeDecisionPipeline {
+            temperature,
+            limits: SafetyLimits {
+                max_volatility_for_buy,
+                max_volatility_for_sell,
+                min_confidence_threshold,
+            },
+        }
+    }
+
+    /// Decide and validate one signal set given as columns (see
+    /// `RustAttentionEngine.decide_into`). `volatility_flags` marks, per
+    /// source-table entry, the sources SafetyGate reads volatility from; the
+    /// first flagged row supplies it.
+    ///
+    /// Weights are written into `out_weights` (all zero for a neutral,
+    /// all-zero signal set). Returns (weighted_value, proposed_action,
+    /// override_code, dominant_row, volatility); dominant_row is -1 when
+    /// neutral. The final action is HOLD whenever override_code is non-zero.
+    fn decide(
+        &self,
+        values: PyReadonlyArray1<'_, f64>,
+        ages: PyReadonlyArray1<'_, f64>,
+        source_ids: PyReadonlyArray1<'_, i32>,
+        boosts: PyReadonlyArray1<'_, f64>,
+        volatility_flags: PyReadonlyArray1<'_, bool>,
+        mut out_weights: PyReadwriteArray1<'_, f64>,
+    ) -> PyResult<(f64, u8, u8, i64, f64)> {
+        decide_and_validate(
+            self.temperature,
+            &self.limits,
+            values.as_slice()?,
+            ages.as_slice()?,
+            source_ids.as_slice()?,
+            boosts.as_slice()?,
+            volatility_flags.as_slice()?,
+            out_weights.as_slice_mut()?,
+        )
+        .map_err(PyValueError::new_err)
+    }
+}
+
 /// High-performance attention fusion engine implemented in Rust.
 /// Optimizes the critical path: score calculation → softmax → weighted sum.
 #[pyclass]
@@ -25,16 +361,13 @@ impl RustAttentionEngine {
         signals
             .into_iter()
             .map(|(source, (value, age_seconds))| {
-                let mut base_score = value.abs();
-
                 // Boost volatility importance
-                if source.contains("volatility") {
-                    base_score *= 1.5;
-                }
-
-                // Recency decay: exp(-age/60)
-                let recency_factor = (-age_seconds / 60.0).exp();
-                let score = base_score * recency_factor;
+                let boost = if source.contains("volatility") {
+                    1.5
+                } else {
+                    1.0
+                };
+                let score = attention_score(value, boost, age_seconds);
 
                 (source, score)
             })
@@ -45,46 +378,12 @@ impl RustAttentionEngine {
     /// Formula: Weight_i = exp(Score_i / T) / Σ exp(Score_j / T)
     ///
     /// Optimizations:
-    /// - Numerical stability: subtract max score before exp
-    /// - Single-pass computation
-    /// - Vectorizable operations
+    /// - Numerical stability: subtract max scaled score before exp
+    /// - Computed in place over one contiguous buffer (see `softmax_in_place`)
     fn softmax(&self, scores: HashMap<String, f64>) -> PyResult<HashMap<String, f64>> {
-        if scores.is_empty() {
-            return Ok(HashMap::new());
-        }
-
-        // Find max score for numerical stability
-        let max_score = scores
-            .values()
-            .cloned()
-            .fold(f64::NEG_INFINITY, f64::max);
-
-        // Compute exp(score / T - max / T) for stability
-        let exp_scores: Vec<(String, f64)> = scores
-            .into_iter()
-            .map(|(k, v)| {
-                let scaled = (v - max_score) / self.temperature;
-                (k, scaled.exp())
-            })
-            .collect();
-
-        // Sum of all exp values
-        let total: f64 = exp_scores.iter().map(|(_, v)| v).sum();
-
-        if total == 0.0 {
-            // Fallback to uniform distribution
-            let uniform = 1.0 / exp_scores.len() as f64;
-            return Ok(exp_scores
-                .into_iter()
-                .map(|(k, _)| (k, uniform))
-                .collect());
-        }
-
-        // Normalize
-        Ok(exp_scores
-            .into_iter()
-            .map(|(k, v)| (k, v / total))
-            .collect())
+        let (keys, mut values): (Vec<String>, Vec<f64>) = scores.into_iter().unzip();
+        softmax_in_place(&mut values, self.temperature);
+        Ok(keys.into_iter().zip(values).collect())
     }
 
     /// Compute weighted signal value.
@@ -102,6 +401,32 @@ impl RustAttentionEngine {
             .sum()
     }
 
+    /// Zero-copy decision over NumPy buffers: no dicts cross the FFI boundary.
+    ///
+    /// `values` and `ages` are float64 arrays with one entry per signal;
+    /// `source_ids` (int32) index the caller's source table and `boosts`
+    /// holds one score multiplier per table entry (1.5 for volatility
+    /// sources). Weights are written into `out_weights`; returns the
+    /// weighted value.
+    fn decide_into(
+        &self,
+        values: PyReadonlyArray1<'_, f64>,
+        ages: PyReadonlyArray1<'_, f64>,
+        source_ids: PyReadonlyArray1<'_, i32>,
+        boosts: PyReadonlyArray1<'_, f64>,
+        mut out_weights: PyReadwriteArray1<'_, f64>,
+    ) -> PyResult<f64> {
+        decide_columns(
+            self.temperature,
+            values.as_slice()?,
+            ages.as_slice()?,
+            source_ids.as_slice()?,
+            boosts.as_slice()?,
+            out_weights.as_slice_mut()?,
+        )
+        .map_err(PyValueError::new_err)
+    }
+
     /// Full decision pipeline in Rust (hot path optimization).
     /// Returns: (weighted_value, weights_dict)
     fn decide_fast(
@@ -140,34 +465,99 @@ impl RustAttentionEngine {
 
 /// Batch processing for multiple decision cycles.
 /// Useful for backtesting or parallel processing.
+///
+/// Cycles are spread over the rayon thread pool with the GIL released;
+/// prefer `batch_decide_arrays`, which also skips dict conversion.
 #[pyfunction]
 fn batch_decide(
+    py: Python<'_>,
     temperature: f64,
     batch_signals: Vec<HashMap<String, (f64, f64, f64)>>,
 ) -> PyResult<Vec<(f64, HashMap<String, f64>)>> {
     let engine = RustAttentionEngine::new(temperature);
 
-    batch_signals
-        .into_iter()
-        .map(|signals| {
-            let score_input: HashMap<String, (f64, f64)> = signals
-                .iter()
-                .map(|(k, &(value, age, _))| (k.clone(), (value, age)))
-                .collect();
+    py.allow_threads(|| {
+        batch_signals
+            .par_iter()
+            .map(|signals| {
+                let score_input: HashMap<String, (f64, f64)> = signals
+                    .iter()
+                    .map(|(k, &(value, age, _))| (k.clone(), (value, age)))
+                    .collect();
 
-            let scores = engine.calculate_scores(score_input);
-            let weights = engine.softmax(scores)?;
+                let scores = engine.calculate_scores(score_input);
+                let weights = engine.softmax(scores)?;
 
-            let signal_values: HashMap<String, f64> = signals
-                .iter()
-                .map(|(k, &(value, _, _))| (k.clone(), value))
-                .collect();
+                let signal_values: HashMap<String, f64> = signals
+                    .iter()
+                    .map(|(k, &(value, _, _))| (k.clone(), value))
+                    .collect();
 
-            let weighted_value = engine.compute_weighted_value(weights.clone(), signal_values);
+                let weighted_value = engine.compute_weighted_value(weights.clone(), signal_values);
 
-            Ok((weighted_value, weights))
-        })
-        .collect()
+                Ok((weighted_value, weights))
+            })
+            .collect()
+    })
+}
+
+/// Columnar, multi-threaded batch decision.
+///
+/// `values`, `ages` (float64) and `mask` (bool) are C-contiguous (n × k)
+/// arrays, one row per decision cycle and one column per source; `boosts`
+/// holds one score multiplier per column. Rows are split into chunks of
+/// `chunk_size` and decided in parallel with the GIL released, so other
+/// Python threads (e.g. the API event loop) keep running.
+///
+/// Returns (weights (n × k), weighted_values (n)) as new NumPy arrays.
+#[pyfunction]
+#[pyo3(signature = (temperature, values, ages, mask, boosts, chunk_size = DEFAULT_CHUNK_ROWS))]
+fn batch_decide_arrays<'py>(
+    py: Python<'py>,
+    temperature: f64,
+    values: PyReadonlyArray2<'py, f64>,
+    ages: PyReadonlyArray2<'py, f64>,
+    mask: PyReadonlyArray2<'py, bool>,
+    boosts: PyReadonlyArray1<'py, f64>,
+    chunk_size: usize,
+) -> PyResult<(Bound<'py, PyArray2<f64>>, Bound<'py, PyArray1<f64>>)> {
+    let (n, k) = values.as_array().dim();
+    if ages.as_array().dim() != (n, k) || mask.as_array().dim() != (n, k) {
+        return Err(PyValueError::new_err(
+            "values, ages and mask must have the same shape",
+        ));
+    }
+
+    let values = values.as_slice()?;
+    let ages = ages.as_slice()?;
+    let mask = mask.as_slice()?;
+    let boosts = boosts.as_slice()?;
+    if boosts.len() != k {
+        return Err(PyValueError::new_err(format!(
+            "expected {} boosts (one per column), got {}",
+            k,
+            boosts.len()
+        )));
+    }
+
+    let mut weights = vec![0.0; n * k];
+    let mut weighted = vec![0.0; n];
+    py.allow_threads(|| {
+        decide_rows_parallel(
+            temperature,
+            k,
+            values,
+            ages,
+            mask,
+            boosts,
+            chunk_size,
+            &mut weights,
+            &mut weighted,
+        )
+    });
+
+    let weights = PyArray1::from_vec_bound(py, weights).reshape([n, k])?;
+    Ok((weights, PyArray1::from_vec_bound(py, weighted)))
 }
 
 /// Fast signal normalization and validation.
@@ -191,7 +581,9 @@ fn normalize_signals(signals: HashMap<String, f64>) -> HashMap<String, f64> {
 #[pymodule]
 fn decisify_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<RustAttentionEngine>()?;
+    m.add_class::<NativeDecisionPipeline>()?;
     m.add_function(wrap_pyfunction!(batch_decide, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_decide_arrays, m)?)?;
     m.add_function(wrap_pyfunction!(normalize_signals, m)?)?;
     Ok(())
 }
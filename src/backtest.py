@@ -0,0 +1,448 @@
+"""
+Backtest - Replay historical signal streams through the brain and SafetyGate.
+Signals are forward-filled onto a decision grid and evaluated in vectorized
+chunks, producing action and override series plus throughput stats.
+"""
+
+import argparse
+import csv
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.brain import ACTION_NAMES, AttentionFusionEngine
+from src.config import get_settings
+from src.frame import SignalFrame
+from src.journal import SIGNAL, JournalReader
+from src.logger import get_logger
+from src.safety import OVERRIDE_NONE, OVERRIDE_REASONS, SafetyGate
+
+logger = get_logger(__name__)
+
+try:
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class SignalSeries:
+    """
+    Long-format signal history: one row per observation, sorted by time.
+
+    `source_ids` index into `sources`; timestamps are epoch seconds.
+    """
+
+    sources: List[str]
+    timestamps: np.ndarray  # (M,) float64
+    source_ids: np.ndarray  # (M,) int32
+    values: np.ndarray  # (M,) float64
+
+    def __post_init__(self) -> None:
+        timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        order = np.argsort(timestamps, kind="stable")
+        self.timestamps = timestamps[order]
+        self.source_ids = np.asarray(self.source_ids, dtype=np.int32)[order]
+        self.values = np.asarray(self.values, dtype=np.float64)[order]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_columns(
+        cls, timestamps: Sequence[Any], sources: Sequence[str], values: Sequence[float]
+    ) -> "SignalSeries":
+        """Build from parallel timestamp / source / value columns."""
+        names, source_ids = np.unique(np.asarray(sources, dtype=str), return_inverse=True)
+        return cls(
+            sources=[str(name) for name in names],
+            timestamps=_to_epoch(timestamps),
+            source_ids=source_ids,
+            values=np.asarray(values, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_journal(cls, reader: JournalReader) -> "SignalSeries":
+        """The signals recorded in a decision journal."""
+        records = reader.records[reader.records["kind"] == SIGNAL]
+        keys, source_ids = np.unique(records["key"], return_inverse=True)
+        return cls(
+            sources=[reader.string(int(key)) or "" for key in keys],
+            timestamps=records["timestamp"],
+            source_ids=source_ids,
+            values=records["value"],
+        )
+
+    @classmethod
+    def from_frame(cls, frame: SignalFrame) -> "SignalSeries":
+        """The rows of a SignalFrame (timestamps converted to epoch seconds)."""
+        return cls(
+            sources=list(frame.sources),
+            timestamps=frame.timestamps / 1e9,
+            source_ids=frame.source_ids,
+            values=frame.values,
+        )
+
+    def save_npz(self, path: PathLike) -> None:
+        """Write the series as a columnar .npz file (see load_series)."""
+        np.savez(
+            path,
+            timestamp=self.timestamps,
+            source=np.asarray(self.sources)[self.source_ids],
+            value=self.values,
+        )
+
+
+def load_series(path: PathLike) -> SignalSeries:
+    """
+    Load a signal history file with `timestamp`, `source` and `value` columns.
+
+    Supported formats: .csv (timestamps as epoch seconds or ISO 8601), .npz
+    (columnar NumPy arrays) and .parquet (needs pyarrow).
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        with open(path, newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        return SignalSeries.from_columns(
+            [row["timestamp"] for row in rows],
+            [row["source"] for row in rows],
+            [float(row["value"]) for row in rows],
+        )
+
+    if suffix == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            return SignalSeries.from_columns(data["timestamp"], data["source"], data["value"])
+
+    if suffix == ".parquet":
+        if not PARQUET_AVAILABLE:
+            raise ImportError("Reading .parquet files needs pyarrow (pip install pyarrow)")
+        table = pq.read_table(path, columns=["timestamp", "source", "value"])
+        return SignalSeries.from_columns(
+            table.column("timestamp").to_numpy(),
+            table.column("source").to_numpy(zero_copy_only=False),
+            table.column("value").to_numpy(),
+        )
+
+    raise ValueError(f"Unsupported signal history format: '{path.suffix}'")
+
+
+@dataclass
+class BacktestResult:
+    """
+    Per-decision series from a backtest run.
+
+    `raw_actions` come straight from the brain, `actions` after the safety
+    gate; `overrides` are codes into safety.OVERRIDE_REASONS.
+    """
+
+    sources: List[str]
+    timestamps: np.ndarray  # (N,) float64 epoch seconds
+    weighted_values: np.ndarray  # (N,) float64
+    raw_actions: np.ndarray  # (N,) int8
+    actions: np.ndarray  # (N,) int8
+    overrides: np.ndarray  # (N,) int8
+    elapsed_seconds: float
+    weights: Optional[np.ndarray] = None  # (N, K) float64, only with keep_weights
+    parameters: Dict[str, float] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def decisions_per_second(self) -> float:
+        return len(self) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def override_rate(self) -> float:
+        return float(np.mean(self.overrides != OVERRIDE_NONE)) if len(self) else 0.0
+
+    def action_labels(self) -> List[str]:
+        """Decode final action codes into BUY/SELL/HOLD strings."""
+        return [ACTION_NAMES[code] for code in self.actions]
+
+    def summary(self) -> Dict[str, Any]:
+        """Action / override counts and throughput."""
+        action_counts = np.bincount(self.actions, minlength=len(ACTION_NAMES))
+        override_counts = np.bincount(self.overrides, minlength=len(OVERRIDE_REASONS))
+        return {
+            "decisions": len(self),
+            "parameters": self.parameters,
+            "actions": {name: int(n) for name, n in zip(ACTION_NAMES, action_counts)},
+            "overrides": {
+                name: int(n)
+                for name, n in zip(OVERRIDE_REASONS, override_counts)
+                if name != OVERRIDE_REASONS[OVERRIDE_NONE]
+            },
+            "override_rate": round(self.override_rate, 4),
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "decisions_per_second": round(self.decisions_per_second, 1),
+        }
+
+
+class Backtester:
+    """
+    Runs a SignalSeries through AttentionFusionEngine.decide_arrays and
+    SafetyGate.validate_batch.
+
+    Decisions happen at every signal arrival (as in event mode) or on a fixed
+    `step` grid (as in poll mode). At each decision time every source
+    contributes its latest observation, aged by how long ago it arrived;
+    observations older than `max_age` are treated as missing. Work proceeds
+    in chunks of `chunk_size` decisions so memory stays bounded at
+    chunk_size × K regardless of history length.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AttentionFusionEngine] = None,
+        safety_gate: Optional[SafetyGate] = None,
+        chunk_size: int = 65536,
+    ):
+        settings = get_settings()
+        self.engine = engine or AttentionFusionEngine(temperature=settings.agent_temperature)
+        self.safety_gate = safety_gate or SafetyGate(
+            max_volatility_for_buy=settings.max_volatility_for_buy,
+            max_volatility_for_sell=settings.max_volatility_for_sell,
+            min_confidence_threshold=settings.min_confidence_threshold,
+        )
+        self.chunk_size = chunk_size
+
+    def decision_times(self, series: SignalSeries, step: Optional[float] = None) -> np.ndarray:
+        """Signal arrival times, or a regular grid every `step` seconds."""
+        if len(series) == 0:
+            return np.empty(0)
+        if step is None:
+            return np.unique(series.timestamps)
+        return np.arange(series.timestamps[0], series.timestamps[-1] + step / 2, step)
+
+    def run(
+        self,
+        series: SignalSeries,
+        step: Optional[float] = None,
+        max_age: Optional[float] = None,
+        keep_weights: bool = False,
+    ) -> BacktestResult:
+        """
+        Backtest the whole series, forward-filling one chunk at a time.
+
+        Args:
+            series: Signal history
+            step: Decision interval in seconds (None = decide on every arrival)
+            max_age: Drop observations older than this many seconds
+            keep_weights: Also return the (N, K) attention weight matrix
+        """
+        start = time.perf_counter()
+        times = self.decision_times(series, step)
+        return self._run_chunked(
+            series.sources, times, self._per_source(series), max_age, keep_weights, start
+        )
+
+    def run_prepared(
+        self,
+        sources: Sequence[str],
+        times: np.ndarray,
+        per_source: Sequence[Tuple[np.ndarray, np.ndarray]],
+        max_age: Optional[float] = None,
+        keep_weights: bool = False,
+    ) -> BacktestResult:
+        """
+        `run` over decision times and per-source (timestamps, values) columns
+        the caller computed once, e.g. to reuse them across parameter sets.
+        The fill still happens one chunk at a time.
+        """
+        start = time.perf_counter()
+        return self._run_chunked(sources, times, per_source, max_age, keep_weights, start)
+
+    def _run_chunked(
+        self,
+        sources: Sequence[str],
+        times: np.ndarray,
+        per_source: Sequence[Tuple[np.ndarray, np.ndarray]],
+        max_age: Optional[float],
+        keep_weights: bool,
+        start: float,
+    ) -> BacktestResult:
+        chunks = (
+            (lo, hi, *self._forward_fill(times[lo:hi], per_source, max_age))
+            for lo, hi in self._chunk_bounds(len(times))
+        )
+        return self._evaluate(list(sources), times, chunks, keep_weights, start)
+
+    def _evaluate(
+        self,
+        sources: List[str],
+        times: np.ndarray,
+        chunks: Iterable[Tuple[int, int, np.ndarray, np.ndarray, np.ndarray]],
+        keep_weights: bool,
+        start: float,
+    ) -> BacktestResult:
+        """Run the brain and safety gate over (lo, hi, values, ages, mask) chunks."""
+        n, k = len(times), len(sources)
+        weighted_values = np.empty(n)
+        raw_actions = np.empty(n, dtype=np.int8)
+        actions = np.empty(n, dtype=np.int8)
+        overrides = np.empty(n, dtype=np.int8)
+        weights = np.empty((n, k)) if keep_weights else None
+        volatility_cols = [i for i, src in enumerate(sources) if "volatility" in src.lower()]
+
+        for lo, hi, values, ages, mask in chunks:
+            result = self.engine.decide_arrays(values, ages, sources, mask)
+            volatility = self._volatility(values, mask, volatility_cols)
+            final, codes = self.safety_gate.validate_batch(
+                result.actions, result.weights, volatility
+            )
+
+            weighted_values[lo:hi] = result.weighted_values
+            raw_actions[lo:hi] = result.actions
+            actions[lo:hi] = final
+            overrides[lo:hi] = codes
+            if weights is not None:
+                weights[lo:hi] = result.weights
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"Backtest: {n} decisions over {k} sources in {elapsed:.3f}s")
+
+        return BacktestResult(
+            sources=list(sources),
+            timestamps=times,
+            weighted_values=weighted_values,
+            raw_actions=raw_actions,
+            actions=actions,
+            overrides=overrides,
+            elapsed_seconds=elapsed,
+            weights=weights,
+            parameters={
+                "temperature": self.engine.temperature,
+                "max_volatility_for_buy": self.safety_gate.max_volatility_for_buy,
+                "max_volatility_for_sell": self.safety_gate.max_volatility_for_sell,
+                "min_confidence_threshold": self.safety_gate.min_confidence_threshold,
+            },
+        )
+
+    def _chunk_bounds(self, n: int) -> Iterator[Tuple[int, int]]:
+        for lo in range(0, n, self.chunk_size):
+            yield lo, min(lo + self.chunk_size, n)
+
+    @staticmethod
+    def _per_source(series: SignalSeries) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """(timestamps, values) of each source's observations."""
+        return [
+            (series.timestamps[series.source_ids == i], series.values[series.source_ids == i])
+            for i in range(len(series.sources))
+        ]
+
+    @staticmethod
+    def _forward_fill(
+        times: np.ndarray,
+        per_source: Sequence[Tuple[np.ndarray, np.ndarray]],
+        max_age: Optional[float],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(values, ages, mask) of each source's latest observation at each time."""
+        shape = (len(times), len(per_source))
+        values = np.zeros(shape)
+        ages = np.zeros(shape)
+        mask = np.zeros(shape, dtype=bool)
+
+        for col, (source_times, source_values) in enumerate(per_source):
+            idx = np.searchsorted(source_times, times, side="right") - 1
+            present = idx >= 0
+            idx = idx.clip(min=0)
+            if len(source_times):
+                values[:, col] = source_values[idx]
+                ages[:, col] = times - source_times[idx]
+            if max_age is not None:
+                present &= ages[:, col] <= max_age
+            mask[:, col] = present
+
+        return values, ages, mask
+
+    @staticmethod
+    def _volatility(values: np.ndarray, mask: np.ndarray, columns: Sequence[int]) -> np.ndarray:
+        """First present volatility source per row, 0.0 if none (as SafetyGate)."""
+        volatility = np.zeros(len(values))
+        filled = np.zeros(len(values), dtype=bool)
+        for col in columns:
+            take = mask[:, col] & ~filled
+            volatility[take] = values[take, col]
+            filled |= take
+        return volatility
+
+
+def _to_epoch(timestamps: Sequence[Any]) -> np.ndarray:
+    """Epoch seconds from numbers, ISO 8601 strings, datetimes or datetime64."""
+    array = np.asarray(timestamps)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype("datetime64[us]").astype(np.int64) / 1e6
+    if np.issubdtype(array.dtype, np.number):
+        return array.astype(np.float64)
+
+    epochs = np.empty(len(array))
+    for i, value in enumerate(array):
+        if isinstance(value, datetime):
+            epochs[i] = value.timestamp()
+            continue
+        try:
+            epochs[i] = float(value)
+        except ValueError:
+            epochs[i] = datetime.fromisoformat(str(value)).timestamp()
+    return epochs
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point: python -m src.backtest history.csv"""
+    parser = argparse.ArgumentParser(description="Backtest decisify on a signal history file")
+    parser.add_argument("path", help=".csv / .npz / .parquet history, or a decision journal")
+    parser.add_argument("--step", type=float, help="Decision interval in seconds")
+    parser.add_argument("--max-age", type=float, help="Ignore observations older than this")
+    parser.add_argument("--temperature", type=float)
+    parser.add_argument("--max-volatility-buy", type=float)
+    parser.add_argument("--max-volatility-sell", type=float)
+    parser.add_argument("--min-confidence", type=float)
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    if Path(args.path).suffix.lower() in {".csv", ".npz", ".parquet"}:
+        series = load_series(args.path)
+    else:
+        with JournalReader(args.path) as reader:
+            series = SignalSeries.from_journal(reader)
+
+    def override(value: Optional[float], default: float) -> float:
+        # An explicit 0 on the command line is a valid setting, not "unset"
+        return default if value is None else value
+
+    backtester = Backtester(
+        engine=AttentionFusionEngine(
+            temperature=override(args.temperature, settings.agent_temperature)
+        ),
+        safety_gate=SafetyGate(
+            max_volatility_for_buy=override(
+                args.max_volatility_buy, settings.max_volatility_for_buy
+            ),
+            max_volatility_for_sell=override(
+                args.max_volatility_sell, settings.max_volatility_for_sell
+            ),
+            min_confidence_threshold=override(
+                args.min_confidence, settings.min_confidence_threshold
+            ),
+        ),
+    )
+    result = backtester.run(series, step=args.step, max_age=args.max_age)
+
+    for key, value in result.summary().items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,216 @@ Implements softmax-based attention to weight different signal sources dynamicall
 """
 
 import math
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from src.logger import get_logger
-from src.schemas import DecisionChain, Signal
+from src.schemas import DecisionChain, SignalLike
+from src.softmax import DictSoftmax, softmax_into
 
 logger = get_logger(__name__)
 
+# Optional multi-threaded batch kernel (GIL released while it runs)
+try:
+    from decisify_core import batch_decide_arrays
+
+    RUST_BATCH_AVAILABLE = True
+except ImportError:
+    RUST_BATCH_AVAILABLE = False
+
+# Action codes used by the vectorized batch path (index into ACTION_NAMES)
+ACTION_NAMES = ("HOLD", "BUY", "SELL")
+HOLD, BUY, SELL = 0, 1, 2
+
+# Incremental fusion: rebase the exp shift before exp() can overflow, and
+# rescan when removing a term cancels away this much of the partition sum
+_MAX_EXP_HEADROOM = 50.0
+_CANCELLATION_LIMIT = 1e-8
+
+
+def _score(source: str, value: float, age_seconds: float) -> float:
+    """Attention score for one signal: |value| × volatility boost × recency decay."""
+    base_score = abs(value)
+
+    # Boost volatility importance
+    if "volatility" in source:
+        base_score *= 1.5
+
+    # Recency boost (decay over 60 seconds)
+    return base_score * math.exp(-age_seconds / 60.0)
+
+
+@dataclass
+class BatchDecisionResult:
+    """
+    Compact output of AttentionFusionEngine.decide_batch.
+
+    Rows are decision cycles, columns follow `sources`. Neutral rows (no signal
+    or all-zero values) carry zero weights, a weighted value of 0.0 and HOLD.
+    """
+
+    sources: List[str]
+    weights: np.ndarray  # (N, K) float64
+    weighted_values: np.ndarray  # (N,) float64
+    actions: np.ndarray  # (N,) int8 codes into ACTION_NAMES
+    neutral: np.ndarray  # (N,) bool
+    chains: Optional[List[DecisionChain]] = None
+
+    def __len__(self) -> int:
+        return len(self.weighted_values)
+
+    def action_labels(self) -> List[str]:
+        """Decode action codes into BUY/SELL/HOLD strings."""
+        return [ACTION_NAMES[code] for code in self.actions]
+
+
+class IncrementalFusionState:
+    """
+    Running softmax state for per-source update streams.
+
+    Keeps exp(score / T - shift) per source together with the partition sum
+    Z = Σ e_i and the weighted numerator Σ e_i · value_i, so replacing one
+    source's signal costs O(1) instead of rescoring all K sources.
+
+    Recency decay is evaluated when a source is updated. `renormalize()`
+    rescans every source with current ages and runs automatically every
+    `renormalize_every` updates, which also bounds floating-point drift in
+    the running sums. Sources that are not updated (e.g. served from the
+    sensor cache) keep aging through `renormalize_due()`, which asks for a
+    rescan once `renormalize_interval` seconds have passed.
+    """
+
+    def __init__(
+        self,
+        temperature: float = 1.0,
+        renormalize_every: int = 256,
+        renormalize_interval: float = 1.0,
+    ):
+        self.temperature = temperature
+        self.renormalize_every = renormalize_every
+        self.renormalize_interval = renormalize_interval
+        self.renormalized_at: Optional[datetime] = None
+        self.signals: Dict[str, SignalLike] = {}
+        self._exp_scores: Dict[str, float] = {}
+        self._partition = 0.0
+        self._numerator = 0.0
+        self._shift = 0.0
+        self._nonzero = 0
+        self._updates_since_renormalize = 0
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    @property
+    def is_neutral(self) -> bool:
+        """True when no source holds a non-zero signal."""
+        return self._nonzero == 0
+
+    @property
+    def weighted_value(self) -> float:
+        """Σ weight_i · value_i over all tracked sources."""
+        if self._partition == 0.0:
+            return 0.0
+        return self._numerator / self._partition
+
+    def weight(self, source: str) -> float:
+        """Current attention weight of a single source."""
+        if self._partition == 0.0:
+            return 0.0
+        return self._exp_scores.get(source, 0.0) / self._partition
+
+    def weights(self) -> Dict[str, float]:
+        """Attention weights for all tracked sources."""
+        if self._partition == 0.0:
+            return {}
+        inv_partition = 1.0 / self._partition
+        return {k: e * inv_partition for k, e in self._exp_scores.items()}
+
+    def update(self, source: str, signal: SignalLike, now: Optional[datetime] = None) -> None:
+        """Replace (or add) the signal for one source in O(1)."""
+        now = now or datetime.now()
+        if self.renormalized_at is None:
+            # Ages of a fresh state are current as of its first update
+            self.renormalized_at = now
+        scaled = _score(source, signal.value, (now - signal.timestamp).total_seconds())
+        scaled /= self.temperature
+
+        self._drop(source)
+        self.signals[source] = signal
+        if signal.value != 0.0:
+            self._nonzero += 1
+
+        self._updates_since_renormalize += 1
+        if (
+            scaled - self._shift > _MAX_EXP_HEADROOM
+            or self._updates_since_renormalize >= self.renormalize_every
+        ):
+            self.renormalize(now)
+            return
+
+        exp_score = math.exp(scaled - self._shift)
+        self._exp_scores[source] = exp_score
+        self._partition += exp_score
+        self._numerator += exp_score * signal.value
+
+        if self._partition == 0.0:
+            # Every term underflowed relative to the old shift
+            self.renormalize(now)
+
+    def remove(self, source: str) -> None:
+        """Stop tracking a source."""
+        if source in self.signals:
+            self._drop(source)
+            if self._exp_scores and self._partition == 0.0:
+                self.renormalize()
+
+    def renormalize_due(self, now: datetime) -> bool:
+        """Whether ages have drifted long enough to warrant a full rescan."""
+        if self.renormalize_interval <= 0 or self.renormalized_at is None:
+            return False
+        return (now - self.renormalized_at).total_seconds() >= self.renormalize_interval
+
+    def renormalize(self, now: Optional[datetime] = None) -> None:
+        """Rescore every source with current ages and rebuild the running sums."""
+        now = now or datetime.now()
+        self.renormalized_at = now
+        scaled = {
+            source: _score(source, signal.value, (now - signal.timestamp).total_seconds())
+            / self.temperature
+            for source, signal in self.signals.items()
+        }
+
+        self._shift = max(scaled.values(), default=0.0)
+        self._exp_scores = {k: math.exp(v - self._shift) for k, v in scaled.items()}
+        self._partition = math.fsum(self._exp_scores.values())
+        self._numerator = math.fsum(
+            e * self.signals[k].value for k, e in self._exp_scores.items()
+        )
+        self._updates_since_renormalize = 0
+
+    def _drop(self, source: str) -> None:
+        """Subtract a source's contribution from the running sums."""
+        signal = self.signals.pop(source, None)
+        if signal is None:
+            return
+        if signal.value != 0.0:
+            self._nonzero -= 1
+
+        exp_score = self._exp_scores.pop(source, 0.0)
+        before = self._partition
+        self._partition -= exp_score
+        self._numerator -= exp_score * signal.value
+
+        if self._partition < before * _CANCELLATION_LIMIT:
+            # The dropped term dominated Z; the remainder is mostly rounding error
+            self._partition = math.fsum(self._exp_scores.values())
+            self._numerator = math.fsum(
+                e * self.signals[k].value for k, e in self._exp_scores.items()
+            )
+
 
 class AttentionFusionEngine:
     """
@@ -19,15 +221,35 @@ class AttentionFusionEngine:
     Uses attention mechanism to dynamically weight different sources.
     """
 
-    def __init__(self, temperature: float = 1.0):
+    def __init__(
+        self,
+        temperature: float = 1.0,
+        renormalize_every: int = 256,
+        renormalize_interval: float = 1.0,
+        use_rust: bool = True,
+        batch_chunk_rows: int = 256,
+    ):
         """
         Args:
             temperature: Controls the sharpness of attention distribution.
                         Higher = more uniform, Lower = more focused.
+            renormalize_every: Updates between full rescans of the incremental
+                        fusion state (see decide_incremental).
+            renormalize_interval: Seconds between rescans that re-age sources
+                        whose signal hasn't changed (0 = only on updates).
+            use_rust: Run decide_arrays on the parallel Rust kernel when
+                        decisify_core is installed.
+            batch_chunk_rows: Rows per parallel work unit in the Rust kernel.
         """
         self.temperature = temperature
+        self.use_rust = use_rust and RUST_BATCH_AVAILABLE
+        self.batch_chunk_rows = batch_chunk_rows
+        self.fusion_state = IncrementalFusionState(
+            temperature, renormalize_every, renormalize_interval
+        )
+        self._dict_softmax = DictSoftmax()
 
-    def decide(self, signals: Dict[str, Signal]) -> DecisionChain:
+    def decide(self, signals: Mapping[str, SignalLike]) -> DecisionChain:
         """
         Main decision function: signals → attention weights → action.
 
@@ -64,57 +286,187 @@ class AttentionFusionEngine:
             explanation=None,
         )
 
-    def _calculate_scores(self, signals: Dict[str, Signal]) -> Dict[str, float]:
+    def decide_incremental(
+        self, updates: Mapping[str, SignalLike], removed: Sequence[str] = ()
+    ) -> DecisionChain:
         """
-        Calculate raw attention scores for each signal.
+        Decision over the running fusion state after applying only what changed.
 
-        Scoring logic:
-        - Sentiment signals (twitter, news): Use absolute value (strength matters)
-        - Volatility: Higher volatility = higher importance
-        - Recency: More recent signals get slight boost
+        Each updated source costs O(1) in the fusion math; building the
+        DecisionChain itself still walks the tracked sources once.
+
+        Args:
+            updates: Fresh signals keyed by source
+            removed: Sources that are no longer reported
         """
-        scores = {}
+        state = self.fusion_state
         now = datetime.now()
+        if state.temperature != self.temperature:
+            state.temperature = self.temperature
+            state.renormalize(now)
+        elif state.renormalize_due(now):
+            state.renormalize(now)
+
+        for source in removed:
+            state.remove(source)
+        for source, signal in updates.items():
+            state.update(source, signal, now)
+
+        if not state.signals or state.is_neutral:
+            logger.warning("All signals null or unavailable - returning neutral decision")
+            return self._neutral_decision()
 
-        for source, signal in signals.items():
-            base_score = abs(signal.value)
+        weights = state.weights()
+        weighted_value = state.weighted_value
+        action = self._map_to_action(weighted_value, state.signals)
+        reasoning = self._generate_reasoning(state.signals, weights, weighted_value)
 
-            # Boost volatility importance
-            if "volatility" in source:
-                base_score *= 1.5
+        logger.debug(f"Decision: {action}, Weighted value: {weighted_value:.3f}")
 
-            # Recency boost (decay over 60 seconds)
-            age_seconds = (now - signal.timestamp).total_seconds()
-            recency_factor = math.exp(-age_seconds / 60.0)
+        return DecisionChain(
+            timestamp=now,
+            weights=weights,
+            action=action,
+            reasoning=reasoning,
+            is_safe=True,  # Will be validated by SafetyGate
+            override_reason=None,
+            explanation=None,
+        )
 
-            scores[source] = base_score * recency_factor
+    def decide_batch(
+        self,
+        frames: Sequence[Mapping[str, SignalLike]],
+        now: Optional[datetime] = None,
+        build_chains: bool = False,
+    ) -> BatchDecisionResult:
+        """
+        Vectorized decision path for many signal sets at once (backtests, replay).
 
-        return scores
+        Packs the frames into (N cycles × K sources) arrays and runs scoring,
+        softmax and the weighted sum as whole-array NumPy operations.
+        DecisionChain objects are only built when `build_chains` is set.
 
-    def _softmax(self, scores: Dict[str, float]) -> Dict[str, float]:
+        Args:
+            frames: One signals dict per decision cycle
+            now: Reference time for signal ages (defaults to datetime.now())
+            build_chains: Also materialize a DecisionChain per cycle
         """
-        Apply softmax normalization to convert scores to probability distribution.
+        sources, values, ages, mask = pack_frames(frames, now or datetime.now())
+        result = self.decide_arrays(values, ages, sources, mask)
+
+        if build_chains:
+            result.chains = [
+                self._chain_from_row(result, row, signals) for row, signals in enumerate(frames)
+            ]
+
+        return result
+
+    def decide_arrays(
+        self,
+        values: np.ndarray,
+        ages: np.ndarray,
+        sources: Sequence[str],
+        mask: Optional[np.ndarray] = None,
+    ) -> BatchDecisionResult:
+        """
+        Array-level batch decision: values and ages are (N, K) float64 arrays.
 
-        Formula: Weight_i = exp(Score_i / T) / Σ exp(Score_j / T)
+        `mask` marks which (cycle, source) cells hold a signal; missing cells
+        get zero weight. Defaults to every cell being present.
+
+        With decisify_core installed (and use_rust), steps 1-3 run on the
+        Rust kernel across all cores with the GIL released, so a batch can
+        run in a worker thread without stalling the event loop.
         """
-        if not scores:
-            return {}
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        ages = np.ascontiguousarray(ages, dtype=np.float64)
+        if mask is None:
+            mask = np.ones(values.shape, dtype=bool)
+        mask = np.ascontiguousarray(mask, dtype=bool)
+
+        # Step 1: Scores = |value| × volatility boost × recency decay
+        boost = np.array([1.5 if "volatility" in src else 1.0 for src in sources])
+        neutral = ~np.any(mask & (values != 0.0), axis=1)
+
+        if self.use_rust:
+            weights, weighted_values = batch_decide_arrays(
+                self.temperature, values, ages, mask, boost, self.batch_chunk_rows
+            )
+        else:
+            scores = np.abs(values) * boost * np.exp(-ages / 60.0)
+
+            # Step 2: Temperature-scaled softmax over present sources only
+            weights = np.where(mask, scores, -np.inf)
+            weights[neutral] = 0.0
+            softmax_into(weights, self.temperature, out=weights)
+            weights[neutral] = 0.0
+
+            # Step 3: Weighted signal
+            weighted_values = np.einsum("ij,ij->i", weights, np.where(mask, values, 0.0))
+
+        # Step 4: Map to action codes
+        actions = np.full(len(weighted_values), HOLD, dtype=np.int8)
+        actions[weighted_values > 0.3] = BUY
+        actions[weighted_values < -0.3] = SELL
 
-        # Apply temperature scaling
-        scaled_scores = {k: v / self.temperature for k, v in scores.items()}
+        return BatchDecisionResult(
+            sources=list(sources),
+            weights=weights,
+            weighted_values=weighted_values,
+            actions=actions,
+            neutral=neutral,
+        )
 
-        # Compute exp values
-        exp_scores = {k: math.exp(v) for k, v in scaled_scores.items()}
+    def _chain_from_row(
+        self, result: BatchDecisionResult, row: int, signals: Mapping[str, SignalLike]
+    ) -> DecisionChain:
+        """Build the DecisionChain for one row of a batch result."""
+        if result.neutral[row]:
+            return self._neutral_decision()
 
-        # Normalize
-        total = sum(exp_scores.values())
-        if total == 0:
-            # Fallback to uniform distribution
-            return {k: 1.0 / len(scores) for k in scores}
+        weights = {
+            src: float(result.weights[row, col])
+            for col, src in enumerate(result.sources)
+            if src in signals
+        }
+        weighted_value = float(result.weighted_values[row])
 
-        return {k: v / total for k, v in exp_scores.items()}
+        return DecisionChain(
+            timestamp=datetime.now(),
+            weights=weights,
+            action=ACTION_NAMES[result.actions[row]],
+            reasoning=self._generate_reasoning(signals, weights, weighted_value),
+            is_safe=True,
+            override_reason=None,
+            explanation=None,
+        )
 
-    def _map_to_action(self, weighted_value: float, signals: Dict[str, Signal]) -> str:
+    def _calculate_scores(self, signals: Mapping[str, SignalLike]) -> Dict[str, float]:
+        """
+        Calculate raw attention scores for each signal.
+
+        Scoring logic:
+        - Sentiment signals (twitter, news): Use absolute value (strength matters)
+        - Volatility: Higher volatility = higher importance
+        - Recency: More recent signals get slight boost
+        """
+        now = datetime.now()
+        return {
+            source: _score(source, signal.value, (now - signal.timestamp).total_seconds())
+            for source, signal in signals.items()
+        }
+
+    def _softmax(self, scores: Dict[str, float]) -> Dict[str, float]:
+        """
+        Apply softmax normalization to convert scores to probability distribution.
+
+        Formula: Weight_i = exp(Score_i / T) / Σ exp(Score_j / T)
+        Computed with max subtraction (see src.softmax) so large scores stay finite.
+        The returned dict is reused by the next call.
+        """
+        return self._dict_softmax(scores, self.temperature)
+
+    def _map_to_action(self, weighted_value: float, signals: Mapping[str, SignalLike]) -> str:
         """
         Map the weighted signal value to a discrete action.
 
@@ -131,7 +483,7 @@ class AttentionFusionEngine:
             return "HOLD"
 
     def _generate_reasoning(
-        self, signals: Dict[str, Signal], weights: Dict[str, float], weighted_value: float
+        self, signals: Mapping[str, SignalLike], weights: Dict[str, float], weighted_value: float
     ) -> str:
         """
         Generate human-readable explanation of the decision.
@@ -153,7 +505,7 @@ class AttentionFusionEngine:
 
         return " | ".join(reasoning_parts)
 
-    def explain_decision(self, decision: DecisionChain, signals: Dict[str, Signal]) -> str:
+    def explain_decision(self, decision: DecisionChain, signals: Mapping[str, SignalLike]) -> str:
         """
         Generate natural language explanation of the decision for better interpretability.
 
@@ -238,3 +590,35 @@ class AttentionFusionEngine:
             override_reason=None,
             explanation=None,
         )
+
+
+def pack_frames(
+    frames: Sequence[Mapping[str, SignalLike]], now: datetime
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack signal dicts into contiguous (N × K) value, age and presence arrays.
+
+    Columns follow the order in which sources first appear across the frames.
+
+    Returns:
+        (sources, values, ages, mask)
+    """
+    columns: Dict[str, int] = {}
+    for signals in frames:
+        for source in signals:
+            if source not in columns:
+                columns[source] = len(columns)
+
+    shape = (len(frames), len(columns))
+    values = np.zeros(shape, dtype=np.float64)
+    ages = np.zeros(shape, dtype=np.float64)
+    mask = np.zeros(shape, dtype=bool)
+
+    for row, signals in enumerate(frames):
+        for source, signal in signals.items():
+            col = columns[source]
+            values[row, col] = signal.value
+            ages[row, col] = (now - signal.timestamp).total_seconds()
+            mask[row, col] = True
+
+    return list(columns), values, ages, mask
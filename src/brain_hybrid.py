@@ -5,13 +5,20 @@ Uses Rust for performance-critical computations, Python for flexibility.
 
 import math
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from src.schemas import DecisionChain, Signal
+import numpy as np
+
+from src.brain import ACTION_NAMES, BUY, HOLD, SELL
+from src.safety import OVERRIDE_NONE, SafetyGate
+from src.schemas import DecisionChain, SignalLike
+from src.softmax import DictSoftmax, softmax_into
+
+NEUTRAL_REASONING = "All signals null or unavailable - defaulting to neutral state"
 
 # Try to import Rust extension, fallback to pure Python
 try:
-    from decisify_core import RustAttentionEngine
+    from decisify_core import NativeDecisionPipeline, RustAttentionEngine
 
     RUST_AVAILABLE = True
 except ImportError:
@@ -38,13 +45,23 @@ class HybridAttentionEngine:
         self.temperature = temperature
         self.use_rust = use_rust and RUST_AVAILABLE
 
+        # Source table for the buffer interface: ids are stable per engine
+        self._source_ids: Dict[str, int] = {}
+        self._boost_list: List[float] = []
+        self._boosts = np.empty(0, dtype=np.float64)
+        self._volatility_flag_list: List[bool] = []
+        self._volatility_flags = np.empty(0, dtype=np.bool_)
+        self._pipeline = None
+        self._pipeline_limits: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._dict_softmax = DictSoftmax()
+
         if self.use_rust:
             self.rust_engine = RustAttentionEngine(temperature)
             print("🚀 Rust acceleration enabled")
         else:
             print("🐍 Using pure Python implementation")
 
-    def decide(self, signals: Dict[str, Signal]) -> DecisionChain:
+    def decide(self, signals: Mapping[str, SignalLike]) -> DecisionChain:
         """
         Main decision function with Rust acceleration.
         """
@@ -56,27 +73,15 @@ class HybridAttentionEngine:
         else:
             return self._decide_python(signals)
 
-    def _decide_rust(self, signals: Dict[str, Signal]) -> DecisionChain:
+    def _decide_rust(self, signals: Mapping[str, SignalLike]) -> DecisionChain:
         """
         Rust-accelerated decision path (hot path).
         """
-        now = datetime.now()
-
-        # Prepare data for Rust: (value, age_seconds, timestamp)
-        rust_signals = {
-            source: (
-                signal.value,
-                (now - signal.timestamp).total_seconds(),
-                signal.timestamp.timestamp(),
-            )
-            for source, signal in signals.items()
-        }
+        values, ages, source_ids = self._columns(signals)
+        out = np.empty(len(values), dtype=np.float64)
 
-        # Call Rust for heavy computation
-        weighted_value, weights_dict = self.rust_engine.decide_fast(rust_signals)
-
-        # Convert weights dict to Python dict
-        weights = dict(weights_dict)
+        weighted_value = self.rust_engine.decide_into(values, ages, source_ids, self._boosts, out)
+        weights = dict(zip(signals, out.tolist()))
 
         # Map to action (still in Python for flexibility)
         action = self._map_to_action(weighted_value, signals)
@@ -94,7 +99,92 @@ class HybridAttentionEngine:
             explanation=None,
         )
 
-    def _decide_python(self, signals: Dict[str, Signal]) -> DecisionChain:
+    def _source_id(self, source: str) -> int:
+        """Stable id of a source in the engine's table, registering it if new."""
+        source_id = self._source_ids.get(source)
+        if source_id is None:
+            source_id = self._source_ids[source] = len(self._boost_list)
+            self._boost_list.append(1.5 if "volatility" in source else 1.0)
+            self._boosts = np.array(self._boost_list, dtype=np.float64)
+            # SafetyGate reads volatility from sources named like this
+            self._volatility_flag_list.append("volatility" in source.lower())
+            self._volatility_flags = np.array(self._volatility_flag_list, dtype=np.bool_)
+        return source_id
+
+    def _columns(
+        self, signals: Mapping[str, SignalLike]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(values, ages, source_ids) columns for the zero-copy entry points."""
+        now = datetime.now()
+        count = len(signals)
+
+        # No dicts cross the FFI boundary
+        values = np.fromiter((s.value for s in signals.values()), np.float64, count)
+        ages = np.fromiter(
+            ((now - s.timestamp).total_seconds() for s in signals.values()), np.float64, count
+        )
+        source_ids = np.fromiter(map(self._source_id, signals), np.int32, count)
+        return values, ages, source_ids
+
+    def decide_compact(
+        self, signals: Mapping[str, SignalLike], safety_gate: SafetyGate
+    ) -> "CompactDecision":
+        """
+        decide() followed by safety_gate.validate(), as one call.
+
+        With Rust enabled the whole path (scores, softmax, action thresholds,
+        volatility and confidence rules) is a single NativeDecisionPipeline
+        call. The result carries codes and the weight array; reasoning and
+        override strings are only formatted when read.
+        """
+        values, ages, source_ids = self._columns(signals)
+        out = np.empty(len(values), dtype=np.float64)
+
+        if self.use_rust:
+            weighted_value, action, override, dominant_row, volatility = self._native_pipeline(
+                safety_gate
+            ).decide(values, ages, source_ids, self._boosts, self._volatility_flags, out)
+        else:
+            weighted_value, action, override, dominant_row, volatility = _decide_and_validate(
+                self.temperature,
+                safety_gate,
+                values,
+                ages,
+                source_ids,
+                self._boosts,
+                self._volatility_flags,
+                out,
+            )
+
+        if override == OVERRIDE_NONE:
+            safety_gate.metrics.record_safety_pass()
+        else:
+            safety_gate.metrics.record_safety_override()
+
+        return CompactDecision(
+            signals=signals,
+            weights=out,
+            weighted_value=weighted_value,
+            proposed_action=action,
+            override_code=override,
+            dominant_row=dominant_row,
+            volatility=volatility,
+            safety_gate=safety_gate,
+        )
+
+    def _native_pipeline(self, safety_gate: SafetyGate):
+        """NativeDecisionPipeline for the gate's thresholds, rebuilt when they change."""
+        limits = (
+            safety_gate.max_volatility_for_buy,
+            safety_gate.max_volatility_for_sell,
+            safety_gate.min_confidence_threshold,
+        )
+        if self._pipeline is None or limits != self._pipeline_limits:
+            self._pipeline = NativeDecisionPipeline(self.temperature, *limits)
+            self._pipeline_limits = limits
+        return self._pipeline
+
+    def _decide_python(self, signals: Mapping[str, SignalLike]) -> DecisionChain:
         """
         Pure Python fallback implementation.
         """
@@ -123,7 +213,7 @@ class HybridAttentionEngine:
             explanation=None,
         )
 
-    def _calculate_scores_python(self, signals: Dict[str, Signal]) -> Dict[str, float]:
+    def _calculate_scores_python(self, signals: Mapping[str, SignalLike]) -> Dict[str, float]:
         """Pure Python score calculation."""
         scores = {}
         now = datetime.now()
@@ -142,20 +232,13 @@ class HybridAttentionEngine:
         return scores
 
     def _softmax_python(self, scores: Dict[str, float]) -> Dict[str, float]:
-        """Pure Python softmax."""
-        if not scores:
-            return {}
-
-        scaled_scores = {k: v / self.temperature for k, v in scores.items()}
-        exp_scores = {k: math.exp(v) for k, v in scaled_scores.items()}
-
-        total = sum(exp_scores.values())
-        if total == 0:
-            return {k: 1.0 / len(scores) for k in scores}
-
-        return {k: v / total for k, v in exp_scores.items()}
+        """
+        Pure Python softmax (stable, shared with the Rust path's formula).
+        The returned dict is reused by the next call.
+        """
+        return self._dict_softmax(scores, self.temperature)
 
-    def _map_to_action(self, weighted_value: float, signals: Dict[str, Signal]) -> str:
+    def _map_to_action(self, weighted_value: float, signals: Mapping[str, SignalLike]) -> str:
         """Map weighted value to action."""
         if weighted_value > 0.3:
             return "BUY"
@@ -165,23 +248,13 @@ class HybridAttentionEngine:
             return "HOLD"
 
     def _generate_reasoning(
-        self, signals: Dict[str, Signal], weights: Dict[str, float], weighted_value: float
+        self, signals: Mapping[str, SignalLike], weights: Dict[str, float], weighted_value: float
     ) -> str:
         """Generate human-readable reasoning."""
         dominant_source = max(weights.items(), key=lambda x: x[1])[0]
-        dominant_weight = weights[dominant_source]
-        dominant_signal = signals[dominant_source]
-
-        reasoning_parts = [
-            f"Weighted signal: {weighted_value:.3f}",
-            f"Dominant source: {dominant_source} ({dominant_weight:.1%} weight)",
-            f"Signal value: {dominant_signal.value:.3f}",
-        ]
-
-        if dominant_signal.raw_content:
-            reasoning_parts.append(f"Context: {dominant_signal.raw_content[:100]}")
-
-        return " | ".join(reasoning_parts)
+        return format_reasoning(
+            dominant_source, weights[dominant_source], signals[dominant_source], weighted_value
+        )
 
     def _neutral_decision(self) -> DecisionChain:
         """Fallback for null signals."""
@@ -189,12 +262,184 @@ class HybridAttentionEngine:
             timestamp=datetime.now(),
             weights={},
             action="HOLD",
-            reasoning="All signals null or unavailable - defaulting to neutral state",
+            reasoning=NEUTRAL_REASONING,
             is_safe=True,
             override_reason=None,
             explanation=None,
         )
 
 
+def decide_columns(
+    temperature: float,
+    values: np.ndarray,
+    ages: np.ndarray,
+    source_ids: np.ndarray,
+    boosts: np.ndarray,
+    out: np.ndarray,
+) -> float:
+    """
+    NumPy reference for RustAttentionEngine.decide_into.
+
+    Same contract: weights for each (value, age, source id) row are written
+    into `out` and the weighted value is returned.
+    """
+    np.multiply(np.abs(values), boosts[source_ids], out=out)
+    np.multiply(out, np.exp(-ages / 60.0), out=out)
+    softmax_into(out, temperature, out=out)
+    return float(out @ values)
+
+
+def _decide_and_validate(
+    temperature: float,
+    safety_gate: SafetyGate,
+    values: np.ndarray,
+    ages: np.ndarray,
+    source_ids: np.ndarray,
+    boosts: np.ndarray,
+    volatility_flags: np.ndarray,
+    out: np.ndarray,
+) -> Tuple[float, int, int, int, float]:
+    """NumPy reference for NativeDecisionPipeline.decide (same return tuple)."""
+    if values.any():
+        weighted_value = decide_columns(temperature, values, ages, source_ids, boosts, out)
+        dominant_row = int(np.argmax(out))  # First maximum, like max() over the dict
+        action = _action_code(weighted_value)
+        max_weight: Optional[float] = float(out[dominant_row])
+    else:
+        out.fill(0.0)
+        weighted_value, dominant_row, action, max_weight = 0.0, -1, HOLD, None
+
+    volatility_rows = np.flatnonzero(volatility_flags[source_ids])
+    volatility = float(values[volatility_rows[0]]) if len(volatility_rows) else 0.0
+
+    override = safety_gate.override_code(action, volatility, max_weight)
+    return weighted_value, action, override, dominant_row, volatility
+
+
+def _action_code(weighted_value: float) -> int:
+    """Action code for a weighted value (same thresholds as _map_to_action)."""
+    if weighted_value > 0.3:
+        return BUY
+    if weighted_value < -0.3:
+        return SELL
+    return HOLD
+
+
+def format_reasoning(
+    dominant_source: str, dominant_weight: float, dominant_signal: SignalLike, weighted_value: float
+) -> str:
+    """Reasoning text for a decision, shared by DecisionChain and CompactDecision."""
+    reasoning_parts = [
+        f"Weighted signal: {weighted_value:.3f}",
+        f"Dominant source: {dominant_source} ({dominant_weight:.1%} weight)",
+        f"Signal value: {dominant_signal.value:.3f}",
+    ]
+
+    if dominant_signal.raw_content:
+        reasoning_parts.append(f"Context: {dominant_signal.raw_content[:100]}")
+
+    return " | ".join(reasoning_parts)
+
+
+class CompactDecision:
+    """
+    Validated decision as codes and a weight array (HybridAttentionEngine.decide_compact).
+
+    Nothing string-shaped is built up front: `reasoning`, `override_reason`
+    and `weights` are derived on first access, and to_chain() converts to the
+    DecisionChain that decide() + SafetyGate.validate() would have produced.
+    Source names and the dominant signal are captured at construction, so
+    later changes to the caller's signals mapping do not leak into it.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "sources",
+        "dominant_signal",
+        "weight_array",
+        "weighted_value",
+        "proposed_action",
+        "override_code",
+        "dominant_row",
+        "volatility",
+        "_safety_gate",
+        "_reasoning",
+    )
+
+    def __init__(
+        self,
+        signals: Mapping[str, SignalLike],
+        weights: np.ndarray,
+        weighted_value: float,
+        proposed_action: int,
+        override_code: int,
+        dominant_row: int,
+        volatility: float,
+        safety_gate: SafetyGate,
+    ):
+        self.timestamp = datetime.now()
+        self.sources: Tuple[str, ...] = tuple(signals)
+        self.dominant_signal: Optional[SignalLike] = (
+            signals[self.sources[dominant_row]] if dominant_row >= 0 else None
+        )
+        self.weight_array = weights
+        self.weighted_value = weighted_value
+        self.proposed_action = proposed_action
+        self.override_code = override_code
+        self.dominant_row = dominant_row
+        self.volatility = volatility
+        self._safety_gate = safety_gate
+        self._reasoning: Optional[str] = None
+
+    @property
+    def action(self) -> str:
+        """Final action name (HOLD whenever a safety rule overrode the proposal)."""
+        return ACTION_NAMES[HOLD if self.override_code != OVERRIDE_NONE else self.proposed_action]
+
+    @property
+    def is_safe(self) -> bool:
+        return self.override_code == OVERRIDE_NONE
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Weights by source; empty for a neutral decision."""
+        if self.dominant_row < 0:
+            return {}
+        return dict(zip(self.sources, self.weight_array.tolist()))
+
+    @property
+    def reasoning(self) -> str:
+        if self._reasoning is None:
+            if self.dominant_signal is None:
+                self._reasoning = NEUTRAL_REASONING
+            else:
+                self._reasoning = format_reasoning(
+                    self.sources[self.dominant_row],
+                    float(self.weight_array[self.dominant_row]),
+                    self.dominant_signal,
+                    self.weighted_value,
+                )
+        return self._reasoning
+
+    @property
+    def override_reason(self) -> Optional[str]:
+        if self.override_code == OVERRIDE_NONE:
+            return None
+        max_weight = float(self.weight_array[self.dominant_row]) if self.dominant_row >= 0 else 0.0
+        return self._safety_gate.describe_override(self.override_code, self.volatility, max_weight)
+
+    def to_chain(self) -> DecisionChain:
+        """Equivalent DecisionChain, with all strings materialized."""
+        return DecisionChain(
+            timestamp=self.timestamp,
+            weights=self.weights,
+            action=self.action,
+            reasoning=self.reasoning,
+            is_safe=self.is_safe,
+            override_reason=self.override_reason,
+            explanation=None,
+        )
+
+
 # Backward compatibility: alias to original name
 AttentionFusionEngine = HybridAttentionEngine
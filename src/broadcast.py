@@ -0,0 +1,216 @@
+"""
+Broadcast - Push decisions and signal deltas to streaming clients.
+Each message is serialized once and fanned out to per-client bounded queues;
+clients that fall behind are dropped instead of slowing everyone down.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from src.config import get_settings
+from src.logger import get_logger
+from src.metrics import MetricsCollector, get_metrics
+from src.schemas import DecisionChain, SignalLike
+from src.serialization import dumps
+
+logger = get_logger(__name__)
+
+
+class BroadcastMessage:
+    """
+    One event, encoded once and shared by every subscriber.
+    `data` is the JSON payload; `sse` is the ready-to-write SSE frame.
+    """
+
+    __slots__ = ("id", "event", "data", "sse")
+
+    def __init__(self, message_id: int, event: str, data: str):
+        self.id = message_id
+        self.event = event
+        self.data = data
+        self.sse = f"id: {message_id}\nevent: {event}\ndata: {data}\n\n".encode()
+
+    def envelope(self) -> str:
+        """WebSocket text frame: the payload wrapped with its id and event name."""
+        return f'{{"id":{self.id},"event":"{self.event}","data":{self.data}}}'
+
+
+class Subscription:
+    """
+    A client's bounded message queue. Iterating yields messages until the
+    subscription is closed, either by the client or by the broadcaster
+    dropping it for falling `max_queue` messages behind.
+    """
+
+    def __init__(self, broadcaster: "Broadcaster", max_queue: int):
+        self.broadcaster = broadcaster
+        self.queue: asyncio.Queue[Optional[BroadcastMessage]] = asyncio.Queue(max_queue)
+        self.dropped = False
+        self.closed = False
+
+    def offer(self, message: BroadcastMessage) -> bool:
+        """Queue a message without waiting. False if the client is too far behind."""
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self, dropped: bool = False) -> None:
+        """End the subscription and wake the consumer."""
+        if self.closed:
+            return
+        self.closed = True
+        self.dropped = dropped
+        self.broadcaster.unsubscribe(self)
+
+        # Discard the backlog so the end-of-stream marker fits
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[BroadcastMessage]:
+        """
+        Next message, or None once closed. Raises asyncio.TimeoutError if
+        nothing arrives within `timeout` (used for heartbeats).
+        """
+        if timeout is None:
+            return await self.queue.get()
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> BroadcastMessage:
+        message = await self.queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class Broadcaster:
+    """
+    Fan-out hub between the agent loop and streaming endpoints.
+
+    publish() never blocks the agent loop: messages go to each subscriber
+    with put_nowait, and a subscriber whose queue is full is disconnected
+    (it can reconnect and resync from the snapshot sent on subscribe).
+    """
+
+    def __init__(
+        self,
+        max_queue: Optional[int] = None,
+        max_clients: Optional[int] = None,
+        metrics: Optional[MetricsCollector] = None,
+    ):
+        settings = get_settings()
+        self.max_queue = max_queue or settings.stream_queue_size
+        self.max_clients = max_clients or settings.stream_max_clients
+        self.metrics = metrics or get_metrics()
+        self._subscribers: List[Subscription] = []
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, snapshot: Sequence[BroadcastMessage] = ()) -> Subscription:
+        """
+        Register a new client, pre-loaded with `snapshot` messages.
+        Raises OverflowError when max_clients are already connected.
+        """
+        if len(self._subscribers) >= self.max_clients:
+            raise OverflowError(f"Stream client limit ({self.max_clients}) reached")
+
+        subscription = Subscription(self, self.max_queue)
+        for message in snapshot:
+            subscription.offer(message)
+        self._subscribers.append(subscription)
+        self.metrics.record_stream_clients(len(self._subscribers))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Forget a client (called by Subscription.close)."""
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+            self.metrics.record_stream_clients(len(self._subscribers))
+
+    def message(self, event: str, payload: Any) -> BroadcastMessage:
+        """Encode a payload into a message with the next id."""
+        self._next_id += 1
+        return BroadcastMessage(self._next_id, event, self._encode(payload))
+
+    def publish(self, event: str, payload: Any) -> BroadcastMessage:
+        """Encode once and offer to every subscriber, dropping slow ones."""
+        message = self.message(event, payload)
+        if not self._subscribers:
+            return message
+
+        for subscription in list(self._subscribers):
+            if not subscription.offer(message):
+                logger.warning(
+                    f"Dropping slow stream client ({self.max_queue} messages behind)"
+                )
+                subscription.close(dropped=True)
+                self.metrics.record_stream_drop()
+
+        self.metrics.record_stream_publish()
+        return message
+
+    def publish_cycle(
+        self,
+        decision: DecisionChain,
+        changed: Mapping[str, SignalLike],
+        removed: Sequence[str] = (),
+    ) -> None:
+        """Push one decision cycle: the signal delta, then the decision."""
+        if not self._subscribers:
+            return
+        if changed or removed:
+            self.publish("signals", signal_delta(changed, removed))
+        self.publish("decision", decision)
+
+    def snapshot(
+        self, decision: Optional[DecisionChain], signals: Mapping[str, SignalLike]
+    ) -> List[BroadcastMessage]:
+        """Messages bringing a new client up to date with the current state."""
+        messages = [self.message("signals", signal_delta(signals, ()))] if signals else []
+        if decision is not None:
+            messages.append(self.message("decision", decision))
+        return messages
+
+    def close_all(self) -> None:
+        """Disconnect every client (shutdown)."""
+        for subscription in list(self._subscribers):
+            subscription.close()
+
+    @staticmethod
+    def _encode(payload: Any) -> str:
+        return dumps(payload).decode()
+
+
+def signal_delta(changed: Mapping[str, SignalLike], removed: Sequence[str]) -> Dict[str, Any]:
+    """Changed signals (in the /signals format) plus sources that disappeared."""
+    return {
+        "updated": {
+            source: {
+                "value": signal.value,
+                "timestamp": signal.timestamp,
+                "raw_content": signal.raw_content,
+                "stale": signal.stale,
+            }
+            for source, signal in changed.items()
+        },
+        "removed": list(removed),
+    }
+
+
+# Global broadcaster instance
+broadcaster: Optional[Broadcaster] = None
+
+
+def get_broadcaster() -> Broadcaster:
+    """Get the global broadcaster (created on first use)."""
+    global broadcaster
+    if broadcaster is None:
+        broadcaster = Broadcaster()
+    return broadcaster
@@ -0,0 +1,140 @@
+"""
+Circuit Breaker - Stop paying full timeouts for sensors that are down.
+Trips per source on the failure rate recorded in MetricsCollector, skips
+fetches while open, and probes the upstream again on a backoff schedule.
+"""
+
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+from src.logger import get_logger
+from src.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker.
+
+    - CLOSED: requests flow. The failure rate is read from the collector's
+      sensor_failures / sensor_success_count over a rolling window of the
+      last `window` calls (a ring of count snapshots, one per call); at
+      `failure_rate_threshold` (after `min_calls`) it trips.
+    - OPEN: requests are skipped until `reset_timeout` has elapsed.
+    - HALF_OPEN: a single probe request is let through. Success closes the
+      breaker; failure re-opens it with the timeout doubled (up to
+      `max_reset_timeout`).
+    """
+
+    def __init__(
+        self,
+        source: str,
+        metrics: MetricsCollector,
+        failure_rate_threshold: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        reset_timeout: float = 10.0,
+        max_reset_timeout: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.source = source
+        self.metrics = metrics
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.window = window
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+
+        self.state = CLOSED
+        self.reset_timeout = reset_timeout
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        # Collector counts after each recent call; the oldest marks where the window starts
+        self._history: Deque[Tuple[int, int]] = deque([self._counts()], maxlen=max(window, 1))
+        self._publish()
+
+    def allow_request(self) -> bool:
+        """Whether a fetch may go to the upstream right now."""
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN and self.clock() - (self.opened_at or 0.0) >= self.reset_timeout:
+            self._transition(HALF_OPEN)
+
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Call after a fetch succeeded (and was recorded in the collector)."""
+        if self.state == HALF_OPEN:
+            self._close()
+        else:
+            self._evaluate()
+
+    def record_failure(self) -> None:
+        """Call after a fetch failed (and was recorded in the collector)."""
+        if self.state == HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            self._open()
+        else:
+            self._evaluate()
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose request was cancelled."""
+        self._probe_in_flight = False
+
+    def failure_rate(self) -> Tuple[float, int]:
+        """(failure rate, calls) over the last `window` calls."""
+        failures, successes = self._counts()
+        failures -= self._history[0][0]
+        successes -= self._history[0][1]
+        calls = failures + successes
+        return (failures / calls if calls else 0.0), calls
+
+    def _evaluate(self) -> None:
+        rate, calls = self.failure_rate()
+        if calls >= self.min_calls and rate >= self.failure_rate_threshold:
+            logger.warning(
+                f"Circuit breaker for '{self.source}' tripped: "
+                f"{rate:.0%} failures over {calls} calls"
+            )
+            self._open()
+        else:
+            self._history.append(self._counts())
+
+    def _open(self) -> None:
+        self.opened_at = self.clock()
+        self._probe_in_flight = False
+        self._transition(OPEN)
+
+    def _close(self) -> None:
+        logger.info(f"Circuit breaker for '{self.source}' closed after successful probe")
+        self.reset_timeout = self.base_reset_timeout
+        self.opened_at = None
+        self._probe_in_flight = False
+        self._history.clear()
+        self._history.append(self._counts())
+        self._transition(CLOSED)
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        self._publish()
+
+    def _publish(self) -> None:
+        self.metrics.record_breaker_state(self.source, self.state)
+
+    def _counts(self) -> Tuple[int, int]:
+        return (
+            self.metrics.sensor_failures.get(self.source, 0),
+            self.metrics.sensor_success_count.get(self.source, 0),
+        )
@@ -2,7 +2,7 @@
 Configuration Management - Centralized settings with environment variable support
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +33,18 @@ class Settings(BaseSettings):
     # Agent Orchestrator
     cycle_interval: float = Field(default=5.0, validation_alias="CYCLE_INTERVAL")
     agent_temperature: float = Field(default=1.0, validation_alias="AGENT_TEMPERATURE")
+    fusion_renormalize_every: int = Field(
+        default=256, validation_alias="FUSION_RENORMALIZE_EVERY"
+    )
+    fusion_renormalize_interval: float = Field(
+        default=1.0, validation_alias="FUSION_RENORMALIZE_INTERVAL"
+    )
+
+    # Decision loop: "poll" runs a full cycle every cycle_interval, "event"
+    # re-decides as soon as any sensor delivers a new signal
+    decision_mode: Literal["poll", "event"] = Field(default="poll", validation_alias="DECISION_MODE")
+    event_debounce_ms: float = Field(default=20.0, validation_alias="EVENT_DEBOUNCE_MS")
+    sensor_poll_interval: float = Field(default=1.0, validation_alias="SENSOR_POLL_INTERVAL")
 
     # Safety Gate
     max_volatility_for_buy: float = Field(default=0.05, validation_alias="MAX_VOLATILITY_BUY")
@@ -43,6 +55,66 @@ class Settings(BaseSettings):
     sensor_timeout: float = Field(default=3.0, validation_alias="SENSOR_TIMEOUT")
     sensor_max_retries: int = Field(default=3, validation_alias="SENSOR_MAX_RETRIES")
     sensor_retry_delay: float = Field(default=0.5, validation_alias="SENSOR_RETRY_DELAY")
+    # Sensor specs: registry names / "module:Class" paths, or dicts with a
+    # "type" key plus per-sensor max_concurrency, rate_limit, burst, timeout.
+    # Empty = built-in twitter_sentiment, price_volatility and news_feed.
+    sensors: List[Union[str, Dict[str, Any]]] = Field(default=[], validation_alias="SENSORS")
+    sensor_max_concurrency: int = Field(default=32, validation_alias="SENSOR_MAX_CONCURRENCY")
+    # Hedged requests: once an attempt runs longer than the sensor's recent
+    # latency quantile, a duplicate is sent and the first answer wins
+    sensor_hedge_enabled: bool = Field(default=True, validation_alias="SENSOR_HEDGE_ENABLED")
+    sensor_hedge_quantile: float = Field(default=0.95, validation_alias="SENSOR_HEDGE_QUANTILE")
+    sensor_hedge_min_delay: float = Field(default=0.05, validation_alias="SENSOR_HEDGE_MIN_DELAY")
+    sensor_hedge_min_samples: int = Field(default=20, validation_alias="SENSOR_HEDGE_MIN_SAMPLES")
+    # Per-sensor circuit breaker
+    breaker_enabled: bool = Field(default=True, validation_alias="BREAKER_ENABLED")
+    breaker_failure_rate: float = Field(default=0.5, validation_alias="BREAKER_FAILURE_RATE")
+    breaker_min_calls: int = Field(default=5, validation_alias="BREAKER_MIN_CALLS")
+    breaker_window: int = Field(default=20, validation_alias="BREAKER_WINDOW")
+    breaker_reset_timeout: float = Field(default=10.0, validation_alias="BREAKER_RESET_TIMEOUT")
+    breaker_max_reset_timeout: float = Field(
+        default=300.0, validation_alias="BREAKER_MAX_RESET_TIMEOUT"
+    )
+    # Polling cycles stop waiting for sensors after this many seconds and use
+    # the last known (stale) signal for late ones. 0 disables the deadline.
+    cycle_deadline: float = Field(default=2.0, validation_alias="CYCLE_DEADLINE")
+
+    # Sensor HTTP connection pool (limits apply per upstream host)
+    http_pool_max_connections: int = Field(default=20, validation_alias="HTTP_POOL_MAX_CONNECTIONS")
+    http_pool_max_keepalive: int = Field(default=10, validation_alias="HTTP_POOL_MAX_KEEPALIVE")
+    http_pool_keepalive_expiry: float = Field(
+        default=30.0, validation_alias="HTTP_POOL_KEEPALIVE_EXPIRY"
+    )
+    # Needs the optional "http2" extra (h2); off by default so a plain install
+    # doesn't warn and fall back on every pool construction
+    http_pool_http2: bool = Field(default=False, validation_alias="HTTP_POOL_HTTP2")
+
+    # Push streams (/stream SSE, /ws WebSocket): each client gets a bounded
+    # queue and is disconnected once it falls this many messages behind
+    stream_queue_size: int = Field(default=64, validation_alias="STREAM_QUEUE_SIZE")
+    stream_max_clients: int = Field(default=1000, validation_alias="STREAM_MAX_CLIENTS")
+    stream_heartbeat: float = Field(default=15.0, validation_alias="STREAM_HEARTBEAT")
+
+    # Decision journal: append-only binary history of signals and decisions
+    # (plus a "<path>.strings" side table). Unset disables the journal.
+    journal_path: Optional[str] = Field(default=None, validation_alias="JOURNAL_PATH")
+
+    # Tracing: per-stage and per-sensor spans of each cycle, kept in a ring
+    # buffer and served by /trace (JSON or Chrome trace events)
+    tracing_enabled: bool = Field(default=False, validation_alias="TRACING_ENABLED")
+    tracing_buffer_size: int = Field(default=4096, validation_alias="TRACING_BUFFER_SIZE")
+
+    # Sampling profiler behind POST /admin/profile (off unless enabled)
+    profiler_enabled: bool = Field(default=False, validation_alias="PROFILER_ENABLED")
+    profiler_max_seconds: float = Field(default=60.0, validation_alias="PROFILER_MAX_SECONDS")
+
+    # Event loop watchdog: heartbeat lag histogram, plus a logged stack
+    # whenever a callback blocks the loop longer than the stall threshold
+    watchdog_enabled: bool = Field(default=True, validation_alias="WATCHDOG_ENABLED")
+    watchdog_interval: float = Field(default=0.1, validation_alias="WATCHDOG_INTERVAL")
+    watchdog_stall_threshold_ms: float = Field(
+        default=100.0, validation_alias="WATCHDOG_STALL_THRESHOLD_MS"
+    )
 
     # Logging
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
@@ -66,6 +138,8 @@ class Settings(BaseSettings):
     # Performance Monitoring
     enable_metrics: bool = Field(default=True, validation_alias="ENABLE_METRICS")
     metrics_window_size: int = Field(default=100, validation_alias="METRICS_WINDOW_SIZE")
+    # /metrics/prometheus: distinct source/host label values before folding into "_other"
+    metrics_max_label_values: int = Field(default=50, validation_alias="METRICS_MAX_LABEL_VALUES")
 
 
 # Global settings instance
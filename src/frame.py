@@ -0,0 +1,318 @@
+"""
+Signal Frame - Columnar container for multi-source, multi-timestep signals.
+Parallel NumPy columns instead of Dict[str, Signal], so batch, windowing and
+hand-off to the Rust core work on contiguous buffers without per-row objects.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+import numpy as np
+
+from src.schemas import SignalLike, SignalRecord
+
+NO_TEXT = -1  # text_lengths value for rows without raw_content
+
+TimeLike = Union[datetime, int, np.integer]
+
+
+def to_ns(timestamp: TimeLike) -> int:
+    """Epoch nanoseconds for a datetime (naive = local time, like Signal) or an int."""
+    if isinstance(timestamp, datetime):
+        seconds = int(timestamp.replace(microsecond=0).timestamp())
+        return seconds * 1_000_000_000 + timestamp.microsecond * 1000
+    return int(timestamp)
+
+
+def from_ns(timestamp_ns: int) -> datetime:
+    """Naive local datetime for epoch nanoseconds (truncated to microseconds)."""
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+
+class SignalFrame:
+    """
+    Signals as parallel columns, one row per observation.
+
+    Columns (all C-contiguous, exposed through the buffer protocol):
+      - source_ids: int32 index into `sources`
+      - values: float64
+      - timestamps: int64 epoch nanoseconds
+      - text_offsets / text_lengths: int64 / int32 spans of raw_content in
+        the shared UTF-8 `text` buffer (length NO_TEXT for None)
+
+    append() grows the columns geometrically. Slicing returns a frame that
+    views the parent's arrays; appending to such a view copies it first, so
+    it never writes into rows the parent owns.
+
+    Timestamp order is tracked as rows arrive (`_sorted`: True, False, or
+    None when not yet known), so window() does not rescan the frame.
+    """
+
+    def __init__(self, sources: Sequence[str] = (), capacity: int = 0):
+        self.sources: List[str] = list(sources)
+        self._source_index: Dict[str, int] = {name: i for i, name in enumerate(self.sources)}
+        self._size = 0
+        self._text_size = 0
+        self._owner = True
+        self._sorted: Optional[bool] = True
+        self._source_ids = np.empty(capacity, dtype=np.int32)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._text_offsets = np.empty(capacity, dtype=np.int64)
+        self._text_lengths = np.empty(capacity, dtype=np.int32)
+        self._text = np.empty(0, dtype=np.uint8)
+
+    # ----- Columns -----
+
+    @property
+    def source_ids(self) -> np.ndarray:
+        return self._source_ids[: self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[: self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self._size]
+
+    @property
+    def text_offsets(self) -> np.ndarray:
+        return self._text_offsets[: self._size]
+
+    @property
+    def text_lengths(self) -> np.ndarray:
+        return self._text_lengths[: self._size]
+
+    @property
+    def text(self) -> np.ndarray:
+        return self._text[: self._text_size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def source_id(self, source: str) -> int:
+        """Index of a source name, registering it if new."""
+        index = self._source_index.get(source)
+        if index is None:
+            index = len(self.sources)
+            self.sources.append(source)
+            self._source_index[source] = index
+        return index
+
+    # ----- Building -----
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[SignalLike]) -> "SignalFrame":
+        """Frame holding the given signals in iteration order."""
+        frame = cls()
+        frame.extend(signals)
+        return frame
+
+    @classmethod
+    def from_arrays(
+        cls,
+        sources: Sequence[str],
+        source_ids: np.ndarray,
+        values: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> "SignalFrame":
+        """Frame over existing columns (no raw_content). Arrays are used as-is when possible."""
+        frame = cls(sources)
+        frame._source_ids = np.ascontiguousarray(source_ids, dtype=np.int32)
+        frame._values = np.ascontiguousarray(values, dtype=np.float64)
+        frame._timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        frame._size = len(frame._values)
+        if not len(frame._source_ids) == len(frame._timestamps) == frame._size:
+            raise ValueError("source_ids, values and timestamps must have the same length")
+        frame._text_offsets = np.zeros(frame._size, dtype=np.int64)
+        frame._text_lengths = np.full(frame._size, NO_TEXT, dtype=np.int32)
+        frame._sorted = None
+        return frame
+
+    def append(
+        self,
+        source: str,
+        value: float,
+        timestamp: Optional[TimeLike] = None,
+        raw_content: Optional[str] = None,
+    ) -> None:
+        """Add one observation (timestamp defaults to now)."""
+        if not self._owner or self._size == len(self._values):
+            self._reserve(self._size + 1)
+
+        row = self._size
+        timestamp_ns = to_ns(datetime.now() if timestamp is None else timestamp)
+        if self._sorted and row and timestamp_ns < self._timestamps[row - 1]:
+            self._sorted = False
+        self._source_ids[row] = self.source_id(source)
+        self._values[row] = value
+        self._timestamps[row] = timestamp_ns
+        if raw_content is None:
+            self._text_offsets[row] = self._text_size
+            self._text_lengths[row] = NO_TEXT
+        else:
+            encoded = raw_content.encode()
+            end = self._text_size + len(encoded)
+            if end > len(self._text):
+                self._text = _grow(self._text, end)
+            self._text[self._text_size : end] = np.frombuffer(encoded, dtype=np.uint8)
+            self._text_offsets[row] = self._text_size
+            self._text_lengths[row] = len(encoded)
+            self._text_size = end
+        self._size += 1
+
+    def append_signal(self, signal: SignalLike) -> None:
+        """Add a Signal or SignalRecord."""
+        self.append(signal.source, signal.value, signal.timestamp, signal.raw_content)
+
+    def extend(self, signals: Iterable[SignalLike]) -> None:
+        """Add many signals."""
+        for signal in signals:
+            self.append_signal(signal)
+
+    def _reserve(self, size: int) -> None:
+        """Ensure owned columns with room for `size` rows."""
+        capacity = max(size, 2 * len(self._values), 16)
+        self._source_ids = _grow(self.source_ids, capacity)
+        self._values = _grow(self.values, capacity)
+        self._timestamps = _grow(self.timestamps, capacity)
+        self._text_offsets = _grow(self.text_offsets, capacity)
+        self._text_lengths = _grow(self.text_lengths, capacity)
+        if not self._owner:
+            self._text = self.text.copy()
+            self.sources = list(self.sources)
+            self._source_index = dict(self._source_index)
+            self._owner = True
+
+    # ----- Reading -----
+
+    def raw_content(self, row: int) -> Optional[str]:
+        """Decoded raw_content of a row."""
+        length = int(self._text_lengths[row])
+        if length == NO_TEXT:
+            return None
+        start = int(self._text_offsets[row])
+        return self._text[start : start + length].tobytes().decode()
+
+    def record(self, row: int) -> SignalRecord:
+        """One row as a SignalRecord."""
+        if not -self._size <= row < self._size:
+            raise IndexError(f"row {row} out of range for frame of {self._size}")
+        row %= self._size
+        return SignalRecord(
+            self.sources[int(self._source_ids[row])],
+            float(self._values[row]),
+            from_ns(int(self._timestamps[row])),
+            self.raw_content(row),
+        )
+
+    def __iter__(self) -> Iterator[SignalRecord]:
+        return (self.record(row) for row in range(self._size))
+
+    @overload
+    def __getitem__(self, key: int) -> SignalRecord: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "SignalFrame": ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[SignalRecord, "SignalFrame"]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if step != 1:
+                return self.take(np.arange(start, stop, step))
+            return self._view(start, max(start, stop))
+        return self.record(key)
+
+    def _view(self, start: int, stop: int) -> "SignalFrame":
+        """Zero-copy frame over rows [start, stop)."""
+        view = SignalFrame.__new__(SignalFrame)
+        view.sources = self.sources
+        view._source_index = self._source_index
+        view._size = stop - start
+        view._owner = False
+        view._sorted = True if self._sorted else None  # Any slice of sorted rows is sorted
+        view._source_ids = self._source_ids[start:stop]
+        view._values = self._values[start:stop]
+        view._timestamps = self._timestamps[start:stop]
+        view._text_offsets = self._text_offsets[start:stop]
+        view._text_lengths = self._text_lengths[start:stop]
+        view._text = self._text
+        view._text_size = self._text_size
+        return view
+
+    def take(self, rows: np.ndarray) -> "SignalFrame":
+        """New frame holding the selected rows (index array or boolean mask)."""
+        rows = np.asarray(rows)
+        mask = rows.dtype == bool
+        if mask:
+            rows = np.flatnonzero(rows)
+
+        frame = SignalFrame(self.sources)
+        frame._source_ids = self.source_ids[rows]
+        frame._values = self.values[rows]
+        frame._timestamps = self.timestamps[rows]
+        frame._text_offsets = self.text_offsets[rows]
+        frame._text_lengths = self.text_lengths[rows]
+        frame._text = self._text  # Shared; offsets still point into it
+        frame._text_size = self._text_size
+        frame._size = len(rows)
+        frame._owner = False
+        # Masks keep row order; index arrays may reorder, so check lazily
+        frame._sorted = True if self._sorted and mask else None
+        return frame
+
+    def is_sorted(self) -> bool:
+        """Whether rows are in non-decreasing timestamp order."""
+        if self._sorted is None:
+            # One scan; append() keeps the answer current from here on
+            self._sorted = bool(np.all(np.diff(self.timestamps) >= 0))
+        return self._sorted
+
+    def window(self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> "SignalFrame":
+        """
+        Rows with start <= timestamp < end. On a time-sorted frame (the
+        normal case for appended streams) this is a binary search and a
+        zero-copy view; otherwise a filtered copy.
+        """
+        timestamps = self.timestamps
+        lo_ns = None if start is None else to_ns(start)
+        hi_ns = None if end is None else to_ns(end)
+
+        if self.is_sorted():
+            lo = 0 if lo_ns is None else int(np.searchsorted(timestamps, lo_ns, "left"))
+            hi = self._size if hi_ns is None else int(np.searchsorted(timestamps, hi_ns, "left"))
+            return self._view(lo, max(lo, hi))
+
+        keep = np.ones(self._size, dtype=bool)
+        if lo_ns is not None:
+            keep &= timestamps >= lo_ns
+        if hi_ns is not None:
+            keep &= timestamps < hi_ns
+        return self.take(keep)
+
+    def latest(self) -> Dict[str, SignalRecord]:
+        """Most recent row per source (by timestamp, later rows win ties)."""
+        if not self._size:
+            return {}
+        # lexsort: last key is primary; stable, so later rows sort after earlier ones
+        order = np.lexsort((np.arange(self._size), self.timestamps, self.source_ids))
+        ids = self.source_ids[order]
+        last = order[np.append(ids[1:] != ids[:-1], True)]
+        return {record.source: record for record in (self.record(int(row)) for row in last)}
+
+    def ages(self, now: Optional[TimeLike] = None) -> np.ndarray:
+        """Seconds between each row's timestamp and `now` (float64)."""
+        now_ns = to_ns(datetime.now() if now is None else now)
+        return (now_ns - self.timestamps) / 1e9
+
+    def __repr__(self) -> str:
+        return f"SignalFrame(rows={self._size}, sources={len(self.sources)})"
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Copy of `array` in a new buffer of at least `capacity` elements."""
+    grown = np.empty(max(capacity, 2 * len(array)), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
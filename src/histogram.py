@@ -0,0 +1,172 @@
+"""
+Latency Histogram - Log-bucketed (HDR-style) histogram for percentile metrics.
+O(1) recording into a fixed set of counters, percentiles without copying samples.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Percentiles reported by MetricsCollector (key suffix -> quantile)
+REPORTED_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99, "p999": 0.999}
+
+# Upper bounds (ms, inclusive) of the coarse buckets kept for exposition formats
+EXPOSITION_BOUNDS_MS = (1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1e3, 2.5e3, 5e3)
+
+
+class LatencyHistogram:
+    """
+    Histogram of millisecond latencies with bounded relative error.
+
+    Values are counted in integer units of `resolution_ms`. The first
+    2**precision_bits units get one bucket each; above that every power of
+    two is split into 2**(precision_bits - 1) equal buckets, so a bucket is
+    never wider than 2**-(precision_bits - 1) of its lower bound (0.8% for
+    the default 8 bits). Values above `max_ms` land in the top bucket;
+    count, sum, min and max are tracked exactly.
+
+    A second, coarse set of counters over `exposition_bounds_ms` is kept
+    alongside, so Prometheus-style cumulative buckets cost O(bounds) to read.
+    """
+
+    __slots__ = (
+        "resolution_ms",
+        "precision_bits",
+        "max_ms",
+        "count",
+        "total_ms",
+        "min_ms",
+        "max_seen_ms",
+        "_sub_count",
+        "_half_count",
+        "_max_index",
+        "_counts",
+        "exposition_bounds_ms",
+        "_exposition_counts",
+    )
+
+    def __init__(
+        self,
+        resolution_ms: float = 0.001,
+        max_ms: float = 3_600_000.0,
+        precision_bits: int = 8,
+        exposition_bounds_ms: Sequence[float] = EXPOSITION_BOUNDS_MS,
+    ):
+        """
+        Args:
+            resolution_ms: Smallest distinguishable latency (default 1µs)
+            max_ms: Largest latency bucketed precisely (default 1 hour)
+            precision_bits: Sub-bucket bits per power of two (relative error 2**-(bits-1))
+            exposition_bounds_ms: Ascending upper bounds for cumulative_buckets()
+        """
+        if resolution_ms <= 0 or max_ms <= resolution_ms or precision_bits < 2:
+            raise ValueError("need 0 < resolution_ms < max_ms and precision_bits >= 2")
+        self.resolution_ms = resolution_ms
+        self.precision_bits = precision_bits
+        self.max_ms = max_ms
+        self._sub_count = 1 << precision_bits
+        self._half_count = self._sub_count >> 1
+        self._max_index = self._index(int(max_ms / resolution_ms))
+        self._counts: List[int] = [0] * (self._max_index + 1)
+        self.exposition_bounds_ms = tuple(exposition_bounds_ms)
+        self._exposition_counts = [0] * (len(self.exposition_bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_seen_ms = 0.0
+
+    def _index(self, units: int) -> int:
+        """Bucket index for a value in resolution units."""
+        if units < self._sub_count:
+            return units
+        shift = units.bit_length() - self.precision_bits
+        # units >> shift is in [half_count, sub_count): its sub-bucket within the octave
+        return shift * self._half_count + (units >> shift)
+
+    def _bucket_bounds(self, index: int) -> Tuple[int, int]:
+        """[low, high) of a bucket, in resolution units."""
+        if index < self._sub_count:
+            return index, index + 1
+        shift, offset = divmod(index - self._sub_count, self._half_count)
+        shift += 1
+        low = (offset + self._half_count) << shift
+        return low, low + (1 << shift)
+
+    def record(self, latency_ms: float) -> None:
+        """Count one latency."""
+        units = int(latency_ms / self.resolution_ms) if latency_ms > 0 else 0
+        self._counts[min(self._index(units), self._max_index)] += 1
+        self._exposition_counts[bisect_left(self.exposition_bounds_ms, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms < self.min_ms:
+            self.min_ms = latency_ms
+        if latency_ms > self.max_seen_ms:
+            self.max_seen_ms = latency_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def quantile(self, quantile: float) -> float:
+        """Latency (ms) at a quantile in [0, 1]; 0.0 when empty."""
+        return self.quantiles((quantile,))[0]
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[float]:
+        """Latencies (ms) at several quantiles, in one pass over the buckets."""
+        if not self.count:
+            return [0.0] * len(quantiles)
+
+        # Rank of each quantile (1-based), answered in ascending order
+        order = sorted(range(len(quantiles)), key=lambda i: quantiles[i])
+        ranks = [max(1, math.ceil(quantiles[i] * self.count)) for i in order]
+        results = [0.0] * len(quantiles)
+
+        position = 0
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while position < len(ranks) and ranks[position] <= seen:
+                results[order[position]] = self._bucket_value(index)
+                position += 1
+            if position == len(ranks):
+                break
+        return results
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative latency of a bucket (midpoint, clamped to the observed range)."""
+        low, high = self._bucket_bounds(index)
+        value = (low + high) / 2 * self.resolution_ms
+        return min(max(value, self.min_ms), self.max_seen_ms)
+
+    def percentiles(self) -> Dict[str, float]:
+        """The REPORTED_PERCENTILES as {"p50": ..., "p999": ...}."""
+        values = self.quantiles(tuple(REPORTED_PERCENTILES.values()))
+        return dict(zip(REPORTED_PERCENTILES, values))
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """(upper bound ms, observations <= bound) per exposition bound, then (inf, count)."""
+        buckets = []
+        running = 0
+        for bound, bucket_count in zip(self.exposition_bounds_ms, self._exposition_counts):
+            running += bucket_count
+            buckets.append((bound, running))
+        buckets.append((math.inf, self.count))
+        return buckets
+
+    def reset(self) -> None:
+        """Clear all counts."""
+        self._counts = [0] * (self._max_index + 1)
+        self._exposition_counts = [0] * (len(self.exposition_bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_seen_ms = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, buckets={len(self._counts)})"
@@ -0,0 +1,170 @@
+"""
+HTTP Connection Pool - Shared, per-host partitioned clients for sensors.
+Keeps connections alive across cycles, multiplexes over HTTP/2 where the
+upstream supports it, and reports pool usage to MetricsCollector.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from src.config import get_settings
+from src.logger import get_logger
+from src.metrics import MetricsCollector, Timer, get_metrics
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class ConnectionPool:
+    """
+    One keep-alive connection pool per upstream host (scheme://host:port).
+
+    Each host gets its own httpx client and a request slot semaphore sized to
+    the pool's max connections, so a slow or busy upstream can't starve the
+    others. Time spent waiting for a slot is recorded as pool wait time.
+
+    Active and idle counts come from the pool's own acquire/release
+    bookkeeping, not from httpx internals. Idle connections are estimated:
+    each concurrent HTTP/1.1 request opens a connection (one multiplexed
+    connection under HTTP/2), up to max_keepalive are kept on release, a
+    failed request is assumed to drop its connection, and all of them
+    expire once the host has been unused for keepalive_expiry.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        metrics: Optional[MetricsCollector] = None,
+    ):
+        settings = get_settings()
+        self.timeout = timeout or settings.sensor_timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.http_pool_max_connections,
+            max_keepalive_connections=(
+                max_keepalive_connections or settings.http_pool_max_keepalive
+            ),
+            keepalive_expiry=keepalive_expiry or settings.http_pool_keepalive_expiry,
+        )
+        http2 = settings.http_pool_http2 if http2 is None else http2
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but 'h2' is not installed - using HTTP/1.1")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.metrics = metrics or get_metrics()
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._active: Dict[str, int] = {}
+        self._warm: Dict[str, int] = {}  # Open connections (estimated)
+        self._last_used: Dict[str, float] = {}
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        """True once aclose() has run."""
+        return self._closed
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET through the pool for the URL's host."""
+        return await self.request("GET", url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pool for the URL's host."""
+        host = self._host_key(url)
+        client = self._client(host)
+
+        with Timer() as wait_timer:
+            await self._slots[host].acquire()
+        self.metrics.record_pool_wait(host, wait_timer.elapsed_ms)
+
+        self._checkout(host)
+        ok = False
+        try:
+            response = await client.request(method, url, **kwargs)
+            ok = True
+            return response
+        finally:
+            self._checkin(host, ok)
+            self._slots[host].release()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Active requests and idle keep-alive connections per host."""
+        return {
+            host: {"active": self._active[host], "idle": self._idle_connections(host)}
+            for host in self._clients
+        }
+
+    async def aclose(self) -> None:
+        """Close every per-host client."""
+        self._closed = True
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def _client(self, host: str) -> httpx.AsyncClient:
+        """Get or lazily create the client partition for a host."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        client = self._clients.get(host)
+        if client is None:
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            client = httpx.AsyncClient(timeout=self.timeout, transport=transport)
+            self._clients[host] = client
+            self._slots[host] = asyncio.Semaphore(self.limits.max_connections or 100)
+            self._active[host] = 0
+            self._warm[host] = 0
+            self._last_used[host] = 0.0
+        return client
+
+    def _checkout(self, host: str) -> None:
+        """Book a request slot as in flight on one of the host's connections."""
+        active = self._active[host]
+        if active == 0 and self._expired(host):
+            self._warm[host] = 0
+        active = self._active[host] = active + 1
+        self._warm[host] = max(self._warm[host], 1 if self.http2 else active)
+        self._publish_state(host)
+
+    def _checkin(self, host: str, ok: bool) -> None:
+        """Return a slot; a failed request is assumed to have lost its connection."""
+        active = self._active[host] = self._active[host] - 1
+        warm = self._warm[host] if ok else self._warm[host] - 1
+        keepalive = self.limits.max_keepalive_connections
+        if keepalive is not None:
+            warm = min(warm, max(keepalive, active))
+        self._warm[host] = max(warm, active)
+        self._last_used[host] = time.monotonic()
+        self._publish_state(host)
+
+    def _expired(self, host: str) -> bool:
+        expiry = self.limits.keepalive_expiry
+        return expiry is not None and time.monotonic() - self._last_used[host] > expiry
+
+    def _idle_connections(self, host: str) -> int:
+        """Kept-alive connections not serving a request (estimated, see class docs)."""
+        active = self._active.get(host, 0)
+        if active == 0 and self._expired(host):
+            return 0
+        return max(self._warm.get(host, 0) - active, 0)
+
+    def _publish_state(self, host: str) -> None:
+        self.metrics.record_pool_state(host, self._active[host], self._idle_connections(host))
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parsed = httpx.URL(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        return f"{parsed.scheme}://{parsed.host}:{port}"
@@ -0,0 +1,429 @@
+"""
+Decision Journal - Append-only binary history of signals and decisions.
+Fixed 48-byte records with strings interned in a side table, read back
+through a memory map so history queries and replay never parse the whole file.
+"""
+
+import mmap
+import os
+import re
+import struct
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.brain import ACTION_NAMES
+from src.logger import get_logger
+from src.schemas import DecisionChain, SignalLike, SignalRecord
+
+logger = get_logger(__name__)
+
+# Record kinds
+SIGNAL = 0
+DECISION = 1
+WEIGHT = 2
+
+# Record flags
+FLAG_STALE = 1  # Signal served after its sensor missed the deadline
+FLAG_SAFE = 1  # Decision passed the safety gate
+
+# timestamp, value, kind, flags, action, pad, reserved, key, text, aux.
+# String ids are 64-bit byte offsets, so the side table can grow past 4 GiB.
+RECORD_STRUCT = struct.Struct("<ddBBBx4xQQQ")
+RECORD_SIZE = RECORD_STRUCT.size
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("value", "<f8"),
+        ("kind", "u1"),
+        ("flags", "u1"),
+        ("action", "u1"),
+        ("_pad", "u1"),
+        ("_reserved", "<u4"),
+        ("key", "<u8"),
+        ("text", "<u8"),
+        ("aux", "<u8"),
+    ]
+)
+assert RECORD_DTYPE.itemsize == RECORD_SIZE == 48
+
+RECORD_MAGIC = b"DECISIFY-JOURNAL-v2".ljust(RECORD_SIZE, b"\0")
+STRING_MAGIC = b"DCSSTR2\0"
+STRING_LENGTH = struct.Struct("<I")
+NO_STRING = 0  # String ids are byte offsets past the header, so 0 means None
+
+# Decision texts (reasoning, explanation) are stored as an interned template
+# with the numbers cut out, followed by the numbers themselves
+TEXT_PLAIN = 0
+TEXT_TEMPLATE = 1
+TEMPLATE_ID = struct.Struct("<Q")
+TEMPLATE_SLOT = "\x1f"  # Where a number goes in a template; separates the numbers
+_NUMBER = re.compile(r"(-?\d+(?:\.\d+)?)")
+
+_ACTION_CODES = {name: code for code, name in enumerate(ACTION_NAMES)}
+
+
+def strings_path(path: str) -> str:
+    """Path of the string side table for a journal file."""
+    return f"{path}.strings"
+
+
+class DecisionJournal:
+    """
+    Append-only writer.
+
+    Each cycle appends the signals that changed, one DECISION record and one
+    WEIGHT record per attention weight:
+
+    - SIGNAL: key = source, text = raw_content, value, flags = stale
+    - DECISION: key = reasoning, text = explanation, aux = override_reason,
+      value = number of WEIGHT records that follow, action, flags = is_safe
+    - WEIGHT: key = source, value = weight
+
+    Strings go to `<path>.strings` as length-prefixed UTF-8 and are referenced
+    by byte offset. Short strings (source names, repeated messages) are
+    interned; the intern table is bounded and rebuilt per process, so dedup
+    is best effort and never requires scanning the side table.
+
+    Reasoning and explanation differ per decision only in their numbers, so
+    each is written as an interned template id plus the numbers (a few dozen
+    bytes) rather than the full text.
+    """
+
+    def __init__(self, path: str, intern_max_length: int = 256, intern_max_entries: int = 65536):
+        self.path = path
+        self.intern_max_length = intern_max_length
+        self.intern_max_entries = intern_max_entries
+        self._interned: Dict[str, int] = {}
+        self._templates: Dict[str, int] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._records = self._open(path, RECORD_MAGIC)
+        self._strings = self._open(strings_path(path), STRING_MAGIC)
+        self._strings_end = self._strings.seek(0, os.SEEK_END)
+        self._recover_torn_record()
+        self._count = (self._records.tell() - RECORD_SIZE) // RECORD_SIZE
+
+    def __len__(self) -> int:
+        """Number of records written."""
+        return self._count
+
+    def append(self, signals: Mapping[str, SignalLike], decision: DecisionChain) -> None:
+        """Append one cycle: its changed signals followed by the decision."""
+        rows = bytearray()
+        for source, signal in signals.items():
+            rows += RECORD_STRUCT.pack(
+                signal.timestamp.timestamp(),
+                signal.value,
+                SIGNAL,
+                FLAG_STALE if signal.stale else 0,
+                0,
+                self._string_id(source),
+                self._string_id(signal.raw_content),
+                NO_STRING,
+            )
+
+        timestamp = decision.timestamp.timestamp()
+        rows += RECORD_STRUCT.pack(
+            timestamp,
+            float(len(decision.weights)),
+            DECISION,
+            FLAG_SAFE if decision.is_safe else 0,
+            _ACTION_CODES.get(decision.action, 0),
+            self._text_id(decision.reasoning),
+            self._text_id(decision.explanation),
+            self._string_id(decision.override_reason),
+        )
+        for source, weight in decision.weights.items():
+            rows += RECORD_STRUCT.pack(
+                timestamp, weight, WEIGHT, 0, 0, self._string_id(source), NO_STRING, NO_STRING
+            )
+
+        # Strings land before the records that reference them
+        self._strings.flush()
+        self._records.write(rows)
+        self._records.flush()
+        self._count += len(rows) // RECORD_SIZE
+
+    def close(self) -> None:
+        """Flush and close both files."""
+        for handle in (self._strings, self._records):
+            if not handle.closed:
+                handle.flush()
+                handle.close()
+
+    def _string_id(self, value: Optional[str]) -> int:
+        """Write (or reuse) a string in the side table and return its id."""
+        if value is None:
+            return NO_STRING
+
+        cacheable = len(value) <= self.intern_max_length
+        if cacheable and value in self._interned:
+            return self._interned[value]
+
+        string_id = self._write(value.encode("utf-8"))
+        if cacheable:
+            if len(self._interned) >= self.intern_max_entries:
+                self._interned.clear()
+            self._interned[value] = string_id
+        return string_id
+
+    def _text_id(self, value: Optional[str]) -> int:
+        """Write a decision text as template id + numbers (see JournalReader.text)."""
+        if value is None:
+            return NO_STRING
+        if TEMPLATE_SLOT in value:
+            return self._write(bytes([TEXT_PLAIN]) + value.encode("utf-8"))
+
+        parts = _NUMBER.split(value)  # literal, number, literal, ..., literal
+        template = TEMPLATE_SLOT.join(parts[0::2])
+        template_id = self._templates.get(template)
+        if template_id is None:
+            template_id = self._write(template.encode("utf-8"))
+            if len(self._templates) >= self.intern_max_entries:
+                self._templates.clear()
+            self._templates[template] = template_id
+
+        numbers = TEMPLATE_SLOT.join(parts[1::2]).encode("utf-8")
+        return self._write(bytes([TEXT_TEMPLATE]) + TEMPLATE_ID.pack(template_id) + numbers)
+
+    def _write(self, payload: bytes) -> int:
+        """Append one length-prefixed entry to the side table and return its id."""
+        string_id = self._strings_end
+        self._strings.write(STRING_LENGTH.pack(len(payload)) + payload)
+        self._strings_end += STRING_LENGTH.size + len(payload)
+        return string_id
+
+    def _recover_torn_record(self) -> None:
+        """Drop a partially written trailing record left by a crash."""
+        size = self._records.seek(0, os.SEEK_END)
+        aligned = size - (size - RECORD_SIZE) % RECORD_SIZE
+        if aligned != size:
+            logger.warning(f"Journal {self.path}: dropping {size - aligned} bytes of torn record")
+            self._records.truncate(aligned)
+            self._records.seek(aligned)
+
+    @staticmethod
+    def _open(path: str, magic: bytes) -> BinaryIO:
+        """Open a journal file for appending, writing the header if it's new."""
+        handle = open(path, "a+b")
+        if handle.seek(0, os.SEEK_END) == 0:
+            handle.write(magic)
+            handle.flush()
+            return handle
+
+        handle.seek(0)
+        if handle.read(len(magic)) != magic:
+            handle.close()
+            raise ValueError(f"{path} is not a decisify journal file")
+        handle.seek(0, os.SEEK_END)
+        return handle
+
+
+class JournalReader:
+    """
+    Zero-copy reader over a journal written by DecisionJournal.
+
+    `records` is a NumPy structured view straight onto the memory map, so
+    column scans (e.g. action counts over a month) never copy or parse the
+    file. Only the rows a query returns are turned back into models.
+    Call `refresh()` to pick up records appended since the file was mapped;
+    it only scans the new records, so polling it every cycle stays cheap.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._records_map: Optional[mmap.mmap] = None
+        self._strings_map: Optional[mmap.mmap] = None
+        self._records_size = 0
+        self._strings_size = 0
+        self.records = np.empty(0, dtype=RECORD_DTYPE)
+        self._decision_buffer = np.empty(0, dtype=np.int64)  # Grown geometrically
+        self._decision_rows = self._decision_buffer
+        self.refresh()
+
+    def __len__(self) -> int:
+        """Number of decisions in the journal."""
+        return len(self._decision_rows)
+
+    def __enter__(self) -> "JournalReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def refresh(self) -> None:
+        """
+        Pick up whatever the writer appended since the last call. Only a file
+        that grew is re-mapped, and only records past the previous end are
+        scanned for decisions.
+        """
+        records_size = os.path.getsize(self.path)
+        strings_size = os.path.getsize(strings_path(self.path))
+        if records_size < self._records_size or strings_size < self._strings_size:
+            self.close()  # Truncated or replaced: start over
+
+        if strings_size != self._strings_size:
+            strings_map = self._map(strings_path(self.path))
+            self._unmap(self._strings_map)
+            self._strings_map = strings_map
+            self._strings_size = strings_size
+        if records_size == self._records_size:
+            return
+
+        records_map = self._map(self.path)
+        if records_map[:RECORD_SIZE] != RECORD_MAGIC:
+            records_map.close()
+            raise ValueError(f"{self.path} is not a decisify journal file")
+
+        seen = len(self.records)
+        count = (records_size - RECORD_SIZE) // RECORD_SIZE
+        records = np.frombuffer(records_map, dtype=RECORD_DTYPE, count=count, offset=RECORD_SIZE)
+        new_rows = seen + np.flatnonzero(records["kind"][seen:] == DECISION)
+
+        # The old view must go before its map can be closed
+        self.records = records
+        self._unmap(self._records_map)
+        self._records_map = records_map
+        self._records_size = records_size
+        self._add_decision_rows(new_rows)
+
+    def _add_decision_rows(self, rows: np.ndarray) -> None:
+        """Append to the decision row index, growing its buffer geometrically."""
+        start = len(self._decision_rows)
+        end = start + len(rows)
+        if end > len(self._decision_buffer):
+            grown = np.empty(max(end, 2 * len(self._decision_buffer), 64), dtype=np.int64)
+            grown[:start] = self._decision_rows
+            self._decision_buffer = grown
+        self._decision_buffer[start:end] = rows
+        self._decision_rows = self._decision_buffer[:end]
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        # Views onto the map must go before the map can be closed
+        self.records = np.empty(0, dtype=RECORD_DTYPE)
+        self._decision_rows = self._decision_buffer[:0]
+        self._unmap(self._records_map)
+        self._unmap(self._strings_map)
+        self._records_map = self._strings_map = None
+        self._records_size = self._strings_size = 0
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Look up an interned string by id."""
+        payload = self._payload(string_id)
+        return None if payload is None else payload.decode("utf-8")
+
+    def text(self, string_id: int) -> Optional[str]:
+        """Look up a decision text (reasoning, explanation) written by _text_id."""
+        payload = self._payload(string_id)
+        if payload is None:
+            return None
+        if payload[0] == TEXT_PLAIN:
+            return payload[1:].decode("utf-8")
+
+        (template_id,) = TEMPLATE_ID.unpack_from(payload, 1)
+        literals = (self.string(template_id) or "").split(TEMPLATE_SLOT)
+        numbers = payload[1 + TEMPLATE_ID.size :].decode("utf-8").split(TEMPLATE_SLOT)
+        pieces = [literals[0]]
+        for number, literal in zip(numbers, literals[1:]):
+            pieces += (number, literal)
+        return "".join(pieces)
+
+    def _payload(self, string_id: int) -> Optional[bytes]:
+        if string_id == NO_STRING or self._strings_map is None:
+            return None
+        (length,) = STRING_LENGTH.unpack_from(self._strings_map, string_id)
+        start = string_id + STRING_LENGTH.size
+        return self._strings_map[start : start + length]
+
+    def decision_timestamps(self) -> np.ndarray:
+        """Epoch-second timestamps of every decision (in append order)."""
+        return self.records["timestamp"][self._decision_rows]
+
+    def decision_actions(self) -> np.ndarray:
+        """Action codes (see brain.ACTION_NAMES) of every decision."""
+        return self.records["action"][self._decision_rows]
+
+    def decisions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[DecisionChain]:
+        """
+        Decisions with since <= timestamp < until, oldest first.
+
+        The range is found by binary search over decision timestamps, which
+        are monotonic as long as the wall clock doesn't step backwards.
+        With `limit`, the most recent `limit` decisions in range are returned.
+        """
+        timestamps = self.decision_timestamps()
+        lo = 0 if since is None else int(np.searchsorted(timestamps, since.timestamp(), "left"))
+        hi = len(timestamps) if until is None else int(
+            np.searchsorted(timestamps, until.timestamp(), "left")
+        )
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return [self._decision_at(int(row)) for row in self._decision_rows[lo:hi]]
+
+    def recent(self, limit: int) -> List[DecisionChain]:
+        """The last `limit` decisions, oldest first."""
+        return self.decisions(limit=limit)
+
+    def replay(self) -> Iterator[Tuple[Dict[str, SignalRecord], DecisionChain]]:
+        """
+        Re-walk history: yields the signals in effect at each decision
+        (latest per source) together with that decision.
+        """
+        signals: Dict[str, SignalRecord] = {}
+        records = self.records
+        for row in range(len(records)):
+            kind = records["kind"][row]
+            if kind == SIGNAL:
+                signal = self._signal_at(row)
+                signals[signal.source] = signal
+            elif kind == DECISION:
+                yield dict(signals), self._decision_at(row)
+
+    def _signal_at(self, row: int) -> SignalRecord:
+        record = self.records[row]
+        return SignalRecord(
+            self.string(int(record["key"])) or "",
+            float(record["value"]),
+            datetime.fromtimestamp(float(record["timestamp"])),
+            self.string(int(record["text"])),
+            bool(record["flags"] & FLAG_STALE),
+        )
+
+    def _decision_at(self, row: int) -> DecisionChain:
+        record = self.records[row]
+        weight_rows = self.records[row + 1 : row + 1 + int(record["value"])]
+        return DecisionChain(
+            timestamp=datetime.fromtimestamp(float(record["timestamp"])),
+            weights={
+                self.string(int(w["key"])) or "": float(w["value"]) for w in weight_rows
+            },
+            action=ACTION_NAMES[int(record["action"])],
+            reasoning=self.text(int(record["key"])) or "",
+            is_safe=bool(record["flags"] & FLAG_SAFE),
+            override_reason=self.string(int(record["aux"])),
+            explanation=self.text(int(record["text"])),
+        )
+
+    @staticmethod
+    def _map(path: str) -> mmap.mmap:
+        with open(path, "rb") as handle:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _unmap(mapped: Optional[mmap.mmap]) -> None:
+        if mapped is None:
+            return
+        try:
+            mapped.close()
+        except BufferError:
+            pass  # A caller still holds a view; the map is freed with it
@@ -6,14 +6,20 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from src.histogram import LatencyHistogram
+
+# Exposition buckets for event loop lag (ms): healthy lag is well under 1ms
+LOOP_LAG_BOUNDS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0)
 
 
 @dataclass
 class MetricsCollector:
     """
     Collects and aggregates performance metrics for monitoring.
-    Uses a sliding window to track recent performance.
+    Uses a sliding window to track recent performance, plus lifetime
+    log-bucketed histograms for decision, sensor and API latency percentiles.
     """
 
     window_size: int = 100
@@ -21,11 +27,26 @@ class MetricsCollector:
     # Decision cycle metrics
     decision_latencies: deque = field(default_factory=lambda: deque(maxlen=100))
     decision_count: int = 0
+    decision_histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     # Sensor metrics
     sensor_failures: Dict[str, int] = field(default_factory=dict)
     sensor_latencies: Dict[str, deque] = field(default_factory=dict)
+    sensor_histograms: Dict[str, LatencyHistogram] = field(default_factory=dict)
     sensor_success_count: Dict[str, int] = field(default_factory=dict)
+    sensor_hedges: Dict[str, int] = field(default_factory=dict)
+    sensor_stale: Dict[str, int] = field(default_factory=dict)
+    sensor_cache_hits: Dict[str, int] = field(default_factory=dict)
+    # Hedge input: latency of each sensor's first request alone, never the
+    # hedged result (which would pull the quantile down and hedge ever more)
+    sensor_primary_latencies: Dict[str, deque] = field(default_factory=dict)
+    sensor_primary_count: Dict[str, int] = field(default_factory=dict)
+    # (source, quantile) -> (primary count when computed, quantile ms)
+    _quantile_cache: Dict[Tuple[str, float], Tuple[int, float]] = field(
+        default_factory=dict, repr=False
+    )
+    breaker_states: Dict[str, str] = field(default_factory=dict)
+    breaker_trips: Dict[str, int] = field(default_factory=dict)
 
     # Safety gate metrics
     safety_overrides: int = 0
@@ -34,6 +55,22 @@ class MetricsCollector:
     # API metrics
     api_request_count: int = 0
     api_latencies: deque = field(default_factory=lambda: deque(maxlen=100))
+    api_histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    # HTTP connection pool metrics (per upstream host)
+    pool_wait_latencies: Dict[str, deque] = field(default_factory=dict)
+    pool_state: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    # Event loop health (LoopWatchdog)
+    loop_lag_histogram: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(exposition_bounds_ms=LOOP_LAG_BOUNDS_MS)
+    )
+    loop_stalls: int = 0
+
+    # Push stream metrics (SSE / WebSocket subscribers)
+    stream_clients: int = 0
+    stream_published: int = 0
+    stream_dropped: int = 0
 
     def __post_init__(self):
         """Initialize deques with correct maxlen."""
@@ -43,15 +80,18 @@ class MetricsCollector:
     def record_decision_latency(self, latency_ms: float) -> None:
         """Record a decision cycle latency."""
         self.decision_latencies.append(latency_ms)
+        self.decision_histogram.record(latency_ms)
         self.decision_count += 1
 
     def record_sensor_success(self, source: str, latency_ms: float) -> None:
         """Record a successful sensor fetch."""
         if source not in self.sensor_latencies:
             self.sensor_latencies[source] = deque(maxlen=self.window_size)
+            self.sensor_histograms[source] = LatencyHistogram()
             self.sensor_success_count[source] = 0
 
         self.sensor_latencies[source].append(latency_ms)
+        self.sensor_histograms[source].record(latency_ms)
         self.sensor_success_count[source] += 1
 
     def record_sensor_failure(self, source: str) -> None:
@@ -60,6 +100,58 @@ class MetricsCollector:
             self.sensor_failures[source] = 0
         self.sensor_failures[source] += 1
 
+    def record_sensor_hedge(self, source: str) -> None:
+        """Record a hedged (duplicate) sensor request."""
+        self.sensor_hedges[source] = self.sensor_hedges.get(source, 0) + 1
+
+    def record_sensor_stale(self, source: str) -> None:
+        """Record a sensor that missed the cycle deadline and was served stale."""
+        self.sensor_stale[source] = self.sensor_stale.get(source, 0) + 1
+
+    def record_sensor_cache_hit(self, source: str) -> None:
+        """Record a sensor read served from the signal cache."""
+        self.sensor_cache_hits[source] = self.sensor_cache_hits.get(source, 0) + 1
+
+    def record_breaker_state(self, source: str, state: str) -> None:
+        """Record a sensor circuit breaker's current state."""
+        if state == "open" and self.breaker_states.get(source) != "open":
+            self.breaker_trips[source] = self.breaker_trips.get(source, 0) + 1
+        self.breaker_states[source] = state
+
+    def record_sensor_primary_latency(self, source: str, latency_ms: float) -> None:
+        """
+        Record how long a sensor's first request took (or had been running
+        when a hedge beat it, a lower bound), for sensor_latency_quantile.
+        """
+        if source not in self.sensor_primary_latencies:
+            self.sensor_primary_latencies[source] = deque(maxlen=self.window_size)
+            self.sensor_primary_count[source] = 0
+        self.sensor_primary_latencies[source].append(latency_ms)
+        self.sensor_primary_count[source] += 1
+
+    def sensor_latency_quantile(
+        self, source: str, quantile: float, min_samples: int = 1, refresh_every: int = 10
+    ) -> Optional[float]:
+        """
+        First-request latency quantile (ms) over the sensor's recent window,
+        None if too few samples. The sorted window is recomputed at most once
+        per `refresh_every` new samples; in between the cached value is served.
+        """
+        latencies = self.sensor_primary_latencies.get(source)
+        if not latencies or len(latencies) < min_samples:
+            return None
+
+        recorded = self.sensor_primary_count[source]
+        key = (source, quantile)
+        cached = self._quantile_cache.get(key)
+        if cached is not None and recorded - cached[0] < refresh_every:
+            return cached[1]
+
+        ordered = sorted(latencies)
+        value = float(ordered[min(len(ordered) - 1, int(quantile * len(ordered)))])
+        self._quantile_cache[key] = (recorded, value)
+        return value
+
     def record_safety_override(self) -> None:
         """Record a safety gate override."""
         self.safety_overrides += 1
@@ -71,37 +163,56 @@ class MetricsCollector:
     def record_api_request(self, latency_ms: float) -> None:
         """Record an API request."""
         self.api_latencies.append(latency_ms)
+        self.api_histogram.record(latency_ms)
         self.api_request_count += 1
 
-    def get_decision_stats(self) -> Dict[str, float]:
-        """Get decision cycle statistics."""
-        if not self.decision_latencies:
-            return {"count": 0, "avg_latency_ms": 0.0, "max_latency_ms": 0.0, "min_latency_ms": 0.0}
+    def record_pool_wait(self, host: str, wait_ms: float) -> None:
+        """Record how long a request waited for a connection slot."""
+        if host not in self.pool_wait_latencies:
+            self.pool_wait_latencies[host] = deque(maxlen=self.window_size)
+        self.pool_wait_latencies[host].append(wait_ms)
 
-        latencies = list(self.decision_latencies)
-        return {
+    def record_pool_state(self, host: str, active: int, idle: int) -> None:
+        """Record the current active requests and idle connections for a host."""
+        self.pool_state[host] = {"active": active, "idle": idle}
+
+    def get_decision_stats(self) -> Dict[str, float]:
+        """
+        Get decision cycle statistics: avg/min/max over the recent window,
+        percentiles over all cycles since start.
+        """
+        latencies = self.decision_latencies
+        stats = {
             "count": self.decision_count,
-            "avg_latency_ms": sum(latencies) / len(latencies),
-            "max_latency_ms": max(latencies),
-            "min_latency_ms": min(latencies),
+            "avg_latency_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+            "max_latency_ms": max(latencies, default=0.0),
+            "min_latency_ms": min(latencies, default=0.0),
         }
+        stats.update(_percentile_stats(self.decision_histogram))
+        return stats
 
     def get_sensor_stats(self) -> Dict[str, Dict]:
         """Get sensor statistics for all sources."""
         stats = {}
-        for source in set(list(self.sensor_latencies.keys()) + list(self.sensor_failures.keys())):
+        sources = set(self.sensor_latencies) | set(self.sensor_failures) | set(self.sensor_cache_hits)
+        for source in sources:
             success_count = self.sensor_success_count.get(source, 0)
             failure_count = self.sensor_failures.get(source, 0)
             total = success_count + failure_count
 
-            latencies = list(self.sensor_latencies.get(source, []))
+            latencies = self.sensor_latencies.get(source, ())
             avg_latency = sum(latencies) / len(latencies) if latencies else 0.0
+            histogram = self.sensor_histograms.get(source)
 
             stats[source] = {
                 "success_count": success_count,
                 "failure_count": failure_count,
                 "success_rate": success_count / total if total > 0 else 0.0,
                 "avg_latency_ms": avg_latency,
+                "hedged_count": self.sensor_hedges.get(source, 0),
+                "stale_count": self.sensor_stale.get(source, 0),
+                "cache_hits": self.sensor_cache_hits.get(source, 0),
+                **(_percentile_stats(histogram) if histogram else {}),
             }
 
         return stats
@@ -117,13 +228,71 @@ class MetricsCollector:
 
     def get_api_stats(self) -> Dict[str, float]:
         """Get API statistics."""
-        if not self.api_latencies:
-            return {"request_count": self.api_request_count, "avg_latency_ms": 0.0}
+        latencies = self.api_latencies
+        stats = {
+            "request_count": self.api_request_count,
+            "avg_latency_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+        }
+        stats.update(_percentile_stats(self.api_histogram))
+        return stats
 
-        latencies = list(self.api_latencies)
+    def get_breaker_stats(self) -> Dict[str, Dict]:
+        """Get circuit breaker state and trip count per sensor."""
         return {
-            "request_count": self.api_request_count,
-            "avg_latency_ms": sum(latencies) / len(latencies),
+            source: {"state": state, "trips": self.breaker_trips.get(source, 0)}
+            for source, state in self.breaker_states.items()
+        }
+
+    def get_pool_stats(self) -> Dict[str, Dict]:
+        """Get connection pool statistics per upstream host."""
+        stats = {}
+        for host in set(self.pool_wait_latencies) | set(self.pool_state):
+            waits = self.pool_wait_latencies.get(host, ())
+            state = self.pool_state.get(host, {"active": 0, "idle": 0})
+            stats[host] = {
+                "active": state["active"],
+                "idle": state["idle"],
+                "avg_wait_ms": sum(waits) / len(waits) if waits else 0.0,
+                "max_wait_ms": max(waits, default=0.0),
+            }
+        return stats
+
+    def record_stream_clients(self, clients: int) -> None:
+        """Record the current number of push stream subscribers."""
+        self.stream_clients = clients
+
+    def record_stream_publish(self) -> None:
+        """Record one message fanned out to the push stream."""
+        self.stream_published += 1
+
+    def record_stream_drop(self) -> None:
+        """Record a subscriber disconnected for falling behind."""
+        self.stream_dropped += 1
+
+    def record_loop_lag(self, lag_ms: float) -> None:
+        """Record how late an event loop heartbeat woke up."""
+        self.loop_lag_histogram.record(lag_ms)
+
+    def record_loop_stall(self) -> None:
+        """Record the event loop blocked past the watchdog's stall threshold."""
+        self.loop_stalls += 1
+
+    def get_loop_stats(self) -> Dict[str, float]:
+        """Get event loop lag percentiles and stall count."""
+        histogram = self.loop_lag_histogram
+        return {
+            "heartbeats": histogram.count,
+            "stalls": self.loop_stalls,
+            "max_lag_ms": histogram.max_seen_ms,
+            **{f"{name}_lag_ms": value for name, value in histogram.percentiles().items()},
+        }
+
+    def get_stream_stats(self) -> Dict:
+        """Get push stream statistics."""
+        return {
+            "clients": self.stream_clients,
+            "published": self.stream_published,
+            "dropped_slow_clients": self.stream_dropped,
         }
 
     def get_all_stats(self) -> Dict:
@@ -133,10 +302,19 @@ class MetricsCollector:
             "sensors": self.get_sensor_stats(),
             "safety": self.get_safety_stats(),
             "api": self.get_api_stats(),
+            "pools": self.get_pool_stats(),
+            "breakers": self.get_breaker_stats(),
+            "streams": self.get_stream_stats(),
+            "event_loop": self.get_loop_stats(),
             "timestamp": datetime.now().isoformat(),
         }
 
 
+def _percentile_stats(histogram: LatencyHistogram) -> Dict[str, float]:
+    """{"p50_latency_ms": ..., "p999_latency_ms": ...} from a histogram."""
+    return {f"{name}_latency_ms": value for name, value in histogram.percentiles().items()}
+
+
 # Global metrics instance
 metrics = MetricsCollector()
 
@@ -0,0 +1,182 @@
+"""
+Sampling Profiler - Statistical stack sampler for the running event loop.
+A daemon thread reads the loop thread's stack via sys._current_frames() at a
+fixed interval and counts collapsed stacks, ready for flamegraph tools.
+"""
+
+import asyncio
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default task names ("Task-123") collapse to one root frame
+_ANONYMOUS_TASK = re.compile(r"^Task-\d+$")
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's Python stack every `interval` seconds.
+
+    Each sample is stored as a root-to-leaf stack string, prefixed with the
+    asyncio task that was running (so the orchestrator loop, sensor fetches
+    and API handlers separate into their own subtrees). The target thread
+    only pays for the GIL handoff; the stack walk happens on the sampler.
+
+    The sampler needs the GIL to read frames, and CPython only forces a
+    handoff after the switch interval (5ms by default), so samples would
+    otherwise cluster where the loop releases it voluntarily (in select).
+    While running, the switch interval is lowered to a tenth of `interval`.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        thread_id: Optional[int] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_depth: int = 128,
+    ):
+        """
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (default: the calling thread)
+            loop: Event loop whose current task labels each sample
+                  (default: the running loop, if any)
+            max_depth: Frames kept per sample, innermost first
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self.loop = loop
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self._labels: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        if self.running:
+            raise RuntimeError("profiler is already running")
+        self._stop.clear()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 10))
+        self.started_at = time.monotonic()
+        self.stopped_at = None
+        self._thread = threading.Thread(target=self._run, name="decisify-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+        self.stopped_at = time.monotonic()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Take one sample of the target thread (no-op if it has exited)."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+
+        frames = []
+        depth = 0
+        current: Optional[FrameType] = frame
+        while current is not None and depth < self.max_depth:
+            frames.append(self._label(current.f_code))
+            current = current.f_back
+            depth += 1
+        frames.append(self._task_label())
+        frames.reverse()
+
+        self.stacks[";".join(frames)] += 1
+        self.samples += 1
+
+    def _label(self, code: CodeType) -> str:
+        """`qualname (file:line)` for a code object, cached."""
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            filename = os.path.basename(code.co_filename)
+            label = self._labels[code] = f"{name} ({filename}:{code.co_firstlineno})"
+        return label
+
+    def _task_label(self) -> str:
+        """Root frame naming the loop's current task."""
+        if self.loop is None:
+            return "thread"
+        task = asyncio.current_task(self.loop)
+        if task is None:
+            return "event-loop"
+        name = task.get_name()
+        return "task:" + ("<anonymous>" if _ANONYMOUS_TASK.match(name) else name)
+
+    def collapsed(self) -> str:
+        """
+        Brendan Gregg's collapsed format, one `frame;frame;... count` line
+        per distinct stack, most frequent first (flamegraph.pl, speedscope).
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, float]:
+        """Sample count, distinct stacks and wall-clock duration."""
+        end = self.stopped_at if self.stopped_at is not None else time.monotonic()
+        return {
+            "samples": self.samples,
+            "stacks": len(self.stacks),
+            "duration_s": end - self.started_at if self.started_at is not None else 0.0,
+        }
+
+
+# Profile currently running through profile_loop(), if any
+_active: Optional[SamplingProfiler] = None
+
+
+async def profile_loop(seconds: float, interval: float = 0.005) -> SamplingProfiler:
+    """
+    Sample the running event loop for `seconds`, then return the profiler.
+    Only one profile runs at a time; raises RuntimeError if one is active.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("a profile is already running")
+
+    profiler = SamplingProfiler(interval=interval)
+    _active = profiler
+    profiler.start()
+    logger.info(f"Profiling event loop for {seconds:.1f}s every {interval * 1000:.1f}ms")
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+        _active = None
+    logger.info(f"Profile finished: {profiler.samples} samples, {len(profiler.stacks)} stacks")
+    return profiler
@@ -0,0 +1,245 @@
+"""
+Prometheus Exposition - Render MetricsCollector in the Prometheus text format.
+Reads the collector's running counters and coarse histogram buckets directly,
+so a scrape costs O(number of series) and never touches latency samples.
+"""
+
+import math
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.histogram import LatencyHistogram
+from src.metrics import MetricsCollector
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Label value that absorbs sources/hosts beyond the per-label limit
+OTHER_LABEL = "_other"
+
+Buckets = List[Tuple[float, int]]
+
+
+def render_prometheus(metrics: MetricsCollector, max_label_values: int = 50) -> str:
+    """
+    Text exposition of all collector metrics.
+
+    At most `max_label_values` sensor sources (and pool hosts) get their own
+    label value, in first-seen order; the rest are summed under OTHER_LABEL
+    so a misbehaving sensor registry cannot blow up series cardinality.
+    """
+    out = _Exposition()
+
+    out.counter("decisify_decisions_total", "Decision cycles completed", metrics.decision_count)
+    out.histogram(
+        "decisify_decision_latency_seconds", "Decision cycle latency", metrics.decision_histogram
+    )
+    out.counter("decisify_api_requests_total", "API requests served", metrics.api_request_count)
+    out.histogram("decisify_api_latency_seconds", "API request latency", metrics.api_histogram)
+
+    out.counter(
+        "decisify_safety_passes_total", "Decisions passed by the safety gate", metrics.safety_passes
+    )
+    out.counter(
+        "decisify_safety_overrides_total", "Decisions overridden to HOLD", metrics.safety_overrides
+    )
+
+    # Per-sensor series, label values bounded
+    sources = _label_values(
+        max_label_values,
+        metrics.sensor_success_count,
+        metrics.sensor_failures,
+        metrics.sensor_cache_hits,
+        metrics.breaker_states,
+    )
+    for name, help_text, counts in (
+        (
+            "decisify_sensor_success_total",
+            "Successful sensor fetches",
+            metrics.sensor_success_count,
+        ),
+        ("decisify_sensor_failures_total", "Failed sensor fetches", metrics.sensor_failures),
+        ("decisify_sensor_hedges_total", "Hedged sensor requests", metrics.sensor_hedges),
+        (
+            "decisify_sensor_stale_total",
+            "Signals served stale after the deadline",
+            metrics.sensor_stale,
+        ),
+        (
+            "decisify_sensor_cache_hits_total",
+            "Sensor reads served from cache",
+            metrics.sensor_cache_hits,
+        ),
+        (
+            "decisify_breaker_trips_total",
+            "Circuit breaker transitions to open",
+            metrics.breaker_trips,
+        ),
+    ):
+        out.labeled("counter", name, help_text, "source", _fold(counts, sources))
+
+    out.labeled(
+        "gauge",
+        "decisify_breaker_open",
+        "Whether the sensor's circuit breaker is open",
+        "source",
+        _fold({s: int(state == "open") for s, state in metrics.breaker_states.items()}, sources),
+    )
+    out.labeled_histograms(
+        "decisify_sensor_latency_seconds",
+        "Sensor fetch latency",
+        "source",
+        _fold_histograms(metrics.sensor_histograms, sources),
+    )
+
+    hosts = _label_values(max_label_values, metrics.pool_state)
+    for key, help_text in (
+        ("active", "In-flight requests"),
+        ("idle", "Idle keep-alive connections"),
+    ):
+        out.labeled(
+            "gauge",
+            f"decisify_pool_{key}_connections",
+            f"{help_text} per upstream host",
+            "host",
+            _fold({host: state[key] for host, state in metrics.pool_state.items()}, hosts),
+        )
+
+    out.histogram(
+        "decisify_event_loop_lag_seconds",
+        "Event loop heartbeat lag",
+        metrics.loop_lag_histogram,
+    )
+    out.counter(
+        "decisify_event_loop_stalls_total",
+        "Event loop blocked past the watchdog threshold",
+        metrics.loop_stalls,
+    )
+
+    out.gauge("decisify_stream_clients", "Connected push stream clients", metrics.stream_clients)
+    out.counter(
+        "decisify_stream_published_total",
+        "Messages fanned out to push streams",
+        metrics.stream_published,
+    )
+    out.counter(
+        "decisify_stream_dropped_total", "Slow stream clients disconnected", metrics.stream_dropped
+    )
+    return out.text()
+
+
+def _label_values(limit: int, *series: Mapping[str, object]) -> Dict[str, str]:
+    """Label value per key: the key itself for the first `limit` keys seen, else OTHER_LABEL."""
+    labels: Dict[str, str] = {}
+    for mapping in series:
+        for key in mapping:
+            if key not in labels:
+                labels[key] = key if len(labels) < limit else OTHER_LABEL
+    return labels
+
+
+def _fold(values: Mapping[str, float], labels: Mapping[str, str]) -> Dict[str, float]:
+    """Sum values under their bounded label."""
+    folded: Dict[str, float] = {}
+    for key, value in values.items():
+        label = labels.get(key, OTHER_LABEL)
+        folded[label] = folded.get(label, 0) + value
+    return folded
+
+
+def _fold_histograms(
+    histograms: Mapping[str, LatencyHistogram], labels: Mapping[str, str]
+) -> Dict[str, Tuple[Buckets, float]]:
+    """(cumulative buckets, sum ms) per bounded label, summing folded histograms."""
+    folded: Dict[str, Tuple[Buckets, float]] = {}
+    for key, histogram in histograms.items():
+        label = labels.get(key, OTHER_LABEL)
+        buckets = histogram.cumulative_buckets()
+        if label in folded:
+            previous, total = folded[label]
+            buckets = [(bound, a + b) for (bound, a), (_, b) in zip(previous, buckets)]
+            folded[label] = (buckets, total + histogram.total_ms)
+        else:
+            folded[label] = (buckets, histogram.total_ms)
+    return folded
+
+
+class _Exposition:
+    """Line builder for the text format (one HELP/TYPE header per metric family)."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def _header(self, kind: str, name: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def counter(self, name: str, help_text: str, value: float) -> None:
+        self._header("counter", name, help_text)
+        self.lines.append(f"{name} {_format_number(value)}")
+
+    def gauge(self, name: str, help_text: str, value: float) -> None:
+        self._header("gauge", name, help_text)
+        self.lines.append(f"{name} {_format_number(value)}")
+
+    def labeled(
+        self, kind: str, name: str, help_text: str, label: str, values: Mapping[str, float]
+    ) -> None:
+        if not values:
+            return
+        self._header(kind, name, help_text)
+        for label_value, value in values.items():
+            self.lines.append(f"{name}{_labels([(label, label_value)])} {_format_number(value)}")
+
+    def histogram(self, name: str, help_text: str, histogram: LatencyHistogram) -> None:
+        self._header("histogram", name, help_text)
+        self._histogram_series(name, histogram.cumulative_buckets(), histogram.total_ms)
+
+    def labeled_histograms(
+        self,
+        name: str,
+        help_text: str,
+        label: str,
+        histograms: Mapping[str, Tuple[Buckets, float]],
+    ) -> None:
+        if not histograms:
+            return
+        self._header("histogram", name, help_text)
+        for label_value, (buckets, total_ms) in histograms.items():
+            self._histogram_series(name, buckets, total_ms, (label, label_value))
+
+    def _histogram_series(
+        self,
+        name: str,
+        buckets: Buckets,
+        total_ms: float,
+        label: Optional[Tuple[str, str]] = None,
+    ) -> None:
+        """Bucket, sum and count lines, with latencies converted to seconds."""
+        base: Sequence[Tuple[str, str]] = (label,) if label else ()
+        for bound_ms, cumulative in buckets:
+            le = _format_number(bound_ms / 1000.0)
+            self.lines.append(f"{name}_bucket{_labels([*base, ('le', le)])} {cumulative}")
+        self.lines.append(f"{name}_sum{_labels(base)} {_format_number(total_ms / 1000.0)}")
+        self.lines.append(f"{name}_count{_labels(base)} {buckets[-1][1]}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    """`{k="v",...}` with values escaped, or "" for no labels."""
+    rendered = ",".join(f'{key}="{_escape(value)}"' for key, value in pairs)
+    return f"{{{rendered}}}" if rendered else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
@@ -0,0 +1,72 @@
+"""
+Response Cache - Pre-encoded API payloads, rendered once per decision cycle.
+Handlers serve the cached bytes as-is and answer If-None-Match with 304,
+so API cost no longer scales with how often clients poll.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from fastapi.responses import Response
+
+from src.serialization import dumps
+
+
+class RenderedResponse:
+    """One encoded payload and its validator, tagged with the cycle it came from."""
+
+    __slots__ = ("version", "body", "etag")
+
+    def __init__(self, version: int, body: bytes, etag: str):
+        self.version = version
+        self.body = body
+        self.etag = etag
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header already names this version."""
+        if not if_none_match:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or self.etag in candidates
+
+    def respond(self, if_none_match: Optional[str] = None) -> Response:
+        """200 with the cached bytes, or an empty 304 if the client is current."""
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """
+    Named payloads for the current cycle.
+
+    The orchestrator calls publish() once per cycle with every payload;
+    the whole set is swapped in at once, so a handler never mixes cycles.
+    ETags combine a per-process boot id with the cycle number, so a restart
+    (which resets the cycle count) can't produce false 304s.
+    """
+
+    def __init__(self) -> None:
+        self._boot_id = f"{time.time_ns():x}"
+        self._entries: Dict[str, RenderedResponse] = {}
+        self.version = 0
+
+    def publish(self, version: int, payloads: Dict[str, Any]) -> None:
+        """Encode and install the payloads for a new cycle."""
+        etag = f'"{self._boot_id}-{version}"'
+        self._entries = {
+            name: RenderedResponse(version, self._encode(payload), etag)
+            for name, payload in payloads.items()
+        }
+        self.version = version
+
+    def get(self, name: str) -> Optional[RenderedResponse]:
+        """The cached response for `name`, if one has been rendered."""
+        return self._entries.get(name)
+
+    @staticmethod
+    def _encode(payload: Any) -> bytes:
+        if isinstance(payload, bytes):
+            return payload
+        return dumps(payload)
@@ -3,14 +3,24 @@ Safety Gate - Deterministic Guardrails & Execution Logic
 Validates decisions against safety rules and overrides when necessary.
 """
 
-from typing import Dict
+from typing import Dict, Mapping, Optional, Tuple
 
+import numpy as np
+
+from src.brain import BUY, HOLD, SELL
 from src.logger import get_logger
 from src.metrics import get_metrics
-from src.schemas import DecisionChain, Signal
+from src.schemas import DecisionChain, SignalLike
 
 logger = get_logger(__name__)
 
+# Override codes produced by SafetyGate.validate_batch (index into OVERRIDE_REASONS)
+OVERRIDE_NONE = 0
+OVERRIDE_BUY_VOLATILITY = 1
+OVERRIDE_SELL_VOLATILITY = 2
+OVERRIDE_LOW_CONFIDENCE = 3
+OVERRIDE_REASONS = ("none", "buy_volatility", "sell_volatility", "low_confidence")
+
 
 class SafetyGate:
     """
@@ -35,7 +45,7 @@ class SafetyGate:
         self.min_confidence_threshold = min_confidence_threshold
         self.metrics = get_metrics()
 
-    def validate(self, decision: DecisionChain, signals: Dict[str, Signal]) -> DecisionChain:
+    def validate(self, decision: DecisionChain, signals: Mapping[str, SignalLike]) -> DecisionChain:
         """
         Validate and potentially override the decision based on safety rules.
 
@@ -46,40 +56,28 @@ class SafetyGate:
 
         # Rule 1: Block BUY if volatility too high
         if decision.action == "BUY" and volatility > self.max_volatility_for_buy:
-            reason = (
-                f"Volatility {volatility:.2%} exceeds BUY threshold "
-                f"{self.max_volatility_for_buy:.2%}"
-            )
             return self._override_decision(
                 decision,
                 new_action="HOLD",
-                reason=reason,
+                reason=self.describe_override(OVERRIDE_BUY_VOLATILITY, volatility),
             )
 
         # Rule 2: Block SELL if volatility too high (might be panic selling)
         if decision.action == "SELL" and volatility > self.max_volatility_for_sell:
-            reason = (
-                f"Volatility {volatility:.2%} exceeds SELL threshold "
-                f"{self.max_volatility_for_sell:.2%}"
-            )
             return self._override_decision(
                 decision,
                 new_action="HOLD",
-                reason=reason,
+                reason=self.describe_override(OVERRIDE_SELL_VOLATILITY, volatility),
             )
 
         # Rule 3: Check confidence - if no signal has sufficient weight, default to HOLD
         if decision.weights:
             max_weight = max(decision.weights.values())
             if max_weight < self.min_confidence_threshold and decision.action != "HOLD":
-                reason = (
-                    f"Low confidence: max weight {max_weight:.2%} below threshold "
-                    f"{self.min_confidence_threshold:.2%}"
-                )
                 return self._override_decision(
                     decision,
                     new_action="HOLD",
-                    reason=reason,
+                    reason=self.describe_override(OVERRIDE_LOW_CONFIDENCE, volatility, max_weight),
                 )
 
         # Rule 4: If no signals available, must be HOLD
@@ -94,7 +92,70 @@ class SafetyGate:
         logger.debug(f"Safety check passed for action: {decision.action}")
         return decision
 
-    def _get_volatility(self, signals: Dict[str, Signal]) -> float:
+    def validate_batch(
+        self, actions: np.ndarray, weights: np.ndarray, volatility: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `validate` over N decisions (backtests, sweeps).
+
+        Applies the same rules in the same order to whole arrays and returns
+        (final action codes, override codes). Live metrics are not touched.
+
+        Args:
+            actions: (N,) action codes from AttentionFusionEngine.decide_arrays
+            weights: (N, K) attention weights, zero for missing sources
+            volatility: (N,) volatility signal per decision (0.0 if absent)
+        """
+        actions = np.asarray(actions)
+        volatility = np.asarray(volatility, dtype=np.float64)
+        max_weight = weights.max(axis=1) if weights.shape[1] else np.zeros(len(actions))
+
+        overrides = np.select(
+            [
+                (actions == BUY) & (volatility > self.max_volatility_for_buy),
+                (actions == SELL) & (volatility > self.max_volatility_for_sell),
+                (actions != HOLD) & (max_weight < self.min_confidence_threshold),
+            ],
+            [OVERRIDE_BUY_VOLATILITY, OVERRIDE_SELL_VOLATILITY, OVERRIDE_LOW_CONFIDENCE],
+            default=OVERRIDE_NONE,
+        ).astype(np.int8)
+
+        final_actions = np.where(overrides != OVERRIDE_NONE, HOLD, actions).astype(np.int8)
+        return final_actions, overrides
+
+    def override_code(self, action: int, volatility: float, max_weight: Optional[float]) -> int:
+        """
+        Scalar form of rules 1-3 for one decision, as an override code.
+        `max_weight` is None for a decision without weights.
+        """
+        if action == BUY and volatility > self.max_volatility_for_buy:
+            return OVERRIDE_BUY_VOLATILITY
+        if action == SELL and volatility > self.max_volatility_for_sell:
+            return OVERRIDE_SELL_VOLATILITY
+        if max_weight is not None and action != HOLD and max_weight < self.min_confidence_threshold:
+            return OVERRIDE_LOW_CONFIDENCE
+        return OVERRIDE_NONE
+
+    def describe_override(self, code: int, volatility: float, max_weight: float = 0.0) -> str:
+        """The override_reason `validate` reports for an override code."""
+        if code == OVERRIDE_BUY_VOLATILITY:
+            return (
+                f"Volatility {volatility:.2%} exceeds BUY threshold "
+                f"{self.max_volatility_for_buy:.2%}"
+            )
+        if code == OVERRIDE_SELL_VOLATILITY:
+            return (
+                f"Volatility {volatility:.2%} exceeds SELL threshold "
+                f"{self.max_volatility_for_sell:.2%}"
+            )
+        if code == OVERRIDE_LOW_CONFIDENCE:
+            return (
+                f"Low confidence: max weight {max_weight:.2%} below threshold "
+                f"{self.min_confidence_threshold:.2%}"
+            )
+        raise ValueError(f"No override reason for code {code}")
+
+    def _get_volatility(self, signals: Mapping[str, SignalLike]) -> float:
         """
         Extract volatility value from signals.
         Returns 0.0 if volatility signal not found.
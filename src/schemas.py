@@ -1,10 +1,13 @@
 """
 Data models for Decisify - The Source of Truth
-All data structures use strict Pydantic V2 typing for safety and validation.
+All data structures use strict Pydantic V2 typing for safety and validation,
+except SignalRecord, the unvalidated signal used inside the decision loop.
 """
 
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Deque, Dict, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -34,6 +37,53 @@ class Signal(BaseModel):
         default_factory=datetime.now, description="When this signal was captured"
     )
     raw_content: Optional[str] = Field(None, description="Original text/data for traceability")
+    stale: bool = Field(
+        default=False, description="Served from the last known value after the sensor missed its deadline"
+    )
+
+
+@dataclass(slots=True)
+class SignalRecord:
+    """
+    Validation-free Signal for the hot path (sensors, brain, safety, replay).
+
+    Same fields as Signal, but building one is a plain attribute store.
+    Convert with from_model() / to_model() at the API and persistence edges;
+    code that only reads the fields accepts either type.
+    """
+
+    source: str
+    value: float
+    timestamp: datetime = field(default_factory=datetime.now)
+    raw_content: Optional[str] = None
+    stale: bool = False
+
+    @classmethod
+    def from_model(cls, signal: Signal) -> "SignalRecord":
+        """Record from a validated Signal."""
+        return cls(signal.source, signal.value, signal.timestamp, signal.raw_content, signal.stale)
+
+    def to_model(self) -> Signal:
+        """
+        The equivalent Signal. Skips validation: the fields were produced by
+        our own code, not parsed from user input.
+        """
+        return Signal.model_construct(
+            source=self.source,
+            value=self.value,
+            timestamp=self.timestamp,
+            raw_content=self.raw_content,
+            stale=self.stale,
+        )
+
+
+# What the decision path reads: only the shared fields, so either type works
+SignalLike = Union[Signal, SignalRecord]
+
+
+def as_signal(signal: SignalLike) -> Signal:
+    """The Pydantic model for a signal of either type."""
+    return signal if isinstance(signal, Signal) else signal.to_model()
 
 
 class DecisionChain(BaseModel):
@@ -75,6 +125,8 @@ class SystemState(BaseModel):
     """
 
     latest_decision: Optional[DecisionChain] = None
+    # Last few decisions, oldest first (in memory; the journal keeps the rest)
+    recent_decisions: Deque[DecisionChain] = Field(default_factory=lambda: deque(maxlen=10))
     latest_signals: Dict[str, Signal] = Field(default_factory=dict)
     cycle_count: int = 0
     last_update: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,227 @@
+"""
+Sensor Registry - Pluggable sensor classes with per-sensor budgets.
+Sensors are registered by name (decorator, entry point or "module:Class" path)
+and instantiated from config, each with its own concurrency, rate and timeout.
+"""
+
+import asyncio
+import importlib
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+import httpx
+
+from src.http_pool import ConnectionPool
+from src.logger import get_logger
+from src.schemas import SignalRecord
+
+logger = get_logger(__name__)
+
+ENTRY_POINT_GROUP = "decisify.sensors"
+
+SensorSpec = Union[str, Dict[str, Any]]
+
+
+class RateBudget:
+    """
+    Token-bucket request budget.
+    Allows `burst` requests at once and refills at `rate` requests per second.
+    A rate of 0 disables the budget.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available and consume it."""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class Sensor(ABC):
+    """
+    Base class for pluggable sensors.
+
+    Subclasses set `name` and must implement `fetch` (a subclass without it
+    fails at instantiation, not on its first poll). Class attributes provide the
+    defaults for the per-sensor budget and cache freshness; each can be
+    overridden per instance (e.g. from a config spec).
+    """
+
+    name: str = ""
+    max_concurrency: int = 2  # One request plus one hedge
+    rate_limit: float = 0.0  # Requests per second, 0 = unlimited
+    burst: int = 1
+    timeout: Optional[float] = None  # None = use the hub's sensor timeout
+    cache_ttl: float = 0.0  # Seconds a signal stays fresh, 0 = always refetch
+    cache_max_stale: float = 0.0  # Extra seconds served while revalidating
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_stale: Optional[float] = None,
+        **options: Any,
+    ):
+        self.name = name or self.name or type(self).__name__
+        self.max_concurrency = max_concurrency or self.max_concurrency
+        self.rate_limit = self.rate_limit if rate_limit is None else rate_limit
+        self.burst = burst or self.burst
+        self.timeout = timeout if timeout is not None else self.timeout
+        self.cache_ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+        self.cache_max_stale = self.cache_max_stale if cache_max_stale is None else cache_max_stale
+        self.options = options
+
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.budget = RateBudget(self.rate_limit, self.burst)
+
+    @abstractmethod
+    async def fetch(self, client: ConnectionPool) -> SignalRecord:
+        """Fetch one signal. Raise on failure; the hub handles retries."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+
+class HttpJsonSensor(Sensor):
+    """
+    Polls a JSON endpoint through the hub's shared connection pool.
+
+    The default parser expects {"value": float, "raw_content": str?};
+    subclasses override `parse` for other payloads.
+    """
+
+    name = "http_json"
+    url: str = ""
+
+    def __init__(self, url: Optional[str] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.url = url or self.url
+        if not self.url:
+            raise ValueError(f"Sensor '{self.name}' needs a url")
+
+    async def fetch(self, client: ConnectionPool) -> SignalRecord:
+        response = await client.get(self.url)
+        response.raise_for_status()
+        return self.parse(response)
+
+    def parse(self, response: httpx.Response) -> SignalRecord:
+        """Map an upstream response to a SignalRecord."""
+        data = response.json()
+        raw_content = data.get("raw_content")
+        return SignalRecord(
+            source=self.name,
+            value=float(data["value"]),
+            raw_content=None if raw_content is None else str(raw_content),
+        )
+
+
+class SensorRegistry:
+    """
+    Maps sensor type names to Sensor classes.
+
+    Types resolve in order: explicitly registered names, installed
+    `decisify.sensors` entry points, then "package.module:ClassName" paths.
+    """
+
+    def __init__(self) -> None:
+        self._classes: Dict[str, Type[Sensor]] = {}
+        self._entry_points_loaded = False
+
+    def register(
+        self, name: Optional[str] = None
+    ) -> Callable[[Type[Sensor]], Type[Sensor]]:
+        """Class decorator registering a sensor under `name` (default: cls.name)."""
+
+        def decorator(cls: Type[Sensor]) -> Type[Sensor]:
+            self._classes[name or cls.name] = cls
+            return cls
+
+        return decorator
+
+    def names(self) -> List[str]:
+        """All registered sensor type names."""
+        self.load_entry_points()
+        return list(self._classes)
+
+    def load_entry_points(self) -> None:
+        """Register sensors advertised by installed packages (once)."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                self._classes.setdefault(entry_point.name, entry_point.load())
+            except Exception as e:
+                logger.error(f"Failed to load sensor entry point '{entry_point.name}': {e}")
+
+    def get(self, type_name: str) -> Type[Sensor]:
+        """Resolve a sensor type name or "module:Class" path to a class."""
+        if type_name not in self._classes:
+            self.load_entry_points()
+        if type_name in self._classes:
+            return self._classes[type_name]
+
+        if ":" in type_name:
+            module_name, _, class_name = type_name.partition(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+            if not (isinstance(cls, type) and issubclass(cls, Sensor)):
+                raise TypeError(f"'{type_name}' is not a Sensor subclass")
+            return cls
+
+        raise KeyError(f"Unknown sensor type '{type_name}'")
+
+    def build(self, spec: SensorSpec) -> Sensor:
+        """
+        Instantiate a sensor from a spec.
+
+        A spec is either a type name, or a dict with a "type" key plus any
+        Sensor constructor arguments, e.g.
+        {"type": "news_feed", "name": "news_eu", "rate_limit": 2, "timeout": 1.5}
+        """
+        if isinstance(spec, str):
+            return self.get(spec)()
+
+        options = dict(spec)
+        type_name = options.pop("type")
+        return self.get(type_name)(**options)
+
+    def build_all(self, specs: List[SensorSpec]) -> List[Sensor]:
+        """Instantiate every spec, rejecting duplicate sensor names."""
+        sensors = [self.build(spec) for spec in specs]
+        duplicates = [n for n, count in Counter(s.name for s in sensors).items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Duplicate sensor names: {sorted(duplicates)}")
+        return sensors
+
+
+# Global registry instance
+registry = SensorRegistry()
+registry.register()(HttpJsonSensor)
+
+
+def get_registry() -> SensorRegistry:
+    """Get the global sensor registry."""
+    return registry
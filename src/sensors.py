@@ -4,25 +4,168 @@ Handles partial failures gracefully without crashing the decision loop.
 """
 
 import asyncio
+import functools
 import random
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
+from src.circuit_breaker import CircuitBreaker
 from src.config import get_settings
+from src.http_pool import ConnectionPool
 from src.logger import get_logger
 from src.metrics import Timer, get_metrics
-from src.schemas import Signal
+from src.schemas import SignalRecord
+from src.sensor_registry import Sensor, SensorSpec, registry
+from src.tracing import get_tracer
 
 logger = get_logger(__name__)
 
 
+@registry.register()
+class TwitterSentimentSensor(Sensor):
+    """
+    Mock: Simulates fetching sentiment from social media.
+    In production, this would call Twitter API or sentiment analysis service.
+    """
+
+    name = "twitter_sentiment"
+
+    async def fetch(self, client: ConnectionPool) -> SignalRecord:
+        await asyncio.sleep(random.uniform(0.1, 0.5))  # Simulate network delay
+
+        # Mock sentiment score: -1 (bearish) to +1 (bullish)
+        sentiment = random.uniform(-1.0, 1.0)
+
+        mock_tweets = [
+            "Market looking bullish! 🚀",
+            "Concerns about volatility today...",
+            "Strong fundamentals, holding long term",
+            "Profit taking in progress",
+        ]
+
+        return SignalRecord(
+            source=self.name,
+            value=sentiment,
+            timestamp=datetime.now(),
+            raw_content=random.choice(mock_tweets),
+        )
+
+
+@registry.register()
+class PriceVolatilitySensor(Sensor):
+    """
+    Mock: Simulates fetching price volatility metrics.
+    In production, this would calculate from real-time price data.
+    """
+
+    name = "price_volatility"
+    # Slow-moving compared with the loop: reuse for 10s, revalidate for 50s more
+    cache_ttl = 10.0
+    cache_max_stale = 50.0
+
+    async def fetch(self, client: ConnectionPool) -> SignalRecord:
+        await asyncio.sleep(random.uniform(0.1, 0.3))
+
+        # Mock volatility: 0 (stable) to 1 (highly volatile)
+        volatility = random.uniform(0.0, 0.15)
+
+        return SignalRecord(
+            source=self.name,
+            value=volatility,
+            timestamp=datetime.now(),
+            raw_content=f"Volatility: {volatility:.2%}",
+        )
+
+
+@registry.register()
+class NewsSentimentSensor(Sensor):
+    """
+    Mock: Simulates scraping news headlines and analyzing sentiment.
+    In production, this would use BeautifulSoup + NLP models.
+    """
+
+    name = "news_feed"
+
+    async def fetch(self, client: ConnectionPool) -> SignalRecord:
+        await asyncio.sleep(random.uniform(0.2, 0.6))
+
+        # Mock news sentiment: -1 (negative) to +1 (positive)
+        sentiment = random.uniform(-0.5, 0.8)
+
+        mock_headlines = [
+            "Tech sector shows strong growth",
+            "Regulatory concerns emerge",
+            "Analysts upgrade price targets",
+            "Market consolidation continues",
+        ]
+
+        return SignalRecord(
+            source=self.name,
+            value=sentiment,
+            timestamp=datetime.now(),
+            raw_content=random.choice(mock_headlines),
+        )
+
+
+class SignalCache:
+    """
+    Stale-while-revalidate cache holding the latest good signal per source.
+
+    Entries younger than the sensor's `cache_ttl` are fresh and served
+    without a fetch. Entries up to `cache_ttl + cache_max_stale` old are
+    still served immediately while a background refresh runs. Anything
+    older is a miss. Cached signals keep their original timestamp, so the
+    brain's recency decay (exp(-age/60)) sees their true age.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._entries: Dict[str, Tuple[SignalRecord, float]] = {}
+
+    def put(self, source: str, signal: SignalRecord) -> None:
+        """Store a freshly fetched signal."""
+        self._entries[source] = (signal, self.clock())
+
+    def latest(self, source: str) -> Optional[SignalRecord]:
+        """Most recent signal regardless of age."""
+        entry = self._entries.get(source)
+        return entry[0] if entry else None
+
+    def lookup(
+        self, source: str, ttl: float, max_stale: float
+    ) -> Tuple[Optional[SignalRecord], bool]:
+        """
+        Returns (signal, fresh). The signal is None on a miss; `fresh` is False
+        when the entry is past its TTL and should be revalidated.
+        """
+        entry = self._entries.get(source)
+        if entry is None or ttl <= 0:
+            return None, False
+
+        signal, stored_at = entry
+        age = self.clock() - stored_at
+        if age < ttl:
+            return signal, True
+        if age < ttl + max_stale:
+            return signal, False
+        return None, False
+
+
+DEFAULT_SENSORS: List[SensorSpec] = ["twitter_sentiment", "price_volatility", "news_feed"]
+
+
 class AsyncPerceptionHub:
     """
     Orchestrates multiple async sensors and aggregates their signals.
     If a sensor fails, returns a null signal instead of raising exceptions.
     Includes retry logic and performance tracking.
+
+    Sensors come from the registry (SENSORS config, default: the three mock
+    feeds). Each sensor has its own semaphore, rate budget and timeout, and a
+    hub-wide semaphore caps in-flight fetches across all sensors.
     """
 
     def __init__(
@@ -30,45 +173,279 @@ class AsyncPerceptionHub:
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
+        sensors: Optional[List[Sensor]] = None,
+        max_concurrency: Optional[int] = None,
     ):
         settings = get_settings()
         self.timeout = timeout or settings.sensor_timeout
         self.max_retries = max_retries or settings.sensor_max_retries
         self.retry_delay = retry_delay or settings.sensor_retry_delay
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        self.client = ConnectionPool(timeout=self.timeout)
         self.metrics = get_metrics()
+        self.tracer = get_tracer()
+
+        if sensors is None:
+            sensors = registry.build_all(settings.sensors or DEFAULT_SENSORS)
+        self.sensors: Dict[str, Sensor] = {sensor.name: sensor for sensor in sensors}
+        self.concurrency = asyncio.Semaphore(max_concurrency or settings.sensor_max_concurrency)
 
-    async def fetch_all(self) -> Dict[str, Signal]:
+        self.hedge_enabled = settings.sensor_hedge_enabled
+        self.hedge_quantile = settings.sensor_hedge_quantile
+        self.hedge_min_delay = settings.sensor_hedge_min_delay
+        self.hedge_min_samples = settings.sensor_hedge_min_samples
+        self.cycle_deadline = settings.cycle_deadline
+
+        self.settings = settings
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+        self._inflight: Dict[str, "asyncio.Task[Optional[SignalRecord]]"] = {}
+        self.cache = SignalCache()
+
+    async def fetch_all(self, deadline: Optional[float] = None) -> Dict[str, SignalRecord]:
         """
         Fetch signals from all sensors concurrently.
-        Returns a dict mapping source name to Signal (or null signal on failure).
+        Returns a dict mapping source name to SignalRecord (or null signal on failure).
+
+        Sensors with a cache TTL are served from the signal cache while it is
+        fresh, and stale-while-revalidate past that: the cached signal is
+        returned at once and a background fetch refreshes it.
+
+        Waits at most `deadline` seconds (default: CYCLE_DEADLINE, 0 = no limit).
+        Sensors still running by then are served from their last known signal,
+        marked stale; their fetch keeps running and is reused by the next cycle
+        instead of starting a duplicate.
         """
-        tasks = [
-            self._safe_fetch("twitter_sentiment", self._fetch_twitter_sentiment),
-            self._safe_fetch("price_volatility", self._fetch_price_volatility),
-            self._safe_fetch("news_feed", self._fetch_news_sentiment),
+        deadline = self.cycle_deadline if deadline is None else deadline
+
+        served: Dict[str, SignalRecord] = {}
+        tasks: Dict[str, "asyncio.Task[Optional[SignalRecord]]"] = {}
+        for name, fetch in self._fetchers().items():
+            sensor = self.sensors[name]
+            cached, fresh = self.cache.lookup(name, sensor.cache_ttl, sensor.cache_max_stale)
+            if cached is not None:
+                self.metrics.record_sensor_cache_hit(name)
+                served[name] = cached
+                if not fresh:
+                    self._start_fetch(name, fetch)  # Revalidate in the background
+                continue
+            tasks[name] = self._start_fetch(name, fetch)
+
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=deadline or None)
+
+        for name, task in tasks.items():
+            signal = task.result() if task.done() else self._stale_signal(name)
+            if signal is not None:
+                served[name] = signal
+        return {signal.source: signal for signal in served.values()}
+
+    def _start_fetch(
+        self, name: str, fetch: Callable[[], Awaitable[SignalRecord]]
+    ) -> "asyncio.Task[Optional[SignalRecord]]":
+        """Start a fetch for a sensor, or reuse the one already in flight."""
+        task = self._inflight.get(name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._safe_fetch(name, fetch), name=f"sensor:{name}")
+            self._inflight[name] = task
+        return task
+
+    def stream(self, queue: "asyncio.Queue[SignalRecord]", interval: float) -> List[asyncio.Task]:
+        """
+        Event-driven mode: run every sensor in its own loop, pushing each
+        signal into `queue` as soon as it arrives.
+
+        Returns the sensor tasks; cancel them to stop streaming.
+        """
+        return [
+            asyncio.create_task(
+                self._run_sensor(name, fetch, queue, interval), name=f"sensor-stream:{name}"
+            )
+            for name, fetch in self._fetchers().items()
         ]
 
-        results = await asyncio.gather(*tasks)
-        return {signal.source: signal for signal in results if signal is not None}
+    async def _run_sensor(
+        self,
+        source: str,
+        fetch_func: Callable[[], Awaitable[SignalRecord]],
+        queue: "asyncio.Queue[SignalRecord]",
+        interval: float,
+    ) -> None:
+        """
+        Poll one sensor forever, independently of the others.
+        While the sensor's cached signal is fresh there is nothing new to push.
+        """
+        sensor = self.sensors[source]
+        while True:
+            _, fresh = self.cache.lookup(source, sensor.cache_ttl, sensor.cache_max_stale)
+            if not fresh:
+                signal = await self._safe_fetch(source, fetch_func)
+                if signal is not None:
+                    await queue.put(signal)
+            await asyncio.sleep(interval)
+
+    def _fetchers(self) -> Dict[str, Callable[[], Awaitable[SignalRecord]]]:
+        """Zero-argument fetch coroutine factory per sensor, for _safe_fetch."""
+        return {
+            name: functools.partial(self._fetch_sensor, sensor)
+            for name, sensor in self.sensors.items()
+        }
+
+    async def _fetch_sensor(self, sensor: Sensor) -> SignalRecord:
+        """
+        One fetch attempt within the per-sensor and hub-wide budgets.
+        The sensor's own slot and rate token are taken before a hub-wide slot,
+        so throttled sensors never hold shared capacity while they wait.
+        """
+        async with sensor.semaphore:
+            await sensor.budget.acquire()
+            async with self.concurrency:
+                return await asyncio.wait_for(
+                    sensor.fetch(self.client), timeout=sensor.timeout or self.timeout
+                )
+
+    def _stale_signal(self, name: str) -> SignalRecord:
+        """Last known signal for a sensor that missed the cycle deadline."""
+        self.metrics.record_sensor_stale(name)
+        logger.warning(f"Sensor '{name}' missed the cycle deadline - serving stale signal")
+
+        last = self.cache.latest(name)
+        if last is None:
+            return SignalRecord(
+                source=name,
+                value=0.0,
+                timestamp=datetime.now(),
+                raw_content="STALE: no signal received yet",
+                stale=True,
+            )
+        # Keeps the original timestamp so recency decay down-weights it
+        return SignalRecord(last.source, last.value, last.timestamp, last.raw_content, stale=True)
+
+    def _hedge_delay(self, source: str) -> Optional[float]:
+        """Seconds to wait before hedging, from the sensor's first-request latency quantile."""
+        if not self.hedge_enabled:
+            return None
+        quantile_ms = self.metrics.sensor_latency_quantile(
+            source, self.hedge_quantile, self.hedge_min_samples
+        )
+        if quantile_ms is None:
+            return None
+        return max(self.hedge_min_delay, quantile_ms / 1000.0)
+
+    async def _hedged_fetch(
+        self, source: str, fetch_func: Callable[[], Awaitable[Optional[SignalRecord]]]
+    ) -> Optional[SignalRecord]:
+        """
+        One logical attempt: if the first request is slower than the hedge
+        delay, send a duplicate and return whichever succeeds first.
+        """
+        delay = self._hedge_delay(source)
+        started = time.perf_counter()
+        if delay is None:
+            result = await fetch_func()
+            self._record_primary(source, started)
+            return result
+
+        tasks: List["asyncio.Future[Optional[SignalRecord]]"] = [asyncio.ensure_future(fetch_func())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                result = tasks[0].result()
+                self._record_primary(source, started)
+                return result
 
-    async def _safe_fetch(self, source: str, fetch_func) -> Optional[Signal]:
+            self.metrics.record_sensor_hedge(source)
+            logger.debug(f"Sensor '{source}' slower than {delay * 1000:.0f}ms - hedging")
+            tasks.append(asyncio.ensure_future(fetch_func()))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        # The primary's own latency, or how long it had run
+                        # when the hedge won: never the faster hedged time
+                        self._record_primary(source, started)
+                        return task.result()
+            # Both failed: surface the primary's error to the retry logic
+            return tasks[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _record_primary(self, source: str, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.metrics.record_sensor_primary_latency(source, elapsed_ms)
+
+    def _breaker(self, source: str) -> Optional[CircuitBreaker]:
+        """Get or create the circuit breaker for a source (None if disabled)."""
+        if not self.settings.breaker_enabled:
+            return None
+        breaker = self.breakers.get(source)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                source,
+                self.metrics,
+                failure_rate_threshold=self.settings.breaker_failure_rate,
+                min_calls=self.settings.breaker_min_calls,
+                window=self.settings.breaker_window,
+                reset_timeout=self.settings.breaker_reset_timeout,
+                max_reset_timeout=self.settings.breaker_max_reset_timeout,
+            )
+            self.breakers[source] = breaker
+        return breaker
+
+    async def _safe_fetch(self, source: str, fetch_func) -> Optional[SignalRecord]:
         """
         Wrapper that catches exceptions and returns a null signal on failure.
-        Includes retry logic with exponential backoff.
+        Includes retry logic with exponential backoff, and skips the fetch
+        entirely while the source's circuit breaker is open.
+        """
+        breaker = self._breaker(source)
+        if breaker is not None and not breaker.allow_request():
+            logger.debug(f"Sensor '{source}' circuit open - skipping fetch")
+            return SignalRecord(
+                source=source,
+                value=0.0,
+                timestamp=datetime.now(),
+                raw_content=f"ERROR: circuit open for '{source}'",
+            )
+
+        try:
+            with self.tracer.span(source, "sensor"):
+                signal, succeeded = await self._fetch_with_retries(source, fetch_func)
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+
+        if succeeded and signal is not None:
+            self.cache.put(source, signal)
+        if breaker is not None:
+            if succeeded:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        return signal
+
+    async def _fetch_with_retries(
+        self, source: str, fetch_func
+    ) -> Tuple[Optional[SignalRecord], bool]:
+        """
+        Fetch with retries and exponential backoff.
+        Returns (signal, succeeded); a null signal after the last failure.
         """
         last_exception: Exception | None = None
 
         for attempt in range(self.max_retries):
             try:
                 with Timer() as timer:
-                    result: Signal | None = await fetch_func()
+                    result: SignalRecord | None = await self._hedged_fetch(source, fetch_func)
 
                 # Record success metrics
                 self.metrics.record_sensor_success(source, timer.elapsed_ms)
                 if attempt > 0:
                     logger.info(f"Sensor '{source}' succeeded on attempt {attempt + 1}")
-                return result
+                return result, True
 
             except asyncio.TimeoutError as e:
                 last_exception = e
@@ -92,80 +469,21 @@ class AsyncPerceptionHub:
         # All retries failed
         self.metrics.record_sensor_failure(source)
         logger.error(f"Sensor '{source}' failed after {self.max_retries} attempts: {last_exception}")
-        return Signal(
-            source=source,
-            value=0.0,
-            timestamp=datetime.now(),
-            raw_content=f"ERROR: {str(last_exception)}",
-        )
-
-    async def _fetch_twitter_sentiment(self) -> Signal:
-        """
-        Mock: Simulates fetching sentiment from social media.
-        In production, this would call Twitter API or sentiment analysis service.
-        """
-        await asyncio.sleep(random.uniform(0.1, 0.5))  # Simulate network delay
-
-        # Mock sentiment score: -1 (bearish) to +1 (bullish)
-        sentiment = random.uniform(-1.0, 1.0)
-
-        mock_tweets = [
-            "Market looking bullish! 🚀",
-            "Concerns about volatility today...",
-            "Strong fundamentals, holding long term",
-            "Profit taking in progress",
-        ]
-
-        return Signal(
-            source="twitter_sentiment",
-            value=sentiment,
-            timestamp=datetime.now(),
-            raw_content=random.choice(mock_tweets),
-        )
-
-    async def _fetch_price_volatility(self) -> Signal:
-        """
-        Mock: Simulates fetching price volatility metrics.
-        In production, this would calculate from real-time price data.
-        """
-        await asyncio.sleep(random.uniform(0.1, 0.3))
-
-        # Mock volatility: 0 (stable) to 1 (highly volatile)
-        volatility = random.uniform(0.0, 0.15)
-
-        return Signal(
-            source="price_volatility",
-            value=volatility,
-            timestamp=datetime.now(),
-            raw_content=f"Volatility: {volatility:.2%}",
-        )
-
-    async def _fetch_news_sentiment(self) -> Signal:
-        """
-        Mock: Simulates scraping news headlines and analyzing sentiment.
-        In production, this would use BeautifulSoup + NLP models.
-        """
-        await asyncio.sleep(random.uniform(0.2, 0.6))
-
-        # Mock news sentiment: -1 (negative) to +1 (positive)
-        sentiment = random.uniform(-0.5, 0.8)
-
-        mock_headlines = [
-            "Tech sector shows strong growth",
-            "Regulatory concerns emerge",
-            "Analysts upgrade price targets",
-            "Market consolidation continues",
-        ]
-
-        return Signal(
-            source="news_feed",
-            value=sentiment,
-            timestamp=datetime.now(),
-            raw_content=random.choice(mock_headlines),
+        return (
+            SignalRecord(
+                source=source,
+                value=0.0,
+                timestamp=datetime.now(),
+                raw_content=f"ERROR: {str(last_exception)}",
+            ),
+            False,
         )
 
     async def close(self):
-        """Clean up HTTP client."""
+        """Cancel in-flight fetches and clean up the HTTP connection pool."""
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
         await self.client.aclose()
 
 
@@ -178,7 +496,7 @@ class MockStreamSimulator:
     def __init__(self, failure_rate: float = 0.1):
         self.failure_rate = failure_rate
 
-    async def stream_signal(self, source: str) -> Signal:
+    async def stream_signal(self, source: str) -> SignalRecord:
         """
         Generate a single signal with optional random failures.
         """
@@ -187,7 +505,7 @@ class MockStreamSimulator:
 
         await asyncio.sleep(random.uniform(0.05, 0.2))
 
-        return Signal(
+        return SignalRecord(
             source=source,
             value=random.uniform(-1.0, 1.0),
             timestamp=datetime.now(),
@@ -0,0 +1,104 @@
+"""
+Serialization - Fast JSON encoding for API responses and push messages.
+Uses orjson when installed (the "fast" extra) and the stdlib json otherwise;
+either way Signal / DecisionChain / datetime are encoded directly instead of
+going through FastAPI's jsonable_encoder.
+"""
+
+import json
+import math
+from datetime import date, datetime
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.schemas import DecisionChain, Signal, SignalLike, SignalRecord
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def signal_to_dict(signal: SignalLike) -> Dict[str, Any]:
+    """Field dict of a Signal or SignalRecord, datetimes left for the encoder."""
+    return {
+        "source": signal.source,
+        "value": signal.value,
+        "timestamp": signal.timestamp,
+        "raw_content": signal.raw_content,
+        "stale": signal.stale,
+    }
+
+
+def decision_to_dict(decision: DecisionChain) -> Dict[str, Any]:
+    """Field dict of a DecisionChain, datetimes left for the encoder."""
+    return {
+        "timestamp": decision.timestamp,
+        "weights": decision.weights,
+        "action": decision.action,
+        "reasoning": decision.reasoning,
+        "is_safe": decision.is_safe,
+        "override_reason": decision.override_reason,
+        "explanation": decision.explanation,
+    }
+
+
+def _default(obj: Any) -> Any:
+    """Encoder hook for types JSON doesn't know."""
+    if isinstance(obj, DecisionChain):
+        return decision_to_dict(obj)
+    if isinstance(obj, (Signal, SignalRecord)):
+        return signal_to_dict(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):  # NumPy scalars and arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of `obj` as plain JSON types with NaN/Infinity replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    return _finite(_default(obj))
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode to compact UTF-8 JSON bytes. Non-finite floats (a sensor can
+    report NaN) become null on both paths, as orjson does.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    try:
+        text = json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        )
+    except ValueError:
+        # Rare: re-encode with the non-finite values nulled out
+        text = json.dumps(_finite(obj), ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Opt-in response class that encodes with `dumps`.
+
+    Return an instance from a handler (rather than a dict) so FastAPI skips
+    its jsonable_encoder walk; pass it as `response_class` for the OpenAPI docs.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
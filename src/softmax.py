@@ -0,0 +1,161 @@
+"""
+Softmax Kernels - Numerically stable attention normalization
+Shared by the pure-Python, NumPy batch and Rust-backed brains so every path
+computes the same weights.
+
+All kernels use the log-sum-exp trick: the max scaled score is subtracted
+before exponentiating, which matches `RustAttentionEngine.softmax` and keeps
+exp() from overflowing when scores get large.
+"""
+
+import math
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+
+
+def softmax_dict(scores: Dict[str, float], temperature: float) -> Dict[str, float]:
+    """
+    Stable softmax over a source → score mapping.
+
+    Formula: Weight_i = exp(Score_i / T - M) / Σ exp(Score_j / T - M), M = max(Score / T)
+
+    Builds a single scratch list and the output dict.
+    """
+    if not scores:
+        return {}
+
+    buf = [v / temperature for v in scores.values()]
+    max_scaled = max(buf)
+
+    total = 0.0
+    for i, x in enumerate(buf):
+        e = math.exp(x - max_scaled)
+        buf[i] = e
+        total += e
+
+    if total == 0.0 or not math.isfinite(total):
+        # Fallback to uniform distribution
+        uniform = 1.0 / len(buf)
+        return dict.fromkeys(scores, uniform)
+
+    inv_total = 1.0 / total
+    return {k: e * inv_total for k, e in zip(scores, buf)}
+
+
+class DictSoftmax:
+    """
+    softmax_dict with reusable buffers, for a brain whose set of sources is
+    stable between decisions.
+
+    The scratch list and output dict are kept and overwritten in place while
+    the incoming keys match; they are rebuilt only when the source set
+    changes. The returned dict is owned by this object and is overwritten by
+    the next call, so copy it if it must outlive that (DecisionChain copies
+    its weights on validation).
+    """
+
+    __slots__ = ("_out", "_buf")
+
+    def __init__(self):
+        self._out: Dict[str, float] = {}
+        self._buf: List[float] = []
+
+    def __call__(self, scores: Mapping[str, float], temperature: float) -> Dict[str, float]:
+        out = self._out
+        if out.keys() != scores.keys():
+            out = self._out = dict.fromkeys(scores, 0.0)
+            self._buf = [0.0] * len(scores)
+        if not scores:
+            return out
+
+        buf = self._buf
+        max_scaled = -math.inf
+        for i, v in enumerate(scores.values()):
+            x = v / temperature
+            buf[i] = x
+            if x > max_scaled:
+                max_scaled = x
+
+        total = 0.0
+        for i, x in enumerate(buf):
+            e = math.exp(x - max_scaled)
+            buf[i] = e
+            total += e
+
+        if total == 0.0 or not math.isfinite(total):
+            # Fallback to uniform distribution
+            uniform = 1.0 / len(buf)
+            for k in scores:
+                out[k] = uniform
+            return out
+
+        inv_total = 1.0 / total
+        for k, e in zip(scores, buf):
+            out[k] = e * inv_total
+        return out
+
+
+def log_sum_exp(scores: np.ndarray, temperature: float) -> np.ndarray:
+    """
+    log Σ exp(score / T) along the last axis, computed without overflow.
+    """
+    scaled = np.asarray(scores, dtype=np.float64) / temperature
+    max_scaled = np.max(scaled, axis=-1, keepdims=True, initial=-np.inf)
+    lse: np.ndarray = max_scaled + np.log(
+        np.sum(np.exp(scaled - max_scaled), axis=-1, keepdims=True)
+    )
+    return np.squeeze(lse, axis=-1)
+
+
+def softmax_into(
+    scores: np.ndarray,
+    temperature: float,
+    out: np.ndarray,
+    work: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Stable softmax along the last axis of a 1-D or 2-D float64 array.
+
+    Results are written into `out`, which may alias `scores`. `work` is a
+    scratch buffer with the shape of `scores` minus its last axis plus a
+    trailing 1 (e.g. (N, 1) for (N, K) scores); pass it to keep the call
+    allocation-free. Entries of -inf get zero weight; a row that is entirely
+    -inf produces NaNs and must be handled by the caller.
+    """
+    if work is None:
+        work = np.empty(scores.shape[:-1] + (1,), dtype=np.float64)
+
+    np.divide(scores, temperature, out=out)
+    np.max(out, axis=-1, keepdims=True, out=work, initial=-np.inf)
+    np.subtract(out, work, out=out)
+    np.exp(out, out=out)
+    np.sum(out, axis=-1, keepdims=True, out=work)
+    np.divide(out, work, out=out)
+    return out
+
+
+class SoftmaxBuffers:
+    """
+    Preallocated output and scratch buffers for repeated softmax calls.
+
+    Sized for up to `max_rows` × `max_cols`; each call returns a view into
+    the owned buffer, so results must be copied if they need to outlive the
+    next call.
+    """
+
+    def __init__(self, max_rows: int, max_cols: int):
+        self.out = np.empty((max_rows, max_cols), dtype=np.float64)
+        self.work = np.empty((max_rows, 1), dtype=np.float64)
+
+    def softmax(self, scores: np.ndarray, temperature: float) -> np.ndarray:
+        """Softmax of a (rows, cols) score array into the owned buffers."""
+        if scores.ndim == 1:
+            scores = scores.reshape(1, -1)
+        rows, cols = scores.shape
+        if rows > self.out.shape[0] or cols > self.out.shape[1]:
+            raise ValueError(
+                f"Scores of shape {scores.shape} exceed buffer capacity {self.out.shape}"
+            )
+        out = self.out[:rows, :cols]
+        return softmax_into(scores, temperature, out=out, work=self.work[:rows])
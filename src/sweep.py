@@ -0,0 +1,305 @@
+"""
+Parameter Sweep - Backtest a grid of temperatures and safety thresholds in parallel.
+The long-format signal history lives in one shared memory block that every
+worker process maps, so adding workers never copies the data, and each
+worker forward-fills it one chunk at a time like Backtester.run.
+"""
+
+import argparse
+import atexit
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.backtest import Backtester, SignalSeries, load_series
+from src.brain import AttentionFusionEngine
+from src.config import get_settings
+from src.logger import get_logger
+from src.safety import SafetyGate
+
+logger = get_logger(__name__)
+
+# Sweepable parameters and the Settings fields they default from
+PARAMETERS = (
+    "temperature",
+    "max_volatility_for_buy",
+    "max_volatility_for_sell",
+    "min_confidence_threshold",
+)
+
+
+def expand_grid(grid: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """
+    Cartesian product of the given parameter values. Parameters left out
+    keep their configured value (AGENT_TEMPERATURE, MAX_VOLATILITY_FOR_BUY, ...).
+    """
+    unknown = set(grid) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+
+    settings = get_settings()
+    defaults = {
+        "temperature": settings.agent_temperature,
+        "max_volatility_for_buy": settings.max_volatility_for_buy,
+        "max_volatility_for_sell": settings.max_volatility_for_sell,
+        "min_confidence_threshold": settings.min_confidence_threshold,
+    }
+    axes = [list(grid.get(name, [defaults[name]])) for name in PARAMETERS]
+    return [dict(zip(PARAMETERS, point)) for point in itertools.product(*axes)]
+
+
+PerSource = List[Tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class SharedSeriesHandle:
+    """Picklable description of a prepared series held in shared memory."""
+
+    name: str
+    sources: Tuple[str, ...]
+    decisions: int  # N decision times
+    observations: int  # M signal observations
+
+
+@dataclass
+class PreparedSeries:
+    """
+    What Backtester.run_prepared needs: decision times and each source's
+    (timestamps, values), both O(N + M) rather than the N×K filled grid.
+    """
+
+    sources: List[str]
+    times: np.ndarray  # (N,) float64
+    per_source: PerSource
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+class SharedSignalSeries:
+    """
+    A series written once into a single shared memory block laid out as
+    times (N) | timestamps (M) | values (M) | offsets (K+1), with the
+    observations grouped by source so each source's columns are contiguous.
+    Workers attach by name and get NumPy views onto the block, not copies.
+    """
+
+    def __init__(self, series: SignalSeries, times: np.ndarray):
+        n, m, k = len(times), len(series), len(series.sources)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, _block_size(n, m, k)))
+        self.handle = SharedSeriesHandle(self._shm.name, tuple(series.sources), n, m)
+
+        # Written straight into the block: the stable sort keeps time order per source
+        times_view, timestamps, values, offsets = _block_views(self._shm, self.handle)
+        times_view[:] = times
+        order = np.argsort(series.source_ids, kind="stable")
+        np.take(series.timestamps, order, out=timestamps)
+        np.take(series.values, order, out=values)
+        offsets[0] = 0
+        np.cumsum(np.bincount(series.source_ids, minlength=k), out=offsets[1:])
+
+    def __enter__(self) -> "SharedSignalSeries":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release and remove the shared block."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _block_size(n: int, m: int, k: int) -> int:
+    """Bytes for times, timestamps and values (float64) and offsets (int64)."""
+    return n * 8 + 2 * m * 8 + (k + 1) * 8
+
+
+def _block_views(
+    shm: shared_memory.SharedMemory, handle: SharedSeriesHandle
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(times, timestamps, values, offsets) views onto a shared block."""
+    buffer = shm.buf
+    offset = 0
+
+    def take(dtype: Any, length: int) -> np.ndarray:
+        nonlocal offset
+        array: np.ndarray = np.ndarray((length,), dtype=dtype, buffer=buffer, offset=offset)
+        offset += array.nbytes
+        return array
+
+    times = take(np.float64, handle.decisions)
+    timestamps = take(np.float64, handle.observations)
+    values = take(np.float64, handle.observations)
+    offsets = take(np.int64, len(handle.sources) + 1)
+    return times, timestamps, values, offsets
+
+
+def _attach(shm: shared_memory.SharedMemory, handle: SharedSeriesHandle) -> PreparedSeries:
+    """PreparedSeries whose arrays are all views onto a shared block."""
+    times, timestamps, values, offsets = _block_views(shm, handle)
+    per_source = [(timestamps[lo:hi], values[lo:hi]) for lo, hi in zip(offsets[:-1], offsets[1:])]
+    return PreparedSeries(list(handle.sources), times, per_source)
+
+
+# Per-worker state, set up once by _init_worker
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_series: Optional[PreparedSeries] = None
+
+
+def _init_worker(handle: SharedSeriesHandle) -> None:
+    """
+    Process pool initializer: map the shared series once per worker.
+
+    The pool already runs one worker per core, so each worker's rayon pool
+    (decide_arrays on decisify_core) is held to a single thread; it is built
+    lazily on first use, after this runs.
+    """
+    global _worker_shm, _worker_series
+    os.environ["RAYON_NUM_THREADS"] = "1"
+    _worker_shm = shared_memory.SharedMemory(name=handle.name)
+    _worker_series = _attach(_worker_shm, handle)
+    atexit.register(_close_worker)
+
+
+def _close_worker() -> None:
+    """Drop the views and unmap the shared block when the worker exits."""
+    global _worker_shm, _worker_series
+    _worker_series = None
+    if _worker_shm is not None:
+        _worker_shm.close()
+        _worker_shm = None
+
+
+def _run_point(
+    params: Dict[str, float], chunk_size: int, max_age: Optional[float]
+) -> Dict[str, Any]:
+    """Backtest one grid point against the worker's shared series."""
+    assert _worker_series is not None, "worker not initialized"
+    return evaluate_point(_worker_series, params, chunk_size, max_age)
+
+
+def evaluate_point(
+    series: PreparedSeries,
+    params: Dict[str, float],
+    chunk_size: int,
+    max_age: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Backtest one parameter set and summarize it."""
+    backtester = Backtester(
+        engine=AttentionFusionEngine(temperature=params["temperature"]),
+        safety_gate=SafetyGate(
+            max_volatility_for_buy=params["max_volatility_for_buy"],
+            max_volatility_for_sell=params["max_volatility_for_sell"],
+            min_confidence_threshold=params["min_confidence_threshold"],
+        ),
+        chunk_size=chunk_size,
+    )
+    result = backtester.run_prepared(series.sources, series.times, series.per_source, max_age)
+    summary = result.summary()
+    summary["worker_pid"] = os.getpid()
+    return summary
+
+
+class ParameterSweep:
+    """
+    Fans a parameter grid out over a process pool.
+
+    The parent only computes the decision times; the long-format series goes
+    into shared memory once and each worker forward-fills it chunk by chunk
+    (Backtester.chunk_size rows at a time) per grid point. Memory stays
+    O(N + M) plus one chunk per worker, never the N×K filled grid.
+    """
+
+    def __init__(
+        self,
+        series: SignalSeries,
+        step: Optional[float] = None,
+        max_age: Optional[float] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 65536,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_age = max_age
+        self.series = series
+        self.times = Backtester(chunk_size=chunk_size).decision_times(series, step)
+
+    def run(self, grid: Dict[str, Sequence[float]]) -> List[Dict[str, Any]]:
+        """
+        Backtest every point of the grid. Results keep grid order; each holds
+        the parameters, action distribution, override counts and runtime.
+        """
+        points = expand_grid(grid)
+        start = time.perf_counter()
+
+        if self.workers == 1 or len(points) == 1:
+            prepared = PreparedSeries(
+                list(self.series.sources), self.times, Backtester._per_source(self.series)
+            )
+            results = [
+                evaluate_point(prepared, params, self.chunk_size, self.max_age) for params in points
+            ]
+        else:
+            with SharedSignalSeries(self.series, self.times) as shared:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(points)),
+                    # Not fork: the parent may be running threads (watchdog,
+                    # profiler, logging) whose locks a forked child would inherit
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(shared.handle,),
+                ) as pool:
+                    results = list(
+                        pool.map(
+                            _run_point,
+                            points,
+                            itertools.repeat(self.chunk_size),
+                            itertools.repeat(self.max_age),
+                        )
+                    )
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Sweep: {len(points)} points × {len(self.times)} decisions "
+            f"on {self.workers} workers in {elapsed:.2f}s"
+        )
+        return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point: python -m src.sweep history.csv --temperature 0.5 1 2"""
+    parser = argparse.ArgumentParser(description="Sweep decisify parameters over a backtest")
+    parser.add_argument("path", help=".csv / .npz / .parquet signal history")
+    parser.add_argument("--step", type=float, help="Decision interval in seconds")
+    parser.add_argument("--max-age", type=float, help="Ignore observations older than this")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    for name in PARAMETERS:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, nargs="+", dest=name)
+    args = parser.parse_args(argv)
+
+    grid = {name: getattr(args, name) for name in PARAMETERS if getattr(args, name)}
+    sweep = ParameterSweep(load_series(args.path), args.step, args.max_age, args.workers)
+    results = sweep.run(grid)
+
+    for result in sorted(results, key=lambda r: r["override_rate"]):
+        print(
+            f"{result['parameters']} -> actions {result['actions']}, "
+            f"override rate {result['override_rate']:.2%}, {result['elapsed_seconds']:.3f}s"
+        )
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Tracing - Nested span timings for the decision cycle, kept in a ring buffer.
+Spans follow asyncio tasks through context variables, so per-sensor fetches
+nest under the cycle that started them. Exportable as Chrome trace events.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from src.config import get_settings
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed operation. Times are time.perf_counter_ns() values."""
+
+    name: str
+    category: str
+    span_id: int
+    parent_id: Optional[int]
+    trace_id: int
+    start_ns: int
+    end_ns: int = 0
+    lane: int = 0  # Task (or thread) the span ran on
+    lane_name: str = ""
+    args: Optional[Dict[str, Any]] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "trace_id": self.trace_id,
+            "start_ns": self.start_ns,
+            "duration_ms": self.duration_ms,
+            "lane": self.lane_name,
+            "args": self.args or {},
+        }
+
+
+# Innermost open span of the current task/thread
+_current_span: ContextVar[Optional[Span]] = ContextVar("decisify_current_span", default=None)
+
+
+class _NoopScope:
+    """Returned by Tracer.span() while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class _SpanScope:
+    """Context manager that opens a span on enter and records it on exit."""
+
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self) -> Span:
+        span = self.span
+        parent = _current_span.get()
+        if parent is not None:
+            span.parent_id = parent.span_id
+            span.trace_id = parent.trace_id
+        else:
+            span.trace_id = span.span_id
+        span.lane, span.lane_name = _lane()
+        self.token = _current_span.set(span)
+        span.start_ns = time.perf_counter_ns()
+        return span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        span = self.span
+        span.end_ns = time.perf_counter_ns()
+        _current_span.reset(self.token)
+        if exc_type is not None:
+            span.args = {**(span.args or {}), "error": exc_type.__name__}
+        self.tracer._spans.append(span)
+
+
+class Tracer:
+    """
+    Records spans into a fixed-size ring buffer (oldest dropped first).
+
+    While disabled, span() returns a shared no-op context manager: one
+    attribute check per call site and no allocation.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, capacity: Optional[int] = None):
+        """
+        Args:
+            enabled: Record spans (default: TRACING_ENABLED)
+            capacity: Finished spans kept (default: TRACING_BUFFER_SIZE)
+        """
+        settings = get_settings()
+        self.enabled = settings.tracing_enabled if enabled is None else enabled
+        self.capacity = capacity or settings.tracing_buffer_size
+        self._spans: Deque[Span] = deque(maxlen=self.capacity)
+        self._ids = count(1)
+        # perf_counter_ns -> epoch ns, for exported timestamps
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    def span(self, name: str, category: str = "cycle", **args: Any):
+        """
+        Time a block as a span nested under the current one:
+
+            with tracer.span("safety"):
+                ...
+        """
+        if not self.enabled:
+            return _NOOP_SCOPE
+        return _SpanScope(
+            self,
+            Span(name, category, next(self._ids), None, 0, 0, args=args or None),
+        )
+
+    def spans(self, limit: Optional[int] = None) -> List[Span]:
+        """Finished spans, oldest first (the most recent `limit` if given)."""
+        spans = list(self._spans)
+        return spans[-limit:] if limit else spans
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def export_chrome(self, spans: Optional[Iterable[Span]] = None) -> Dict[str, Any]:
+        """
+        Chrome trace-event JSON (chrome://tracing, Perfetto, speedscope):
+        one complete ("X") event per span, one lane per task.
+        """
+        spans = self.spans() if spans is None else list(spans)
+        events: List[Dict[str, Any]] = []
+        lanes: Dict[int, str] = {}
+        for span in spans:
+            lanes.setdefault(span.lane, span.lane_name)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start_ns + self._epoch_offset_ns) / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": 1,
+                    "tid": span.lane,
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        "trace_id": span.trace_id,
+                        **(span.args or {}),
+                    },
+                }
+            )
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": lane, "args": {"name": name}}
+            for lane, name in lanes.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _lane() -> Tuple[int, str]:
+    """(id, name) of the asyncio task running this code, else of the thread."""
+    task = asyncio.current_task() if asyncio._get_running_loop() is not None else None
+    if task is not None:
+        return id(task), task.get_name()
+    thread = threading.current_thread()
+    return thread.ident or 0, thread.name
+
+
+# Global tracer instance
+tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (created on first use)."""
+    global tracer
+    if tracer is None:
+        tracer = Tracer()
+    return tracer
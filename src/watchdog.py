@@ -0,0 +1,161 @@
+"""
+Loop Watchdog - Continuous event loop lag measurement and stall reporting.
+A heartbeat task measures how late the loop wakes it; a monitor thread
+catches the loop while it is blocked and logs the stack that is blocking it.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, List, Optional
+
+from src.config import get_settings
+from src.logger import get_logger
+from src.metrics import MetricsCollector, get_metrics
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class StallReport:
+    """The loop thread's stack, captured while a callback was blocking it."""
+
+    detected_at: datetime
+    blocked_ms: float  # How long the loop had been blocked when captured
+    stack: List[str]  # Formatted frames, outermost first
+
+    def format(self) -> str:
+        return "".join(self.stack)
+
+
+class LoopWatchdog:
+    """
+    Watches the event loop it is started on.
+
+    - Heartbeat: sleeps `interval` seconds in a loop and records how late it
+      woke up (the loop lag every other callback also sees) into
+      MetricsCollector.record_loop_lag.
+    - Monitor thread: if a heartbeat is overdue by more than
+      `stall_threshold_ms`, the loop is stuck in a callback. The thread
+      captures the loop thread's current stack, logs it, keeps it in
+      `reports` and counts a stall, once per stall.
+
+    The monitor needs the GIL to run, so a callback blocked inside C code
+    that holds it is only seen afterwards, as heartbeat lag.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        stall_threshold_ms: Optional[float] = None,
+        metrics: Optional[MetricsCollector] = None,
+        max_reports: int = 20,
+        stack_limit: int = 30,
+    ):
+        """
+        Args:
+            interval: Heartbeat period in seconds (default: WATCHDOG_INTERVAL)
+            stall_threshold_ms: Overdue time that counts as a stall
+                                (default: WATCHDOG_STALL_THRESHOLD_MS)
+            metrics: Collector for lag and stalls (default: the global one)
+            max_reports: Recent stall reports kept
+            stack_limit: Innermost frames kept per report
+        """
+        settings = get_settings()
+        self.interval = interval or settings.watchdog_interval
+        self.stall_threshold_ms = stall_threshold_ms or settings.watchdog_stall_threshold_ms
+        self.metrics = metrics or get_metrics()
+        self.stack_limit = stack_limit
+        self.reports: Deque[StallReport] = deque(maxlen=max_reports)
+
+        self._last_tick = 0.0
+        self._stall_reported = False
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    def start(self) -> None:
+        """Start watching the running event loop (call from the loop thread)."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stall_reported = False
+        self._stop.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(
+            self._heartbeat(), name="loop-watchdog"
+        )
+        self._monitor_thread = threading.Thread(
+            target=self._monitor, name="decisify-loop-watchdog", daemon=True
+        )
+        self._monitor_thread.start()
+        logger.info(
+            f"Loop watchdog started: heartbeat {self.interval * 1000:.0f}ms, "
+            f"stall threshold {self.stall_threshold_ms:.0f}ms"
+        )
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the monitor thread."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._monitor_thread is not None:
+            await asyncio.to_thread(self._monitor_thread.join)
+            self._monitor_thread = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.metrics.record_loop_lag(max(0.0, (now - expected) * 1000))
+            self._last_tick = now
+            self._stall_reported = False
+
+    def _monitor(self) -> None:
+        # Check often enough to catch a stall shortly after it crosses the threshold
+        check_every = max(self.stall_threshold_ms / 2000, 0.001)
+        while not self._stop.wait(check_every):
+            overdue_ms = (time.monotonic() - self._last_tick - self.interval) * 1000
+            if overdue_ms > self.stall_threshold_ms and not self._stall_reported:
+                self._stall_reported = True
+                self._report_stall(overdue_ms)
+
+    def _report_stall(self, blocked_ms: float) -> None:
+        """Capture and log the loop thread's stack while it is blocked."""
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        stack = traceback.format_stack(frame, limit=self.stack_limit) if frame else []
+        report = StallReport(detected_at=datetime.now(), blocked_ms=blocked_ms, stack=stack)
+        self.reports.append(report)
+        self.metrics.record_loop_stall()
+        logger.warning(
+            f"Event loop blocked for {blocked_ms:.0f}ms+ (threshold "
+            f"{self.stall_threshold_ms:.0f}ms). Blocking stack:\n{report.format()}"
+        )
+
+
+# Global watchdog instance
+watchdog: Optional[LoopWatchdog] = None
+
+
+def get_watchdog() -> LoopWatchdog:
+    """Get the global loop watchdog (created on first use)."""
+    global watchdog
+    if watchdog is None:
+        watchdog = LoopWatchdog()
+    return watchdog
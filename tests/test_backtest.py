@@ -0,0 +1,165 @@
+"""
+Tests for the vectorized backtest engine (backtest.py)
+"""
+
+import numpy as np
+import pytest
+
+from src.backtest import PARQUET_AVAILABLE, Backtester, SignalSeries, load_series
+from src.brain import ACTION_NAMES, AttentionFusionEngine
+from src.journal import DecisionJournal, JournalReader
+from src.safety import OVERRIDE_REASONS, SafetyGate
+from src.schemas import DecisionChain, Signal
+
+
+@pytest.fixture
+def series():
+    """Three sources observed at irregular times over ten minutes."""
+    rng = np.random.default_rng(7)
+    sources = ["twitter_sentiment", "price_volatility", "news_feed"]
+    timestamps = np.sort(rng.uniform(1_700_000_000, 1_700_000_600, size=300))
+    names = rng.choice(sources, size=300)
+    values = np.where(
+        names == "price_volatility", rng.uniform(0.0, 0.1, size=300), rng.uniform(-1, 1, size=300)
+    )
+    return SignalSeries.from_columns(timestamps, names, values)
+
+
+@pytest.fixture
+def backtester():
+    return Backtester(
+        engine=AttentionFusionEngine(temperature=0.5),
+        safety_gate=SafetyGate(max_volatility_for_buy=0.05, max_volatility_for_sell=0.08),
+    )
+
+
+def test_backtest_matches_scalar_safety_gate(series, backtester):
+    """Test that vectorized safety results match SafetyGate.validate per decision."""
+    result = backtester.run(series, keep_weights=True)
+    gate = SafetyGate(max_volatility_for_buy=0.05, max_volatility_for_sell=0.08)
+
+    for row in range(len(result)):
+        present = result.weights[row] > 0
+        weights = {src: float(w) for src, w, p in zip(result.sources, result.weights[row], present) if p}
+        signals = {}
+        for col, src in enumerate(series.sources):
+            observed = series.timestamps[series.source_ids == col] <= result.timestamps[row]
+            if observed.any():
+                value = series.values[series.source_ids == col][observed][-1]
+                signals[src] = Signal(source=src, value=float(value))
+
+        decision = DecisionChain(
+            weights=weights,
+            action=ACTION_NAMES[result.raw_actions[row]],
+            reasoning="",
+            is_safe=True,
+        )
+        validated = gate.validate(decision, signals)
+
+        assert validated.action == ACTION_NAMES[result.actions[row]]
+        assert validated.is_safe == (OVERRIDE_REASONS[result.overrides[row]] == "none")
+
+
+def test_chunking_does_not_change_results(series, backtester):
+    """Test that small chunks produce the same series as one big chunk."""
+    whole = backtester.run(series)
+    backtester.chunk_size = 7
+    chunked = backtester.run(series)
+
+    np.testing.assert_array_equal(whole.actions, chunked.actions)
+    np.testing.assert_array_equal(whole.overrides, chunked.overrides)
+    np.testing.assert_allclose(whole.weighted_values, chunked.weighted_values)
+
+
+def test_step_grid_and_max_age(backtester):
+    """Test fixed-interval decisions and expiry of old observations."""
+    series = SignalSeries.from_columns([0.0, 100.0], ["news_feed", "news_feed"], [0.9, -0.9])
+
+    result = backtester.run(series, step=25.0, max_age=30.0)
+
+    np.testing.assert_array_equal(result.timestamps, [0, 25, 50, 75, 100])
+    # t=50 and t=75 see only an observation older than max_age -> neutral HOLD
+    assert result.action_labels() == ["BUY", "BUY", "HOLD", "HOLD", "SELL"]
+
+
+def test_summary_reports_counts_and_throughput(series, backtester):
+    """Test the summary dict."""
+    summary = backtester.run(series).summary()
+
+    assert summary["decisions"] == len(np.unique(series.timestamps))
+    assert sum(summary["actions"].values()) == summary["decisions"]
+    assert set(summary["overrides"]) == {"buy_volatility", "sell_volatility", "low_confidence"}
+    assert summary["decisions_per_second"] > 0
+    assert summary["parameters"]["temperature"] == 0.5
+
+
+def test_load_csv_and_npz(tmp_path, series):
+    """Test the CSV (ISO timestamps) and columnar .npz loaders."""
+    csv_path = tmp_path / "history.csv"
+    csv_path.write_text(
+        "timestamp,source,value\n"
+        "2026-03-01T12:00:05,news_feed,0.4\n"
+        "2026-03-01T12:00:00,price_volatility,0.02\n"
+    )
+    loaded = load_series(csv_path)
+    assert loaded.sources == ["news_feed", "price_volatility"]
+    assert loaded.timestamps[1] - loaded.timestamps[0] == 5.0
+    assert loaded.values.tolist() == [0.02, 0.4]  # Sorted by time
+
+    npz_path = tmp_path / "history.npz"
+    series.save_npz(npz_path)
+    round_trip = load_series(npz_path)
+    assert round_trip.sources == series.sources
+    np.testing.assert_array_equal(round_trip.values, series.values)
+
+    with pytest.raises(ValueError):
+        load_series(tmp_path / "history.json")
+
+
+@pytest.mark.skipif(PARQUET_AVAILABLE, reason="pyarrow is installed")
+def test_parquet_needs_pyarrow(tmp_path):
+    """Test the error when reading Parquet without the optional dependency."""
+    with pytest.raises(ImportError):
+        load_series(tmp_path / "history.parquet")
+
+
+def test_series_from_journal(tmp_path):
+    """Test backtesting straight from a decision journal."""
+    path = str(tmp_path / "decisions.journal")
+    journal = DecisionJournal(path)
+    for value in [0.8, -0.8]:
+        signal = Signal(source="news_feed", value=value)
+        journal.append(
+            {"news_feed": signal},
+            DecisionChain(weights={"news_feed": 1.0}, action="HOLD", reasoning="", is_safe=True),
+        )
+    journal.close()
+
+    with JournalReader(path) as reader:
+        series = SignalSeries.from_journal(reader)
+
+    assert series.sources == ["news_feed"]
+    assert series.values.tolist() == [0.8, -0.8]
+
+
+def test_cli_keeps_zero_overrides(tmp_path, series, monkeypatch, capsys):
+    """Test that an explicit 0 on the command line isn't replaced by the setting."""
+    from src import backtest
+
+    npz_path = tmp_path / "history.npz"
+    series.save_npz(npz_path)
+    gates = []
+    run = Backtester.run
+
+    def recording_run(self, *args, **kwargs):
+        gates.append(self.safety_gate)
+        return run(self, *args, **kwargs)
+
+    monkeypatch.setattr(Backtester, "run", recording_run)
+
+    backtest.main([str(npz_path), "--min-confidence", "0", "--max-volatility-buy", "0.0"])
+
+    assert gates[0].min_confidence_threshold == 0.0
+    assert gates[0].max_volatility_for_buy == 0.0
+    assert gates[0].max_volatility_for_sell == 0.08  # Settings default
+    assert "decisions" in capsys.readouterr().out
@@ -282,3 +282,176 @@ def test_mixed_positive_negative_signals(engine):
     # Should produce a decision based on weighted average
     assert decision.action in ["BUY", "SELL", "HOLD"]
     assert len(decision.weights) == 2
+
+
+def test_decide_batch_matches_decide(engine):
+    """Test that the vectorized batch path agrees with per-cycle decide."""
+    now = datetime.now()
+    frames = [
+        {
+            "twitter_sentiment": Signal(source="twitter_sentiment", value=0.8, timestamp=now),
+            "price_volatility": Signal(source="price_volatility", value=0.03, timestamp=now),
+        },
+        {
+            "twitter_sentiment": Signal(source="twitter_sentiment", value=-0.9, timestamp=now),
+            "news_feed": Signal(
+                source="news_feed", value=-0.6, timestamp=now - timedelta(seconds=30)
+            ),
+        },
+    ]
+
+    result = engine.decide_batch(frames, now=now)
+
+    assert result.sources == ["twitter_sentiment", "price_volatility", "news_feed"]
+    assert result.weights.shape == (2, 3)
+    assert result.weights[0, 2] == 0.0  # news_feed missing from first frame
+    for row, signals in enumerate(frames):
+        decision = engine.decide(signals)
+        assert result.action_labels()[row] == decision.action
+        for col, source in enumerate(result.sources):
+            expected = decision.weights.get(source, 0.0)
+            assert result.weights[row, col] == pytest.approx(expected, abs=1e-4)
+
+
+def test_decide_batch_neutral_rows(engine):
+    """Test that empty and all-zero frames produce neutral HOLD rows."""
+    frames = [
+        {},
+        {"signal1": Signal(source="signal1", value=0.0)},
+        {"signal1": Signal(source="signal1", value=0.9)},
+    ]
+
+    result = engine.decide_batch(frames)
+
+    assert result.neutral.tolist() == [True, True, False]
+    assert result.action_labels() == ["HOLD", "HOLD", "BUY"]
+    assert result.weights[:2].sum() == 0.0
+    assert result.chains is None
+
+
+def test_decide_batch_builds_chains_on_request(engine, sample_signals):
+    """Test that DecisionChain objects are only built when asked for."""
+    result = engine.decide_batch([sample_signals, {}], build_chains=True)
+
+    assert len(result.chains) == 2
+    assert set(result.chains[0].weights) == set(sample_signals)
+    assert "Weighted signal:" in result.chains[0].reasoning
+    assert result.chains[1].weights == {}
+    assert result.chains[1].action == "HOLD"
+
+
+def test_decide_incremental_matches_decide(engine, sample_signals):
+    """Test that the incremental state tracks the full recomputation."""
+    engine.decide_incremental(sample_signals)
+    update = {"news_feed": Signal(source="news_feed", value=-0.9, raw_content="Sell-off")}
+
+    decision = engine.decide_incremental(update)
+    expected = engine.decide({**sample_signals, **update})
+
+    assert decision.action == expected.action
+    for source, weight in expected.weights.items():
+        assert decision.weights[source] == pytest.approx(weight, abs=1e-4)
+
+
+def test_decide_incremental_removed_and_neutral(engine):
+    """Test removing sources and falling back to neutral."""
+    engine.decide_incremental(
+        {
+            "a": Signal(source="a", value=0.8),
+            "b": Signal(source="b", value=0.0),
+        }
+    )
+
+    decision = engine.decide_incremental({}, removed=["a"])
+
+    assert decision.action == "HOLD"
+    assert decision.weights == {}
+    assert len(engine.fusion_state) == 1
+
+
+def test_incremental_state_stays_finite_for_large_scores():
+    """Test that the exp shift is rebased before scores overflow."""
+    from src.brain import IncrementalFusionState
+
+    state = IncrementalFusionState(temperature=0.001)
+    state.update("a", Signal(source="a", value=0.1))
+    state.update("b", Signal(source="b", value=0.9))
+
+    assert sum(state.weights().values()) == pytest.approx(1.0)
+    assert state.weight("b") == pytest.approx(1.0)
+    assert state.weighted_value == pytest.approx(0.9)
+
+
+def test_incremental_state_drift_is_bounded():
+    """Test that many O(1) updates stay close to a full rescan."""
+    import random
+
+    from src.brain import IncrementalFusionState
+
+    rng = random.Random(3)
+    now = datetime.now()
+    state = IncrementalFusionState(temperature=0.5, renormalize_every=10_000)
+    for _ in range(5_000):
+        source = f"sensor_{rng.randrange(20)}"
+        state.update(source, Signal(source=source, value=rng.uniform(-1, 1), timestamp=now), now)
+
+    weighted_value = state.weighted_value
+    weights = state.weights()
+    state.renormalize(now)
+
+    assert weighted_value == pytest.approx(state.weighted_value, abs=1e-9)
+    for source, weight in state.weights().items():
+        assert weights[source] == pytest.approx(weight, abs=1e-9)
+
+
+def test_incremental_state_reages_unchanged_signals():
+    """Test that unchanged (cached) signals keep decaying between updates."""
+    from datetime import timedelta
+
+    from src.brain import IncrementalFusionState
+
+    start = datetime.now()
+    state = IncrementalFusionState(renormalize_interval=1.0)
+    state.update("old", Signal(source="old", value=0.5, timestamp=start), start)
+    state.update("new", Signal(source="new", value=0.5, timestamp=start), start)
+    state.renormalize(start)
+    assert not state.renormalize_due(start)
+
+    later = start + timedelta(seconds=30)
+    state.update("new", Signal(source="new", value=0.5, timestamp=later), later)
+    assert state.renormalize_due(later)
+
+    stale_weight = state.weight("old")
+    state.renormalize(later)
+    assert state.weight("old") < stale_weight
+
+
+def test_decide_incremental_reages_from_fresh_state(engine, monkeypatch):
+    """Test that a fresh state re-ages sources without a manual renormalize()."""
+    import src.brain
+
+    start = datetime.now()
+    clock = [start]
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock[0]
+
+    monkeypatch.setattr(src.brain, "datetime", FrozenDatetime)
+
+    engine.decide_incremental(
+        {
+            "a": Signal(source="a", value=0.5, timestamp=start),
+            "b": Signal(source="b", value=0.5, timestamp=start),
+        }
+    )
+    clock[0] = start + timedelta(seconds=300)
+    update = {"b": Signal(source="b", value=0.5, timestamp=clock[0])}
+
+    decision = engine.decide_incremental(update)
+    expected = engine.decide({**engine.fusion_state.signals, **update})
+
+    assert decision.weights["a"] < decision.weights["b"]
+    for source, weight in expected.weights.items():
+        assert decision.weights[source] == pytest.approx(weight, abs=1e-9)
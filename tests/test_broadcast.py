@@ -0,0 +1,116 @@
+"""
+Tests for decision push streams (broadcast.py and the /stream, /ws endpoints)
+"""
+
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from src.broadcast import Broadcaster
+from src.metrics import MetricsCollector
+from src.schemas import DecisionChain, Signal, SystemState
+
+
+def make_decision(action="BUY"):
+    return DecisionChain(
+        weights={"news_feed": 1.0}, action=action, reasoning="test", is_safe=True
+    )
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    """A fresh broadcaster installed as the global one."""
+    broadcaster = Broadcaster(max_queue=3, max_clients=2, metrics=MetricsCollector())
+    monkeypatch.setattr(main, "get_broadcaster", lambda: broadcaster)
+    monkeypatch.setattr(main, "system_state", SystemState())
+    return broadcaster
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_one_encoding(hub):
+    """Test that every subscriber receives the same pre-encoded message."""
+    first, second = hub.subscribe(), hub.subscribe()
+
+    hub.publish_cycle(make_decision(), {"news_feed": Signal(source="news_feed", value=0.4)})
+
+    signals_a, decision_a = await first.get(), await first.get()
+    assert (await second.get()) is signals_a
+    decision_b = await second.get()
+    assert decision_a is decision_b  # Serialized once, shared
+    assert signals_a.event == "signals"
+    assert json.loads(signals_a.data)["updated"]["news_feed"]["value"] == 0.4
+    assert json.loads(decision_a.data)["action"] == "BUY"
+    assert decision_a.sse.startswith(b"id: 2\nevent: decision\ndata: {")
+    assert hub.metrics.get_stream_stats()["published"] == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped(hub):
+    """Test that a client that stops reading is disconnected, not waited on."""
+    slow, fast = hub.subscribe(), hub.subscribe()
+
+    for i in range(5):
+        hub.publish("decision", {"n": i})
+        await fast.get()
+
+    assert slow.dropped
+    assert [m async for m in slow] == []  # Backlog discarded, stream ended
+    assert len(hub) == 1
+    assert hub.metrics.get_stream_stats() == {
+        "clients": 1,
+        "published": 5,
+        "dropped_slow_clients": 1,
+    }
+
+
+def test_client_limit_and_snapshot(hub):
+    """Test the max_clients cap and the resync snapshot for new clients."""
+    signals = {"news_feed": Signal(source="news_feed", value=0.2)}
+    snapshot = hub.snapshot(make_decision("SELL"), signals)
+    assert [m.event for m in snapshot] == ["signals", "decision"]
+
+    hub.subscribe(snapshot)
+    hub.subscribe()
+    with pytest.raises(OverflowError):
+        hub.subscribe()
+
+
+@pytest.mark.asyncio
+async def test_sse_endpoint_streams_snapshot_then_cycles(hub):
+    """Test the SSE body: snapshot first, pushed cycles after, ends on close."""
+    main.system_state.latest_decision = make_decision("HOLD")
+
+    response = await main.stream_decisions()
+    assert response.media_type == "text/event-stream"
+
+    body = response.body_iterator
+    assert b"event: decision" in await body.__anext__()
+
+    hub.publish("decision", make_decision("SELL"))
+    assert b'"action":"SELL"' in await body.__anext__()
+
+    hub.close_all()
+    with pytest.raises(StopAsyncIteration):
+        await body.__anext__()
+    assert len(hub) == 0
+
+
+def test_websocket_endpoint_pushes_envelopes(hub):
+    """Test the WebSocket feed over the ASGI app."""
+    main.system_state.latest_decision = make_decision("BUY")
+
+    with TestClient(main.app).websocket_connect("/ws") as ws:
+        first = ws.receive_json()
+        assert first["event"] == "decision"
+        assert first["data"]["action"] == "BUY"
+        assert isinstance(first["id"], int)
+
+    # Disconnecting unsubscribes the client
+    for _ in range(20):
+        if len(hub) == 0:
+            break
+        time.sleep(0.01)
+    assert len(hub) == 0
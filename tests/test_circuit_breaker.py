@@ -0,0 +1,157 @@
+"""
+Tests for per-sensor circuit breakers (circuit_breaker.py)
+"""
+
+import asyncio
+
+import pytest
+
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.metrics import MetricsCollector
+from src.sensor_registry import Sensor
+from src.sensors import AsyncPerceptionHub
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fail(breaker, metrics):
+    metrics.record_sensor_failure(breaker.source)
+    breaker.record_failure()
+
+
+def succeed(breaker, metrics):
+    metrics.record_sensor_success(breaker.source, latency_ms=1.0)
+    breaker.record_success()
+
+
+@pytest.fixture
+def metrics():
+    return MetricsCollector()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(metrics, clock):
+    return CircuitBreaker(
+        "feed", metrics, failure_rate_threshold=0.5, min_calls=4, reset_timeout=10.0, clock=clock
+    )
+
+
+def test_breaker_trips_on_failure_rate(breaker, metrics):
+    """Test that the breaker opens once the failure rate crosses the threshold."""
+    succeed(breaker, metrics)
+    fail(breaker, metrics)
+    fail(breaker, metrics)
+    assert breaker.state == CLOSED  # Only 3 calls, below min_calls
+
+    fail(breaker, metrics)
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert metrics.get_breaker_stats()["feed"] == {"state": "open", "trips": 1}
+
+
+def test_breaker_ignores_failures_before_its_window(metrics, clock):
+    """Test that history recorded before the breaker existed doesn't trip it."""
+    for _ in range(10):
+        metrics.record_sensor_failure("feed")
+
+    breaker = CircuitBreaker("feed", metrics, min_calls=4, clock=clock)
+    succeed(breaker, metrics)
+
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate() == (0.0, 1)
+
+
+def test_breaker_window_rolls(metrics, clock):
+    """Test that a failure burst straddling a window boundary still trips the breaker."""
+    breaker = CircuitBreaker(
+        "feed", metrics, failure_rate_threshold=0.6, min_calls=10, window=10, clock=clock
+    )
+    for _ in range(5):
+        succeed(breaker, metrics)
+    for _ in range(5):
+        fail(breaker, metrics)
+    assert breaker.state == CLOSED  # 50% over the first 10 calls
+
+    fail(breaker, metrics)
+
+    assert breaker.state == OPEN  # 60% over the last 10
+    assert breaker.failure_rate() == (0.6, 10)
+
+
+def test_half_open_probe_closes_on_success(breaker, metrics, clock):
+    """Test that a single probe is allowed after the reset timeout."""
+    for _ in range(4):
+        fail(breaker, metrics)
+    assert breaker.state == OPEN
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # Only one probe at a time
+
+    succeed(breaker, metrics)
+
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_backs_off(breaker, metrics, clock):
+    """Test that a failed probe re-opens with a doubled timeout."""
+    for _ in range(4):
+        fail(breaker, metrics)
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    fail(breaker, metrics)
+
+    assert breaker.state == OPEN
+    assert breaker.reset_timeout == 20.0
+    clock.now = 25.0
+    assert not breaker.allow_request()
+    clock.now = 30.0
+    assert breaker.allow_request()
+
+
+@pytest.mark.asyncio
+async def test_hub_skips_open_sensor_immediately():
+    """Test that an open breaker short-circuits the fetch without waiting."""
+
+    class DeadSensor(Sensor):
+        name = "dead"
+        calls = 0
+
+        async def fetch(self, client):
+            type(self).calls += 1
+            raise asyncio.TimeoutError("upstream down")
+
+    hub = AsyncPerceptionHub(timeout=1.0, max_retries=1, retry_delay=0.01, sensors=[DeadSensor()])
+    hub.metrics = MetricsCollector()
+    min_calls = hub.settings.breaker_min_calls
+
+    for _ in range(min_calls):
+        await hub.fetch_all()
+    assert hub.breakers["dead"].state == OPEN
+    assert DeadSensor.calls == min_calls
+
+    signals = await hub.fetch_all()
+
+    assert DeadSensor.calls == min_calls  # Skipped, not fetched
+    assert signals["dead"].value == 0.0
+    assert "circuit open" in signals["dead"].raw_content
+    assert hub.metrics.get_all_stats()["breakers"]["dead"]["state"] == "open"
+
+    await hub.close()
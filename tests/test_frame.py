@@ -0,0 +1,139 @@
+"""
+Tests for the columnar SignalFrame (frame.py)
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.backtest import SignalSeries
+from src.frame import NO_TEXT, SignalFrame, from_ns, to_ns
+from src.schemas import Signal, SignalRecord
+
+T0 = datetime(2026, 3, 1, 12, 0, 0, 250_000)
+
+
+def make_frame(rows=6):
+    """Alternating sources, one second apart, text on even rows."""
+    frame = SignalFrame()
+    for i in range(rows):
+        frame.append(
+            "news_feed" if i % 2 else "twitter_sentiment",
+            i / 10,
+            T0 + timedelta(seconds=i),
+            f"row {i} ✓" if i % 2 == 0 else None,
+        )
+    return frame
+
+
+def test_append_builds_parallel_columns():
+    """Test column contents, dtypes and the shared text buffer."""
+    frame = make_frame()
+
+    assert len(frame) == 6
+    assert frame.sources == ["twitter_sentiment", "news_feed"]
+    assert frame.source_ids.tolist() == [0, 1, 0, 1, 0, 1]
+    assert frame.values.dtype == np.float64 and frame.timestamps.dtype == np.int64
+    assert frame.values.flags.c_contiguous
+    assert frame.text_lengths[1] == NO_TEXT
+    assert frame.raw_content(2) == "row 2 ✓"
+    assert frame[3] == SignalRecord("news_feed", 0.3, T0 + timedelta(seconds=3), None)
+
+
+def test_nanosecond_timestamps_round_trip():
+    """Test exact datetime <-> epoch-ns conversion."""
+    ns = to_ns(T0)
+    assert ns % 1000 == 0
+    assert from_ns(ns) == T0
+    assert to_ns(ns) == ns
+
+
+def test_from_signals_accepts_models_and_records():
+    """Test building from either signal type and reading rows back."""
+    signals = [
+        Signal(source="a", value=0.5, timestamp=T0, raw_content="model"),
+        SignalRecord("b", -0.5, T0, None),
+    ]
+    frame = SignalFrame.from_signals(signals)
+
+    assert list(frame) == [SignalRecord.from_model(signals[0]), signals[1]]
+
+
+def test_slices_are_views_and_copy_on_append():
+    """Test zero-copy slicing and that appending to a view leaves the parent alone."""
+    frame = make_frame()
+    view = frame[2:5]
+
+    assert len(view) == 3
+    assert np.shares_memory(view.values, frame.values)
+    assert view[0].raw_content == "row 2 ✓"
+
+    view.append("price_volatility", 0.9, T0)
+    assert len(view) == 4 and len(frame) == 6
+    assert not np.shares_memory(view.values, frame.values)
+    assert frame[5].source == "news_feed"
+    assert "price_volatility" not in frame.sources
+
+    stepped = frame[::2]
+    assert [r.source for r in stepped] == ["twitter_sentiment"] * 3
+
+
+def test_window_binary_search_and_unsorted_fallback():
+    """Test [start, end) windows on sorted and unsorted frames."""
+    frame = make_frame()
+    window = frame.window(T0 + timedelta(seconds=1), T0 + timedelta(seconds=4))
+
+    assert window.values.tolist() == [0.1, 0.2, 0.3]
+    assert np.shares_memory(window.values, frame.values)
+
+    shuffled = frame.take(np.array([4, 0, 2, 5]))
+    assert not shuffled.is_sorted()
+    assert shuffled.window(end=T0 + timedelta(seconds=3)).values.tolist() == [0.0, 0.2]
+
+
+def test_sorted_flag_tracks_appends(monkeypatch):
+    """Test that order is tracked on append and window() never rescans a sorted frame."""
+    frame = make_frame()
+    monkeypatch.setattr(np, "diff", pytest.fail)
+    for _ in range(3):
+        frame.window(T0, T0 + timedelta(seconds=2))
+    assert frame.is_sorted() and frame[1:4].is_sorted()
+    assert frame.take(frame.values > 0.2).is_sorted()
+
+    frame.append("news_feed", 1.0, T0)
+    assert not frame.is_sorted()
+    assert frame.window(end=T0 + timedelta(seconds=1)).values.tolist() == [0.0, 1.0]
+    monkeypatch.undo()
+
+    arrays = SignalFrame.from_arrays(["a"], np.zeros(3), np.ones(3), np.array([3, 1, 2]))
+    assert not arrays.is_sorted()
+    assert arrays[1:].is_sorted()
+
+
+def test_latest_per_source():
+    """Test that latest() picks the newest row per source."""
+    frame = make_frame()
+    frame.append("twitter_sentiment", -1.0, T0)  # Old timestamp, appended last
+
+    latest = frame.latest()
+    assert latest["twitter_sentiment"].value == 0.4
+    assert latest["news_feed"].value == 0.5
+    assert latest["news_feed"].raw_content is None
+
+
+def test_from_arrays_and_series_hand_off():
+    """Test wrapping existing columns and converting to a backtest series."""
+    timestamps = np.array([to_ns(T0), to_ns(T0) + 10**9], dtype=np.int64)
+    frame = SignalFrame.from_arrays(["a", "b"], np.array([1, 0]), np.array([0.2, 0.4]), timestamps)
+
+    assert np.shares_memory(frame.timestamps, timestamps)  # No copy
+    assert frame[0].source == "b" and frame[0].raw_content is None
+    assert memoryview(frame.values).format == "d"
+
+    series = SignalSeries.from_frame(frame)
+    assert series.sources == ["a", "b"]
+    assert series.timestamps[1] - series.timestamps[0] == pytest.approx(1.0)
+
+    with pytest.raises(ValueError):
+        SignalFrame.from_arrays(["a"], np.array([0]), np.array([0.1, 0.2]), timestamps)
@@ -0,0 +1,65 @@
+"""
+Tests for the log-bucketed latency histogram (histogram.py)
+"""
+
+import numpy as np
+import pytest
+
+from src.histogram import LatencyHistogram
+
+
+def test_bucket_bounds_contain_their_values():
+    """Test that every value maps to a bucket whose bounds contain it."""
+    histogram = LatencyHistogram()
+
+    for units in [*range(2000), 65_537, 10**6, 123_456_789]:
+        low, high = histogram._bucket_bounds(histogram._index(units))
+        assert low <= units < high
+        assert high - low <= max(1, low / 128)  # 8 precision bits -> <= 2**-7 relative width
+
+
+def test_quantiles_within_relative_error():
+    """Test percentiles of a heavy-tailed sample against exact quantiles."""
+    samples = np.random.default_rng(3).lognormal(2.0, 1.0, 50_000)
+    histogram = LatencyHistogram()
+    for latency in samples.tolist():
+        histogram.record(latency)
+
+    for quantile in (0.5, 0.9, 0.99, 0.999):
+        exact = np.quantile(samples, quantile, method="inverted_cdf")
+        assert histogram.quantile(quantile) == pytest.approx(exact, rel=0.01)
+
+    assert histogram.count == len(samples)
+    assert histogram.mean_ms == pytest.approx(samples.mean())
+    assert histogram.quantile(1.0) == samples.max()
+    assert histogram.quantile(0.0) == pytest.approx(samples.min(), abs=0.001)
+
+
+def test_tail_outlier_is_visible():
+    """Test that a single slow cycle shows up in p99.9 but not p50."""
+    histogram = LatencyHistogram()
+    for _ in range(999):
+        histogram.record(2.0)
+    histogram.record(750.0)
+
+    percentiles = histogram.percentiles()
+    assert percentiles["p50"] == pytest.approx(2.0, rel=0.01)
+    assert percentiles["p999"] == pytest.approx(2.0, rel=0.01)
+    assert histogram.quantiles([1.0, 0.5]) == [750.0, pytest.approx(2.0, rel=0.01)]
+
+
+def test_empty_overflow_and_reset():
+    """Test the empty histogram, values beyond max_ms, and reset()."""
+    histogram = LatencyHistogram(max_ms=100.0)
+    assert histogram.percentiles() == {"p50": 0.0, "p90": 0.0, "p99": 0.0, "p999": 0.0}
+
+    histogram.record(5_000.0)  # Top bucket, exact max still tracked
+    histogram.record(0.0)
+    assert histogram.quantile(1.0) == pytest.approx(100.0, rel=0.01)
+    assert histogram.max_seen_ms == 5_000.0
+
+    histogram.reset()
+    assert len(histogram) == 0 and histogram.quantile(0.5) == 0.0
+
+    with pytest.raises(ValueError):
+        LatencyHistogram(resolution_ms=0)
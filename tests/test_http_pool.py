@@ -0,0 +1,154 @@
+"""
+Tests for the shared sensor connection pool (http_pool.py) against a local stub server.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.http_pool import ConnectionPool
+from src.metrics import MetricsCollector
+from src.sensor_registry import HttpJsonSensor
+from src.sensors import AsyncPerceptionHub
+
+
+class StubHTTPServer:
+    """Minimal keep-alive HTTP/1.1 server that counts TCP connections."""
+
+    def __init__(self, body: dict, delay: float = 0.0):
+        self.body = json.dumps(body).encode()
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/signal"
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *args):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                self.requests += 1
+                await asyncio.sleep(self.delay)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    + f"Content-Length: {len(self.body)}\r\n\r\n".encode()
+                    + self.body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_keepalive_connections():
+    """Test that sequential requests share one kept-alive connection."""
+    metrics = MetricsCollector()
+    async with StubHTTPServer({"value": 0.4}) as server:
+        pool = ConnectionPool(timeout=2.0, http2=False, metrics=metrics)
+
+        for _ in range(5):
+            response = await pool.get(server.url)
+            assert response.json() == {"value": 0.4}
+
+        stats = pool.stats()
+        await pool.aclose()
+
+    assert server.requests == 5
+    assert server.connections == 1
+    (host,) = stats
+    assert stats[host] == {"active": 0, "idle": 1}
+    assert metrics.get_pool_stats()[host]["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_connections_and_records_wait():
+    """Test that concurrent requests beyond the limit wait for a slot."""
+    metrics = MetricsCollector()
+    async with StubHTTPServer({"value": 0.1}, delay=0.05) as server:
+        pool = ConnectionPool(timeout=2.0, max_connections=2, http2=False, metrics=metrics)
+
+        await asyncio.gather(*(pool.get(server.url) for _ in range(6)))
+        await pool.aclose()
+
+    assert server.connections <= 2
+    host_stats = next(iter(metrics.get_pool_stats().values()))
+    assert host_stats["max_wait_ms"] >= 40  # Later requests queued behind the first two
+
+
+@pytest.mark.asyncio
+async def test_pool_idle_count_tracks_connections():
+    """Test that the bookkept idle count follows concurrency, keep-alive cap and expiry."""
+    metrics = MetricsCollector()
+    async with StubHTTPServer({"value": 0.1}, delay=0.02) as server:
+        pool = ConnectionPool(
+            timeout=2.0,
+            max_keepalive_connections=2,
+            keepalive_expiry=0.1,
+            http2=False,
+            metrics=metrics,
+        )
+
+        await asyncio.gather(*(pool.get(server.url) for _ in range(3)))
+        (host,) = pool.stats()
+        assert server.connections == 3
+        assert pool.stats()[host] == {"active": 0, "idle": 2}  # Capped at max keep-alive
+
+        await asyncio.sleep(0.15)
+        assert pool.stats()[host]["idle"] == 0  # Expired
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_partitions_by_host():
+    """Test that each upstream host gets its own client partition."""
+    async with StubHTTPServer({"value": 1.0}) as first, StubHTTPServer({"value": 2.0}) as second:
+        pool = ConnectionPool(timeout=2.0, http2=False, metrics=MetricsCollector())
+
+        await pool.get(first.url)
+        await pool.get(second.url)
+
+        assert len(pool.stats()) == 2
+        await pool.aclose()
+
+    assert pool.is_closed
+
+
+@pytest.mark.asyncio
+async def test_http_json_sensor_through_hub():
+    """Test a registry HTTP sensor fetching via the hub's shared pool."""
+    async with StubHTTPServer({"value": -0.3, "raw_content": "stub"}) as server:
+        sensor = HttpJsonSensor(name="stub_feed", url=server.url)
+        hub = AsyncPerceptionHub(timeout=2.0, max_retries=1, sensors=[sensor])
+
+        signals = await hub.fetch_all()
+        await hub.fetch_all()
+        await hub.close()
+
+    assert signals["stub_feed"].value == -0.3
+    assert signals["stub_feed"].raw_content == "stub"
+    assert server.connections == 1
+
+
+def test_http_json_sensor_requires_url():
+    """Test that an HTTP sensor without a URL is rejected."""
+    with pytest.raises(ValueError):
+        HttpJsonSensor(name="no_url")
@@ -0,0 +1,254 @@
+"""
+Tests for the append-only decision journal (journal.py)
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import main
+from main import AgentOrchestrator
+from src.config import Settings
+from src.journal import (
+    DECISION,
+    RECORD_SIZE,
+    SIGNAL,
+    WEIGHT,
+    DecisionJournal,
+    JournalReader,
+    strings_path,
+)
+from src.schemas import DecisionChain, Signal, SystemState
+
+
+def make_decision(timestamp, action="BUY", is_safe=True, override_reason=None):
+    return DecisionChain(
+        timestamp=timestamp,
+        weights={"twitter_sentiment": 0.6, "news_feed": 0.4},
+        action=action,
+        reasoning="Weighted signal favours the action",
+        is_safe=is_safe,
+        override_reason=override_reason,
+        explanation=f"Explained at {timestamp.isoformat()}",
+    )
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "decisions.journal")
+
+
+def test_round_trip(journal_path):
+    """Test that decisions and signals read back unchanged."""
+    now = datetime(2026, 3, 1, 12, 0, 0)
+    signals = {
+        "twitter_sentiment": Signal(source="twitter_sentiment", value=0.8, timestamp=now),
+        "news_feed": Signal(source="news_feed", value=-0.2, timestamp=now, stale=True),
+    }
+    decision = make_decision(now, action="HOLD", is_safe=False, override_reason="Too volatile")
+
+    journal = DecisionJournal(journal_path)
+    journal.append(signals, decision)
+    journal.close()
+
+    with JournalReader(journal_path) as reader:
+        assert len(reader) == 1
+        assert reader.recent(1) == [decision]
+        ((replayed_signals, replayed_decision),) = reader.replay()
+
+    assert replayed_decision == decision
+    assert {src: sig.to_model() for src, sig in replayed_signals.items()} == signals
+
+
+def test_fixed_records_and_interned_strings(journal_path):
+    """Test the record layout and that repeated strings are stored once."""
+    start = datetime(2026, 3, 1)
+    journal = DecisionJournal(journal_path)
+    for i in range(50):
+        ts = start + timedelta(seconds=i)
+        journal.append({"news_feed": Signal(source="news_feed", value=0.1, timestamp=ts)},
+                       make_decision(ts))
+    journal.close()
+
+    # 1 signal + 1 decision + 2 weights per cycle, plus the header record
+    assert os.path.getsize(journal_path) == RECORD_SIZE * (1 + 50 * 4)
+
+    with JournalReader(journal_path) as reader:
+        kinds = reader.records["kind"]
+        assert np.count_nonzero(kinds == SIGNAL) == 50
+        assert np.count_nonzero(kinds == DECISION) == 50
+        assert np.count_nonzero(kinds == WEIGHT) == 100
+        assert not reader.records.flags.owndata  # Zero-copy view onto the map
+
+    strings = open(strings_path(journal_path), "rb").read()
+    assert strings.count(b"news_feed") == 1
+    assert strings.count(b"Weighted signal favours the action") == 1
+
+
+def test_decision_texts_stored_as_templates(journal_path):
+    """Test that reasoning/explanation round-trip exactly but store only their numbers."""
+    start = datetime(2026, 3, 1)
+    texts = [
+        (
+            f"Weighted signal: {v:.3f} | Dominant source: news_feed ({w:.1%} weight)",
+            f"I decided to BUY (weight: {w:.1%}, value: {v:.2f}). Passed 3 checks.",
+        )
+        for v, w in ((0.512, 0.41), (-0.25, 0.377), (1.0, 0.9))
+    ]
+    journal = DecisionJournal(journal_path)
+    for i, (reasoning, explanation) in enumerate(texts):
+        decision = make_decision(start + timedelta(seconds=i)).model_copy(
+            update={"reasoning": reasoning, "explanation": explanation}
+        )
+        journal.append({}, decision)
+    journal.append({}, make_decision(start).model_copy(update={"reasoning": "odd \x1f text"}))
+    journal.close()
+
+    with JournalReader(journal_path) as reader:
+        decisions = reader.recent(10)
+    assert [(d.reasoning, d.explanation) for d in decisions[:3]] == texts
+    assert decisions[3].reasoning == "odd \x1f text"
+
+    strings = open(strings_path(journal_path), "rb").read()
+    assert strings.count(b"Dominant source: news_feed") == 1
+
+
+def test_string_ids_past_4gib(journal_path):
+    """Test that string offsets beyond the old 32-bit limit are written and read back."""
+    journal = DecisionJournal(journal_path)
+    journal.close()
+    # Sparse file: puts the next string past 2**32 without writing 4 GiB
+    os.truncate(strings_path(journal_path), 2**32 + 16)
+
+    now = datetime(2026, 3, 1)
+    decision = make_decision(now, action="HOLD", is_safe=False, override_reason="Past 4 GiB")
+    journal = DecisionJournal(journal_path)
+    journal.append({"news_feed": Signal(source="news_feed", value=0.3, timestamp=now)}, decision)
+    journal.close()
+
+    with JournalReader(journal_path) as reader:
+        assert int(reader.records["key"].max()) > 2**32
+        assert reader.recent(1) == [decision]
+        ((signals, _),) = reader.replay()
+    assert signals["news_feed"].value == 0.3
+
+
+def test_time_range_queries(journal_path):
+    """Test since/until/limit lookups over decision timestamps."""
+    start = datetime(2026, 3, 1)
+    journal = DecisionJournal(journal_path)
+    for i in range(10):
+        journal.append({}, make_decision(start + timedelta(minutes=i)))
+    journal.close()
+
+    with JournalReader(journal_path) as reader:
+        window = reader.decisions(
+            since=start + timedelta(minutes=3), until=start + timedelta(minutes=6)
+        )
+        assert [d.timestamp.minute for d in window] == [3, 4, 5]
+
+        latest = reader.decisions(since=start + timedelta(minutes=3), limit=2)
+        assert [d.timestamp.minute for d in latest] == [8, 9]
+
+        assert reader.decisions(since=start + timedelta(hours=1)) == []
+
+
+def test_reader_refresh_and_torn_tail_recovery(journal_path):
+    """Test that readers see new appends and a torn record is dropped on reopen."""
+    now = datetime(2026, 3, 1)
+    journal = DecisionJournal(journal_path)
+    journal.append({}, make_decision(now))
+    reader = JournalReader(journal_path)
+    assert len(reader) == 1
+
+    journal.append({}, make_decision(now + timedelta(seconds=1)))
+    reader.refresh()
+    assert len(reader) == 2
+    journal.close()
+    reader.close()
+
+    with open(journal_path, "ab") as handle:
+        handle.write(b"\x01" * 10)  # Crash mid-record
+
+    journal = DecisionJournal(journal_path)
+    journal.append({}, make_decision(now + timedelta(seconds=2)))
+    journal.close()
+
+    with JournalReader(journal_path) as reader:
+        assert [d.timestamp.second for d in reader.recent(10)] == [0, 1, 2]
+
+
+def test_reader_refresh_scans_only_new_records(journal_path, monkeypatch):
+    """Test that refresh() skips unchanged files and only scans appended records."""
+    now = datetime(2026, 3, 1)
+    journal = DecisionJournal(journal_path)
+    for i in range(3):
+        journal.append({"news_feed": Signal(source="news_feed", value=0.1)}, make_decision(now))
+    reader = JournalReader(journal_path)
+    records_map = reader._records_map
+
+    reader.refresh()
+    assert reader._records_map is records_map
+
+    scanned = []
+    flatnonzero = np.flatnonzero
+    monkeypatch.setattr(np, "flatnonzero", lambda a: scanned.append(len(a)) or flatnonzero(a))
+    journal.append({}, make_decision(now + timedelta(seconds=1), action="SELL"))
+    reader.refresh()
+
+    assert scanned == [3]  # One decision and its two weight records
+    assert len(reader) == 4
+    assert reader.decision_actions().tolist()[-1] == 2
+    assert reader.recent(1)[0].action == "SELL"
+    journal.close()
+    reader.close()
+
+
+def test_rejects_foreign_files(journal_path):
+    """Test that a file without the journal header isn't appended to."""
+    with open(journal_path, "wb") as handle:
+        handle.write(b"not a journal")
+
+    with pytest.raises(ValueError):
+        DecisionJournal(journal_path)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_journals_each_cycle(journal_path, monkeypatch):
+    """Test that every processed cycle lands in the journal and /history."""
+    monkeypatch.setattr(main, "system_state", SystemState())
+    settings = Settings(JOURNAL_PATH=journal_path)
+    orchestrator = AgentOrchestrator(settings)
+
+    orchestrator._run_event_cycle({"news_feed": Signal(source="news_feed", value=0.7)})
+    orchestrator._run_event_cycle({"twitter_sentiment": Signal(source="twitter_sentiment", value=0.4)})
+
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    response = await main.get_history(limit=10, since=None, until=None)
+    history = json.loads(response.body)
+
+    assert history["total"] == 2
+    assert history["decisions"][0]["weights"].keys() == {"news_feed", "twitter_sentiment"}
+    assert history["decisions"][1]["weights"].keys() == {"news_feed"}
+
+    await orchestrator.stop()
+
+
+def test_status_history_without_journal(monkeypatch):
+    """Test that /status keeps recent decisions in memory when the journal is off."""
+    monkeypatch.setattr(main, "system_state", SystemState())
+    settings = Settings(JOURNAL_PATH=None)
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    orchestrator = AgentOrchestrator(settings)
+
+    for value in (0.7, -0.7, 0.2):
+        orchestrator._run_event_cycle({"news_feed": Signal(source="news_feed", value=value)})
+
+    state = main.system_state
+    events = main.render_status(state, state.latest_decision)["context_memory"]["events"]
+    assert len(events) == 3
+    newest_first = reversed(state.recent_decisions)
+    assert [e["timestamp"] for e in events] == [d.timestamp for d in newest_first]
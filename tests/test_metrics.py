@@ -64,6 +64,25 @@ def test_record_sensor_success():
     assert stats["twitter"]["avg_latency_ms"] == pytest.approx(55.0, rel=0.01)
 
 
+def test_sensor_latency_quantile_is_cached():
+    """Test that the hedge quantile reads first-request latencies and refreshes lazily."""
+    collector = MetricsCollector()
+    collector.record_sensor_success("twitter", latency_ms=1.0)  # Hedged/observed: not an input
+    assert collector.sensor_latency_quantile("twitter", 0.95) is None
+
+    for latency in range(1, 21):
+        collector.record_sensor_primary_latency("twitter", latency_ms=float(latency))
+    assert collector.sensor_latency_quantile("twitter", 0.5, refresh_every=10) == 11.0
+
+    # Fewer than refresh_every new samples: cached value served
+    for _ in range(9):
+        collector.record_sensor_primary_latency("twitter", latency_ms=100.0)
+    assert collector.sensor_latency_quantile("twitter", 0.5, refresh_every=10) == 11.0
+
+    collector.record_sensor_primary_latency("twitter", latency_ms=100.0)
+    assert collector.sensor_latency_quantile("twitter", 0.5, refresh_every=10) == 16.0
+
+
 def test_record_safety_gate():
     """Test recording safety gate results."""
     collector = MetricsCollector()
@@ -154,3 +173,23 @@ def test_multiple_sensors():
     assert "market" in stats
     assert "news" in stats
     assert stats["news"]["success_rate"] == 0.0
+
+
+def test_latency_percentiles():
+    """Test lifetime percentiles alongside the windowed averages."""
+    collector = MetricsCollector(window_size=10)
+
+    for latency in [10.0] * 990 + [500.0] * 10:
+        collector.record_decision_latency(latency)
+        collector.record_api_request(latency / 10)
+    collector.record_sensor_success("twitter", latency_ms=40)
+
+    decision = collector.get_decision_stats()
+    assert decision["avg_latency_ms"] == 500.0  # Window holds only the outliers
+    assert decision["p50_latency_ms"] == pytest.approx(10.0, rel=0.01)
+    assert decision["p99_latency_ms"] == pytest.approx(10.0, rel=0.01)
+    assert decision["p999_latency_ms"] == pytest.approx(500.0, rel=0.01)
+
+    assert collector.get_api_stats()["p999_latency_ms"] == pytest.approx(50.0, rel=0.01)
+    assert collector.get_sensor_stats()["twitter"]["p90_latency_ms"] == pytest.approx(40.0)
+    assert "p50_latency_ms" not in collector.get_sensor_stats().get("news", {})
@@ -0,0 +1,99 @@
+"""
+Tests for AgentOrchestrator (main.py)
+"""
+
+import asyncio
+
+import pytest
+
+import main
+from main import AgentOrchestrator
+from src.config import Settings
+from src.schemas import Signal, SignalRecord, SystemState
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    """Create an orchestrator with fresh shared state."""
+    monkeypatch.setattr(main, "system_state", SystemState())
+    return AgentOrchestrator(Settings(EVENT_DEBOUNCE_MS=30))
+
+
+@pytest.mark.asyncio
+async def test_collect_updates_coalesces_within_debounce(orchestrator):
+    """Test that signals inside the debounce window become one update set."""
+    queue = asyncio.Queue()
+
+    async def produce():
+        await queue.put(Signal(source="news_feed", value=0.1))
+        await asyncio.sleep(0.005)
+        await queue.put(Signal(source="twitter_sentiment", value=0.4))
+        await queue.put(Signal(source="news_feed", value=0.9))
+
+    producer = asyncio.create_task(produce())
+    updates = await orchestrator._collect_updates(queue)
+    await producer
+
+    assert set(updates) == {"news_feed", "twitter_sentiment"}
+    assert updates["news_feed"].value == 0.9  # Latest signal per source wins
+
+    await orchestrator.perception_hub.close()
+
+
+@pytest.mark.asyncio
+async def test_event_cycle_keeps_unchanged_sources(orchestrator):
+    """Test that an event-driven update merges with the previous signals."""
+    orchestrator._run_event_cycle(
+        {
+            "twitter_sentiment": Signal(source="twitter_sentiment", value=0.8),
+            "price_volatility": Signal(source="price_volatility", value=0.02),
+        }
+    )
+    orchestrator._run_event_cycle({"news_feed": Signal(source="news_feed", value=0.7)})
+
+    state = main.system_state
+    assert state.cycle_count == 2
+    assert set(state.latest_signals) == {"twitter_sentiment", "price_volatility", "news_feed"}
+    assert set(state.latest_decision.weights) == set(state.latest_signals)
+
+    await orchestrator.perception_hub.close()
+
+
+@pytest.mark.asyncio
+async def test_event_mode_reacts_without_cycle_interval(monkeypatch):
+    """Test that event mode decides well before a polling interval would elapse."""
+    monkeypatch.setattr(main, "system_state", SystemState())
+    orchestrator = AgentOrchestrator(
+        Settings(DECISION_MODE="event", CYCLE_INTERVAL=60.0, SENSOR_POLL_INTERVAL=0.05)
+    )
+
+    task = asyncio.create_task(orchestrator.start())
+    try:
+        for _ in range(100):
+            if main.system_state.cycle_count > 0:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        orchestrator.running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert main.system_state.cycle_count > 0
+
+
+@pytest.mark.asyncio
+async def test_records_become_models_only_in_shared_state(orchestrator):
+    """Test that hot-path records are converted once, for changed sources only."""
+    orchestrator._run_event_cycle({"news_feed": SignalRecord(source="news_feed", value=0.7)})
+    news_model = main.system_state.latest_signals["news_feed"]
+    assert isinstance(news_model, Signal)
+
+    record = SignalRecord(source="twitter_sentiment", value=0.2)
+    orchestrator._run_event_cycle({"twitter_sentiment": record})
+
+    latest = main.system_state.latest_signals
+    assert latest["news_feed"] is news_model  # Unchanged source not reconverted
+    assert latest["twitter_sentiment"] == record.to_model()
+    assert orchestrator.signals["twitter_sentiment"] is record
+
+    await orchestrator.perception_hub.close()
@@ -0,0 +1,79 @@
+"""
+Tests for the sampling profiler (profiler.py)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import main
+from src.profiler import SamplingProfiler, profile_loop
+
+
+def busy_wait(seconds):
+    """Hold the thread (and the GIL, mostly) in a recognizable frame."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_samples_other_thread_into_collapsed_stacks():
+    """Test that a busy thread's frames show up root-to-leaf in the output."""
+    worker = threading.Thread(target=busy_wait, args=(0.3,))
+    worker.start()
+    profiler = SamplingProfiler(interval=0.002, thread_id=worker.ident)
+
+    profiler.start()
+    time.sleep(0.15)
+    profiler.stop()
+    worker.join()
+
+    assert profiler.samples > 0 and not profiler.running
+    top_stack, count = profiler.collapsed().splitlines()[0].rsplit(" ", 1)
+    frames = top_stack.split(";")
+    assert frames[0] == "thread"
+    assert frames[-1].startswith("busy_wait (test_profiler.py:")
+    assert int(count) == profiler.stacks[top_stack]
+    assert profiler.summary()["duration_s"] >= 0.15
+
+    with pytest.raises(RuntimeError):
+        profiler.start()
+        profiler.start()
+    profiler.stop()
+
+
+async def test_profile_loop_labels_tasks():
+    """Test event-loop profiling with task-name roots and the one-at-a-time guard."""
+
+    async def spin():
+        while True:
+            busy_wait(0.005)
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(spin(), name="sensor:news_feed")
+    profiling = asyncio.create_task(profile_loop(0.2, interval=0.002))
+    await asyncio.sleep(0.01)
+    with pytest.raises(RuntimeError):
+        await profile_loop(0.1)
+    profiler = await profiling
+    task.cancel()
+
+    roots = {stack.split(";", 1)[0] for stack in profiler.stacks}
+    assert "task:sensor:news_feed" in roots
+    assert any("busy_wait" in stack for stack in profiler.stacks)
+
+
+async def test_profile_endpoint(monkeypatch):
+    """Test the admin endpoint: disabled by default, collapsed stacks when enabled."""
+    response = await main.profile_event_loop(seconds=0.05, interval_ms=5.0)
+    assert response.status_code == 404
+
+    monkeypatch.setattr(main.settings, "profiler_enabled", True)
+    monkeypatch.setattr(main.settings, "profiler_max_seconds", 0.05)
+    response = await main.profile_event_loop(seconds=30.0, interval_ms=1.0)
+
+    assert response.status_code == 200
+    assert float(response.headers["X-Profile-Duration"]) < 1.0  # Clamped
+    assert int(response.headers["X-Profile-Samples"]) >= 0
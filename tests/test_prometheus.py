@@ -0,0 +1,83 @@
+"""
+Tests for the Prometheus text exposition (prometheus.py)
+"""
+
+import re
+
+from main import get_prometheus_metrics
+from src.metrics import MetricsCollector
+from src.prometheus import CONTENT_TYPE, OTHER_LABEL, render_prometheus
+
+SAMPLE = re.compile(r'^[a-z_]+(\{[a-z_]+="(?:[^"\\]|\\.)*"(,[a-z_]+="(?:[^"\\]|\\.)*")*\})? \S+$')
+
+
+def sample_lines(text):
+    return [line for line in text.splitlines() if not line.startswith("#")]
+
+
+def test_counters_gauges_and_histograms():
+    """Test values, types and cumulative histogram buckets in seconds."""
+    collector = MetricsCollector()
+    for latency in (0.5, 3.0, 3.0, 40.0, 9000.0):
+        collector.record_decision_latency(latency)
+    collector.record_safety_pass()
+    collector.record_stream_clients(4)
+
+    text = render_prometheus(collector)
+
+    assert "# TYPE decisify_decision_latency_seconds histogram" in text
+    assert "decisify_decisions_total 5\n" in text
+    assert "decisify_safety_passes_total 1\n" in text
+    assert "decisify_stream_clients 4\n" in text
+    assert 'decisify_decision_latency_seconds_bucket{le="0.001"} 1\n' in text
+    assert 'decisify_decision_latency_seconds_bucket{le="0.005"} 3\n' in text
+    assert 'decisify_decision_latency_seconds_bucket{le="5.0"} 4\n' in text
+    assert 'decisify_decision_latency_seconds_bucket{le="+Inf"} 5\n' in text
+    assert "decisify_decision_latency_seconds_sum 9.0465\n" in text
+    assert all(SAMPLE.match(line) for line in sample_lines(text))
+
+
+def test_sensor_label_cardinality_is_bounded():
+    """Test that sources beyond the limit fold into one label value."""
+    collector = MetricsCollector()
+    for i in range(10):
+        collector.record_sensor_success(f"sensor_{i}", latency_ms=10.0)
+        collector.record_sensor_failure(f"sensor_{i}")
+    collector.record_breaker_state("sensor_9", "open")
+
+    text = render_prometheus(collector, max_label_values=3)
+
+    success = [line for line in sample_lines(text) if line.startswith("decisify_sensor_success")]
+    assert success == [
+        'decisify_sensor_success_total{source="sensor_0"} 1',
+        'decisify_sensor_success_total{source="sensor_1"} 1',
+        'decisify_sensor_success_total{source="sensor_2"} 1',
+        f'decisify_sensor_success_total{{source="{OTHER_LABEL}"}} 7',
+    ]
+    assert f'decisify_breaker_open{{source="{OTHER_LABEL}"}} 1' in text
+    assert (
+        f'decisify_sensor_latency_seconds_bucket{{source="{OTHER_LABEL}",le="0.01"}} 7' in text
+    )
+    assert f'decisify_sensor_latency_seconds_count{{source="{OTHER_LABEL}"}} 7' in text
+
+
+def test_label_values_are_escaped():
+    """Test escaping of quotes, backslashes and newlines in label values."""
+    collector = MetricsCollector()
+    collector.record_sensor_failure('odd "name"\\\n')
+
+    text = render_prometheus(collector)
+
+    assert 'decisify_sensor_failures_total{source="odd \\"name\\"\\\\\\n"} 1' in text
+    assert all(SAMPLE.match(line) for line in sample_lines(text))
+
+
+async def test_prometheus_endpoint():
+    """Test the endpoint's content type and body."""
+    collector = MetricsCollector()
+    collector.record_api_request(2.0)
+
+    response = await get_prometheus_metrics(collector)
+
+    assert response.media_type == CONTENT_TYPE
+    assert b"decisify_api_requests_total 1\n" in response.body
@@ -0,0 +1,85 @@
+"""
+Tests for the per-cycle API response cache (response_cache.py and main endpoints)
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import AgentOrchestrator
+from src.config import Settings
+from src.response_cache import ResponseCache
+from src.schemas import Signal, SystemState
+
+
+def test_cache_encodes_once_and_tags_versions():
+    """Test that payloads are stored as bytes with a per-cycle ETag."""
+    cache = ResponseCache()
+    cache.publish(1, {"signals": {"news_feed": {"value": 0.5}}})
+    first = cache.get("signals")
+
+    assert first.body == b'{"news_feed":{"value":0.5}}'
+    assert first.version == 1
+    assert cache.get("signals") is first  # Served as-is, not re-rendered
+
+    cache.publish(2, {"signals": {}})
+    assert cache.get("signals").etag != first.etag
+    assert cache.get("status") is None
+
+
+def test_if_none_match_handling():
+    """Test 304 on a matching (or wildcard / weak) validator and 200 otherwise."""
+    cache = ResponseCache()
+    cache.publish(7, {"decision": {"action": "HOLD"}})
+    rendered = cache.get("decision")
+
+    assert rendered.respond(rendered.etag).status_code == 304
+    assert rendered.respond(f'"other", W/{rendered.etag}').status_code == 304
+    assert rendered.respond("*").status_code == 304
+    assert rendered.respond('"stale"').status_code == 200
+    assert rendered.respond(None).body == b'{"action":"HOLD"}'
+
+
+def test_etags_differ_across_restarts():
+    """Test that a restarted process can't validate an old cycle's ETag."""
+    before, after = ResponseCache(), ResponseCache()
+    before.publish(1, {"status": {}})
+    after.publish(1, {"status": {}})
+
+    assert before.get("status").etag != after.get("status").etag
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """API client over fresh shared state and response cache."""
+    monkeypatch.setattr(main, "system_state", SystemState())
+    monkeypatch.setattr(main, "api_cache", ResponseCache())
+    return TestClient(main.app)
+
+
+def test_endpoints_serve_cycle_snapshot_with_304s(client):
+    """Test that endpoints return the rendered cycle and honour If-None-Match."""
+    assert client.get("/status").status_code == 503
+
+    orchestrator = AgentOrchestrator(Settings())
+    orchestrator._run_event_cycle({"news_feed": Signal(source="news_feed", value=0.7)})
+
+    for path in ("/status", "/decision", "/signals"):
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    assert client.get("/signals").json()["news_feed"]["value"] == 0.7
+    assert client.get("/decision").json()["weights"] == {"news_feed": 1.0}
+    status = json.loads(client.get("/status").content)
+    assert status["agent_thoughts"][0]["inputs"] == {"news_feed": 0.7}
+
+    # The next cycle invalidates the validator
+    orchestrator._run_event_cycle({"news_feed": Signal(source="news_feed", value=-0.7)})
+    assert client.get("/signals", headers={"If-None-Match": etag}).status_code == 200
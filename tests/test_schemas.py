@@ -6,7 +6,7 @@ from datetime import datetime
 
 import pytest
 
-from src.schemas import DecisionChain, Signal, SystemState
+from src.schemas import DecisionChain, Signal, SignalRecord, SystemState, as_signal
 
 
 def test_signal_creation_with_defaults():
@@ -279,3 +279,26 @@ def test_system_state_last_update_auto_generation():
     after = datetime.now()
 
     assert before <= state.last_update <= after
+
+
+def test_signal_record_round_trip():
+    """Test conversion between SignalRecord and the Signal model."""
+    timestamp = datetime(2026, 3, 1, 12, 0)
+    record = SignalRecord("news_feed", -0.3, timestamp, "Headline", stale=True)
+    model = record.to_model()
+
+    assert model == Signal(
+        source="news_feed", value=-0.3, timestamp=timestamp, raw_content="Headline", stale=True
+    )
+    assert SignalRecord.from_model(model) == record
+    assert as_signal(record) == model
+    assert as_signal(model) is model
+
+
+def test_signal_record_is_slotted():
+    """Test that SignalRecord carries no per-instance dict."""
+    record = SignalRecord(source="test", value=0.5)
+
+    assert not hasattr(record, "__dict__")
+    assert isinstance(record.timestamp, datetime)
+    assert record.raw_content is None and record.stale is False
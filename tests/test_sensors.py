@@ -7,8 +7,16 @@ from datetime import datetime
 
 import pytest
 
-from src.schemas import Signal
-from src.sensors import AsyncPerceptionHub, MockStreamSimulator
+from src.schemas import Signal, SignalRecord
+from src.sensor_registry import RateBudget, Sensor, SensorRegistry
+from src.sensors import (
+    AsyncPerceptionHub,
+    MockStreamSimulator,
+    NewsSentimentSensor,
+    PriceVolatilitySensor,
+    SignalCache,
+    TwitterSentimentSensor,
+)
 
 
 @pytest.fixture
@@ -55,7 +63,7 @@ async def test_fetch_all_returns_signals(perception_hub):
     expected_sources = ["twitter_sentiment", "price_volatility", "news_feed"]
     for source in expected_sources:
         if source in signals:
-            assert isinstance(signals[source], Signal)
+            assert isinstance(signals[source], SignalRecord)
             assert signals[source].source == source
 
     await perception_hub.close()
@@ -81,7 +89,7 @@ async def test_fetch_all_concurrent_execution(perception_hub):
 @pytest.mark.asyncio
 async def test_fetch_twitter_sentiment(perception_hub):
     """Test fetching Twitter sentiment signal."""
-    signal = await perception_hub._fetch_twitter_sentiment()
+    signal = await TwitterSentimentSensor().fetch(perception_hub.client)
 
     assert signal.source == "twitter_sentiment"
     assert -1.0 <= signal.value <= 1.0
@@ -94,7 +102,7 @@ async def test_fetch_twitter_sentiment(perception_hub):
 @pytest.mark.asyncio
 async def test_fetch_price_volatility(perception_hub):
     """Test fetching price volatility signal."""
-    signal = await perception_hub._fetch_price_volatility()
+    signal = await PriceVolatilitySensor().fetch(perception_hub.client)
 
     assert signal.source == "price_volatility"
     assert 0.0 <= signal.value <= 1.0
@@ -107,7 +115,7 @@ async def test_fetch_price_volatility(perception_hub):
 @pytest.mark.asyncio
 async def test_fetch_news_sentiment(perception_hub):
     """Test fetching news sentiment signal."""
-    signal = await perception_hub._fetch_news_sentiment()
+    signal = await NewsSentimentSensor().fetch(perception_hub.client)
 
     assert signal.source == "news_feed"
     assert -1.0 <= signal.value <= 1.0
@@ -235,21 +243,20 @@ async def test_safe_fetch_stops_on_unexpected_error(perception_hub):
 async def test_fetch_all_handles_partial_failures(perception_hub):
     """Test that fetch_all continues even if some sensors fail."""
     # Mock one sensor to fail
-    async def failing_sensor():
+    async def failing_sensor(client):
         raise asyncio.TimeoutError("Simulated failure")
 
     # Replace one sensor with failing version
-    original_fetch = perception_hub._fetch_twitter_sentiment
-    perception_hub._fetch_twitter_sentiment = failing_sensor
+    perception_hub.sensors["twitter_sentiment"].fetch = failing_sensor
 
     signals = await perception_hub.fetch_all()
 
     # Should still get signals from other sensors
     # The failed sensor returns an error signal with value 0.0
     assert isinstance(signals, dict)
-
-    # Restore original
-    perception_hub._fetch_twitter_sentiment = original_fetch
+    assert signals["twitter_sentiment"].value == 0.0
+    assert "ERROR" in signals["twitter_sentiment"].raw_content
+    assert len(signals) == 3
 
     await perception_hub.close()
 
@@ -338,3 +345,289 @@ async def test_multiple_fetch_all_calls(perception_hub):
     assert set(signals1.keys()) == set(signals2.keys())
 
     await perception_hub.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_pushes_each_sensor_independently(perception_hub):
+    """Test that event-driven streaming delivers signals per sensor."""
+    queue = asyncio.Queue()
+    tasks = perception_hub.stream(queue, interval=0.05)
+
+    received = set()
+    try:
+        while len(received) < len(perception_hub.sensors):
+            signal = await asyncio.wait_for(queue.get(), timeout=2.0)
+            received.add(signal.source)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert received == set(perception_hub.sensors)
+
+    await perception_hub.close()
+
+
+class CountingSensor(Sensor):
+    """Test sensor that records its peak concurrency."""
+
+    name = "counting"
+    active = 0
+    peak = 0
+
+    async def fetch(self, client):
+        type(self).active += 1
+        type(self).peak = max(type(self).peak, type(self).active)
+        await asyncio.sleep(0.01)
+        type(self).active -= 1
+        return Signal(source=self.name, value=0.1)
+
+
+def test_registry_builds_from_specs():
+    """Test building sensors from names, dict specs and import paths."""
+    registry = SensorRegistry()
+    registry.register()(CountingSensor)
+
+    sensors = registry.build_all(
+        [
+            "counting",
+            {"type": "counting", "name": "counting_eu", "rate_limit": 5, "timeout": 0.5},
+            {"type": "src.sensors:NewsSentimentSensor", "name": "news_us"},
+        ]
+    )
+
+    assert [s.name for s in sensors] == ["counting", "counting_eu", "news_us"]
+    assert sensors[1].rate_limit == 5
+    assert sensors[1].timeout == 0.5
+    assert isinstance(sensors[2], NewsSentimentSensor)
+
+
+def test_registry_rejects_unknown_and_duplicate_sensors():
+    """Test registry error handling."""
+    registry = SensorRegistry()
+    registry.register()(CountingSensor)
+
+    with pytest.raises(KeyError):
+        registry.build("does_not_exist")
+    with pytest.raises(ValueError):
+        registry.build_all(["counting", "counting"])
+
+
+def test_sensor_without_fetch_fails_at_instantiation():
+    """Test that an incomplete plugin is rejected when built, not when polled."""
+
+    class Incomplete(Sensor):
+        name = "incomplete"
+
+    registry = SensorRegistry()
+    registry.register()(Incomplete)
+
+    with pytest.raises(TypeError):
+        registry.build("incomplete")
+
+
+@pytest.mark.asyncio
+async def test_hub_caps_in_flight_fetches():
+    """Test that the hub-wide semaphore bounds concurrent fetches."""
+    CountingSensor.active = CountingSensor.peak = 0
+    sensors = [CountingSensor(name=f"feed_{i}", max_concurrency=4) for i in range(50)]
+    hub = AsyncPerceptionHub(timeout=1.0, max_retries=1, sensors=sensors, max_concurrency=8)
+
+    signals = await hub.fetch_all()
+
+    assert len(signals) == 50
+    assert CountingSensor.peak <= 8
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_sensor_timeout_is_per_sensor():
+    """Test that a slow sensor is cut off by its own timeout."""
+
+    class SlowSensor(Sensor):
+        name = "slow"
+        timeout = 0.05
+
+        async def fetch(self, client):
+            await asyncio.sleep(1.0)
+
+    hub = AsyncPerceptionHub(timeout=5.0, max_retries=1, sensors=[SlowSensor()])
+
+    signals = await hub.fetch_all()
+
+    assert signals["slow"].value == 0.0
+    assert "ERROR" in signals["slow"].raw_content
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_spaces_requests():
+    """Test that the token bucket throttles beyond the burst."""
+    budget = RateBudget(rate=50.0, burst=2)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(4):
+        await budget.acquire()
+    elapsed = loop.time() - start
+
+    # Two tokens are available immediately, the next two take ~20ms each
+    assert elapsed >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_beats_slow_primary():
+    """Test that a hedge is sent after the p95 delay and the fast answer wins."""
+    from src.metrics import MetricsCollector
+
+    calls = 0
+
+    async def sometimes_slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1.0 if calls == 1 else 0.01)
+        return Signal(source="flaky", value=0.5)
+
+    hub = AsyncPerceptionHub(timeout=2.0, max_retries=1, sensors=[])
+    hub.metrics = MetricsCollector()
+    for _ in range(hub.hedge_min_samples):
+        hub.metrics.record_sensor_primary_latency("flaky", latency_ms=10.0)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    signal = await hub._safe_fetch("flaky", sometimes_slow)
+    elapsed = loop.time() - start
+
+    assert signal.value == 0.5
+    assert calls == 2
+    assert elapsed < 0.5
+    assert hub.metrics.get_sensor_stats()["flaky"]["hedged_count"] == 1
+    # The hedge input keeps how long the primary had run, not the hedged latency
+    assert hub.metrics.sensor_primary_latencies["flaky"][-1] >= hub._hedge_delay("flaky") * 1000
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_latency_history():
+    """Test that hedging waits for enough latency samples."""
+    from src.metrics import MetricsCollector
+
+    hub = AsyncPerceptionHub(timeout=2.0, max_retries=1, sensors=[])
+    hub.metrics = MetricsCollector()
+
+    assert hub._hedge_delay("unknown") is None
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_cycle_deadline_serves_stale_signals():
+    """Test that late sensors are returned stale while fast ones are fresh."""
+
+    class SlowSensor(Sensor):
+        name = "slow"
+        delay = 0.0
+
+        async def fetch(self, client):
+            await asyncio.sleep(self.delay)
+            return Signal(source=self.name, value=0.7, raw_content="slow but real")
+
+    slow = SlowSensor()
+    fast = CountingSensor(name="fast")
+    hub = AsyncPerceptionHub(timeout=5.0, max_retries=1, sensors=[slow, fast])
+
+    # First cycle: everything on time
+    signals = await hub.fetch_all(deadline=0.5)
+    assert not signals["slow"].stale
+
+    # Second cycle: slow sensor misses the deadline and is served from cache
+    slow.delay = 0.3
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    signals = await hub.fetch_all(deadline=0.05)
+    assert loop.time() - start < 0.2
+
+    assert signals["fast"].stale is False
+    assert signals["slow"].stale is True
+    assert signals["slow"].value == 0.7
+
+    # The late fetch keeps running and is reused rather than duplicated
+    in_flight = hub._inflight["slow"]
+    await hub.fetch_all(deadline=0.01)
+    assert hub._inflight["slow"] is in_flight
+
+    await hub.close()
+
+
+def test_signal_cache_freshness_windows():
+    """Test fresh, stale-while-revalidate and expired cache lookups."""
+    now = [0.0]
+    cache = SignalCache(clock=lambda: now[0])
+    signal = Signal(source="feed", value=0.2)
+    cache.put("feed", signal)
+
+    assert cache.lookup("feed", ttl=10.0, max_stale=5.0) == (signal, True)
+    now[0] = 12.0
+    assert cache.lookup("feed", ttl=10.0, max_stale=5.0) == (signal, False)
+    now[0] = 20.0
+    assert cache.lookup("feed", ttl=10.0, max_stale=5.0) == (None, False)
+    assert cache.lookup("feed", ttl=0.0, max_stale=5.0) == (None, False)
+    assert cache.latest("feed") is signal
+
+
+@pytest.mark.asyncio
+async def test_cached_sensor_skips_upstream_while_fresh():
+    """Test that a fresh cached signal is served without refetching."""
+    sensor = CountingSensor(name="cached", cache_ttl=60.0)
+    calls = []
+    original = sensor.fetch
+
+    async def fetch(client):
+        calls.append(1)
+        return await original(client)
+
+    sensor.fetch = fetch
+    hub = AsyncPerceptionHub(timeout=1.0, max_retries=1, sensors=[sensor])
+
+    first = await hub.fetch_all()
+    second = await hub.fetch_all()
+
+    assert len(calls) == 1
+    assert second["cached"] is first["cached"]  # Original timestamp kept for decay
+    assert hub.metrics.get_sensor_stats()["cached"]["cache_hits"] >= 1
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_cached_signal_is_revalidated_in_background():
+    """Test that a stale entry is served at once while a refresh runs."""
+
+    class SlowFeed(Sensor):
+        name = "slow_feed"
+        value = 0.1
+
+        async def fetch(self, client):
+            await asyncio.sleep(0.1)
+            return Signal(source=self.name, value=self.value)
+
+    sensor = SlowFeed(cache_ttl=0.01, cache_max_stale=60.0)
+    hub = AsyncPerceptionHub(timeout=1.0, max_retries=1, sensors=[sensor])
+    await hub.fetch_all()
+
+    await asyncio.sleep(0.02)  # Past the TTL, within max_stale
+    sensor.value = 0.5
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    signals = await hub.fetch_all()
+
+    assert loop.time() - start < 0.05  # Didn't wait for the upstream
+    assert signals["slow_feed"].value == 0.1
+
+    await hub._inflight["slow_feed"]
+    assert hub.cache.latest("slow_feed").value == 0.5
+
+    await hub.close()
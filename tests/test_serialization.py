@@ -0,0 +1,93 @@
+"""
+Tests for the fast JSON serialization path (serialization.py)
+"""
+
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src import serialization
+from src.schemas import DecisionChain, Signal
+from src.serialization import FastJSONResponse, dumps
+
+
+def make_decision():
+    return DecisionChain(
+        timestamp=datetime(2026, 2, 18, 10, 30, 5, 123456),
+        weights={"news_feed": 0.6, "price_volatility": 0.4},
+        action="HOLD",
+        reasoning="Volatility high — holding",
+        is_safe=False,
+        override_reason="Volatility > 5%",
+    )
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both encoders."""
+    if request.param == "orjson":
+        if not serialization.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+    return request.param
+
+
+def test_models_match_pydantic_json(backend):
+    """Test that models encode to the same document as model_dump_json."""
+    decision = make_decision()
+    signal = Signal(source="news_feed", value=-0.25, timestamp=datetime(2026, 2, 18, 9, 0))
+
+    assert json.loads(dumps(decision)) == json.loads(decision.model_dump_json())
+    assert json.loads(dumps(signal)) == json.loads(signal.model_dump_json())
+
+
+def test_non_finite_floats_encode_as_null(backend):
+    """Test that a NaN weight or Infinity value becomes null rather than an error."""
+    decision = make_decision().model_copy(
+        update={"weights": {"news_feed": float("nan"), "price_volatility": 1.0}}
+    )
+    body = dumps({"decision": decision, "values": [float("inf"), np.float64("-inf"), 0.5]})
+
+    document = json.loads(body)
+    assert document["decision"]["weights"] == {"news_feed": None, "price_volatility": 1.0}
+    assert document["decision"]["timestamp"] == "2026-02-18T10:30:05.123456"
+    assert document["values"] == [None, None, 0.5]
+
+
+def test_nested_payload_encodes_natively(backend):
+    """Test datetimes, models and NumPy values inside ordinary containers."""
+    timestamp = datetime(2026, 2, 18, 10, 30)
+    body = dumps(
+        {
+            "at": timestamp,
+            "decisions": [make_decision()],
+            "score": np.float64(0.5),
+            "text": "🚀",
+        }
+    )
+
+    document = json.loads(body)
+    assert document["at"] == "2026-02-18T10:30:00"
+    assert document["decisions"][0]["action"] == "HOLD"
+    assert document["score"] == 0.5
+    assert "🚀".encode() in body  # UTF-8, not \u escapes
+    assert b", " not in body and b": " not in body  # Compact
+
+
+def test_unknown_types_raise(backend):
+    """Test that unsupported objects fail loudly instead of encoding garbage."""
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_fast_response_class():
+    """Test that FastJSONResponse renders through dumps."""
+    decision = make_decision()
+    response = FastJSONResponse({"decision": decision}, status_code=201)
+
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert response.body == dumps({"decision": decision})
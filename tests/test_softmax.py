@@ -0,0 +1,332 @@
+"""
+Tests for the shared softmax kernels (softmax.py) and Python/Rust parity.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.brain import AttentionFusionEngine
+from src.brain_hybrid import CompactDecision, HybridAttentionEngine, decide_columns
+from src.safety import SafetyGate
+from src.schemas import Signal
+from src.softmax import DictSoftmax, SoftmaxBuffers, log_sum_exp, softmax_dict, softmax_into
+
+
+def reference_softmax(scores, temperature):
+    """Textbook softmax, fine for small scores."""
+    exp_scores = {k: math.exp(v / temperature) for k, v in scores.items()}
+    total = sum(exp_scores.values())
+    return {k: v / total for k, v in exp_scores.items()}
+
+
+@pytest.fixture
+def mixed_signals():
+    """Signals with a volatility source and varied ages."""
+    now = datetime.now()
+    return {
+        "twitter_sentiment": Signal(source="twitter_sentiment", value=0.75, timestamp=now),
+        "price_volatility": Signal(
+            source="price_volatility", value=0.04, timestamp=now - timedelta(seconds=20)
+        ),
+        "news_feed": Signal(
+            source="news_feed", value=-0.45, timestamp=now - timedelta(seconds=90)
+        ),
+    }
+
+
+def test_softmax_dict_matches_reference():
+    """Test that the stable kernel matches the naive formula on small scores."""
+    scores = {"a": 0.1, "b": 0.7, "c": 1.4}
+
+    for temperature in (0.5, 1.0, 2.0):
+        expected = reference_softmax(scores, temperature)
+        weights = softmax_dict(scores, temperature)
+        for k in scores:
+            assert weights[k] == pytest.approx(expected[k], rel=1e-12)
+
+
+def test_softmax_dict_large_scores_stay_finite():
+    """Test that large scores no longer overflow exp()."""
+    weights = softmax_dict({"a": 1000.0, "b": 999.0}, temperature=0.1)
+
+    assert all(math.isfinite(w) for w in weights.values())
+    assert sum(weights.values()) == pytest.approx(1.0)
+    assert weights["a"] > weights["b"]
+
+
+def test_softmax_dict_empty():
+    """Test empty input."""
+    assert softmax_dict({}, temperature=1.0) == {}
+
+
+def test_dict_softmax_reuses_buffers():
+    """Test that DictSoftmax matches softmax_dict and reuses its dict per source set."""
+    softmax = DictSoftmax()
+    first = softmax({"a": 0.1, "b": 0.7, "c": 1.4}, 0.8)
+    assert first == pytest.approx(softmax_dict({"a": 0.1, "b": 0.7, "c": 1.4}, 0.8), rel=1e-12)
+
+    second = softmax({"a": 2.0, "b": -1.0, "c": 0.0}, 0.8)
+    assert second is first
+    assert second == pytest.approx(softmax_dict({"a": 2.0, "b": -1.0, "c": 0.0}, 0.8), rel=1e-12)
+
+    # A new source set gets fresh buffers
+    third = softmax({"a": 1.0, "d": 1.0}, 0.8)
+    assert third is not first
+    assert third == pytest.approx({"a": 0.5, "d": 0.5})
+    assert softmax({}, 1.0) == {}
+
+
+def test_softmax_into_matches_dict_kernel():
+    """Test that the array kernel and the dict kernel agree."""
+    scores = {"a": 0.3, "b": 2.5, "c": -1.0, "d": 0.0}
+    arr = np.array(list(scores.values()))
+    out = np.empty_like(arr)
+
+    softmax_into(arr, 0.7, out=out)
+    expected = softmax_dict(scores, 0.7)
+
+    np.testing.assert_allclose(out, list(expected.values()), rtol=1e-12)
+
+
+def test_softmax_into_rows_and_masked_entries():
+    """Test row-wise softmax where -inf entries receive zero weight."""
+    scores = np.array([[1.0, 2.0, -np.inf], [50.0, 50.0, 50.0]])
+    work = np.empty((2, 1))
+
+    softmax_into(scores, 1.0, out=scores, work=work)
+
+    np.testing.assert_allclose(scores.sum(axis=1), [1.0, 1.0])
+    assert scores[0, 2] == 0.0
+    np.testing.assert_allclose(scores[1], [1 / 3] * 3)
+
+
+def test_softmax_buffers_reuse_memory():
+    """Test that repeated calls write into the same preallocated buffer."""
+    buffers = SoftmaxBuffers(max_rows=4, max_cols=8)
+
+    first = buffers.softmax(np.array([[0.1, 0.2, 0.3]]), temperature=1.0)
+    second = buffers.softmax(np.array([[0.3, 0.2, 0.1]]), temperature=1.0)
+
+    assert np.shares_memory(first, buffers.out)
+    assert np.shares_memory(second, buffers.out)
+    with pytest.raises(ValueError):
+        buffers.softmax(np.zeros((5, 2)), temperature=1.0)
+
+
+def test_log_sum_exp_is_stable():
+    """Test log-sum-exp against the direct formula and for huge inputs."""
+    scores = np.array([0.5, 1.5, 2.5])
+    assert log_sum_exp(scores, 1.0) == pytest.approx(math.log(np.exp(scores).sum()))
+    assert log_sum_exp(np.array([1000.0, 1000.0]), 1.0) == pytest.approx(1000.0 + math.log(2))
+
+
+def test_python_engines_agree(mixed_signals):
+    """Test that the brain and the hybrid Python fallback share one kernel."""
+    brain = AttentionFusionEngine(temperature=0.8)
+    hybrid = HybridAttentionEngine(temperature=0.8, use_rust=False)
+
+    scores = brain._calculate_scores(mixed_signals)
+
+    assert brain._softmax(scores) == hybrid._softmax_python(scores)
+
+
+def test_batch_path_agrees_with_dict_path(mixed_signals):
+    """Test that decide_batch weights match the per-cycle softmax."""
+    brain = AttentionFusionEngine(temperature=0.8)
+    now = datetime.now()
+
+    result = brain.decide_batch([mixed_signals], now=now)
+    ages = {k: (now - s.timestamp).total_seconds() for k, s in mixed_signals.items()}
+    scores = {
+        k: abs(s.value) * (1.5 if "volatility" in k else 1.0) * math.exp(-ages[k] / 60.0)
+        for k, s in mixed_signals.items()
+    }
+    expected = softmax_dict(scores, 0.8)
+
+    for col, source in enumerate(result.sources):
+        assert result.weights[0, col] == pytest.approx(expected[source], rel=1e-12)
+
+
+def column_inputs(signals, engine, now):
+    """The buffers HybridAttentionEngine hands to decide_into."""
+    values = np.array([s.value for s in signals.values()])
+    ages = np.array([(now - s.timestamp).total_seconds() for s in signals.values()])
+    source_ids = np.array([engine._source_id(src) for src in signals], dtype=np.int32)
+    return values, ages, source_ids, engine._boosts
+
+
+def test_column_kernel_matches_dict_path(mixed_signals):
+    """Test the NumPy reference for the buffer interface against the dict path."""
+    engine = HybridAttentionEngine(temperature=0.8, use_rust=False)
+    now = datetime.now()
+    values, ages, source_ids, boosts = column_inputs(mixed_signals, engine, now)
+    out = np.empty(len(values))
+
+    weighted = decide_columns(0.8, values, ages, source_ids, boosts, out)
+
+    scores = {
+        k: abs(s.value) * (1.5 if "volatility" in k else 1.0)
+        * math.exp(-(now - s.timestamp).total_seconds() / 60.0)
+        for k, s in mixed_signals.items()
+    }
+    expected = softmax_dict(scores, 0.8)
+    assert out.tolist() == pytest.approx([expected[k] for k in mixed_signals], rel=1e-12)
+    assert weighted == pytest.approx(sum(expected[k] * s.value for k, s in mixed_signals.items()))
+    assert engine._source_id("price_volatility") == 1  # Ids are stable per engine
+
+
+def compact_scenarios():
+    """Signal sets covering a pass, each override rule and the neutral case."""
+    now = datetime.now()
+
+    def signals(**values):
+        return {k: Signal(source=k, value=v, timestamp=now) for k, v in values.items()}
+
+    return {
+        "buy_passes": signals(twitter_sentiment=0.9, price_volatility=0.02),
+        "buy_volatile": signals(twitter_sentiment=0.9, news_feed=0.8, price_volatility=0.2),
+        "sell_volatile": signals(twitter_sentiment=-0.9, news_feed=-0.8, price_volatility=0.09),
+        "low_confidence": signals(**{f"sensor_{i}": 0.9 for i in range(8)}),
+        "neutral": signals(twitter_sentiment=0.0, news_feed=0.0),
+        "empty": {},
+    }
+
+
+@pytest.mark.parametrize("scenario", list(compact_scenarios()))
+def test_decide_compact_matches_decide_and_validate(scenario):
+    """Test the compact path against decide() followed by SafetyGate.validate()."""
+    signals = compact_scenarios()[scenario]
+    gate = SafetyGate()
+    engine = HybridAttentionEngine(temperature=1.0, use_rust=False)
+
+    expected = gate.validate(engine.decide(signals), signals)
+    compact = engine.decide_compact(signals, gate)
+    chain = compact.to_chain()
+
+    assert compact.action == expected.action
+    assert compact.is_safe == expected.is_safe
+    assert compact.override_reason == expected.override_reason
+    assert chain.reasoning == expected.reasoning
+    assert chain.weights.keys() == expected.weights.keys()
+    for source, weight in expected.weights.items():
+        assert chain.weights[source] == pytest.approx(weight, abs=1e-6)  # Ages drift by µs
+
+
+def test_compact_decision_builds_strings_lazily():
+    """Test that reasoning is only formatted on first read, then cached."""
+    signals = compact_scenarios()["buy_volatile"]
+    decision = HybridAttentionEngine(use_rust=False).decide_compact(signals, SafetyGate())
+
+    assert isinstance(decision, CompactDecision)
+    assert decision._reasoning is None
+    assert decision.action == "HOLD" and decision.proposed_action == 1
+    assert decision.volatility == 0.2
+
+    reasoning = decision.reasoning
+    assert reasoning.startswith("Weighted signal:")
+    assert decision.reasoning is reasoning
+
+
+def test_compact_decision_snapshots_sources():
+    """Test that mutating the caller's signals after decide_compact() changes nothing."""
+    signals = dict(compact_scenarios()["buy_volatile"])
+    gate = SafetyGate()
+    decision = HybridAttentionEngine(use_rust=False).decide_compact(signals, gate)
+    expected = decision.to_chain()
+    decision._reasoning = None
+
+    dominant = decision.sources[decision.dominant_row]
+    signals.pop(dominant)
+    signals["late_arrival"] = signals.pop(next(iter(signals)))
+
+    assert decision.dominant_signal is not None
+    assert decision.reasoning == expected.reasoning
+    assert decision.weights == expected.weights
+
+
+class TestRustParity:
+    """Parity between the Python kernels and decisify_core (skipped without it)."""
+
+    @pytest.fixture(autouse=True)
+    def core(self):
+        return pytest.importorskip("decisify_core")
+
+    @pytest.mark.parametrize("temperature", [0.1, 0.5, 1.0, 3.0])
+    @pytest.mark.parametrize("scale", [1.0, 100.0, 1000.0])
+    def test_softmax_parity(self, core, temperature, scale):
+        rng = np.random.default_rng(7)
+        scores = {f"sensor_{i}": float(v) * scale for i, v in enumerate(rng.random(50))}
+
+        rust_weights = core.RustAttentionEngine(temperature).softmax(scores)
+        py_weights = softmax_dict(scores, temperature)
+
+        for k in scores:
+            assert rust_weights[k] == pytest.approx(py_weights[k], rel=1e-12, abs=1e-300)
+
+    def test_decide_parity(self, core, mixed_signals):
+        python_engine = HybridAttentionEngine(temperature=1.0, use_rust=False)
+        rust_engine = HybridAttentionEngine(temperature=1.0, use_rust=True)
+
+        py_decision = python_engine.decide(mixed_signals)
+        rust_decision = rust_engine.decide(mixed_signals)
+
+        assert rust_decision.action == py_decision.action
+        for k, w in py_decision.weights.items():
+            assert rust_decision.weights[k] == pytest.approx(w, abs=1e-6)
+
+    def test_decide_into_parity(self, core, mixed_signals):
+        engine = HybridAttentionEngine(temperature=0.7, use_rust=False)
+        now = datetime.now()
+        values, ages, source_ids, boosts = column_inputs(mixed_signals, engine, now)
+        py_out, rust_out = np.empty(len(values)), np.empty(len(values))
+
+        py_weighted = decide_columns(0.7, values, ages, source_ids, boosts, py_out)
+        rust_weighted = core.RustAttentionEngine(0.7).decide_into(
+            values, ages, source_ids, boosts, rust_out
+        )
+
+        assert rust_weighted == pytest.approx(py_weighted, rel=1e-12)
+        np.testing.assert_allclose(rust_out, py_out, rtol=1e-12)
+
+        with pytest.raises(ValueError):
+            core.RustAttentionEngine(0.7).decide_into(
+                values, ages, source_ids, boosts, np.empty(len(values) + 1)
+            )
+
+    @pytest.mark.parametrize("chunk_rows", [1, 7, 256])
+    def test_batch_decide_arrays_parity(self, core, chunk_rows):
+        rng = np.random.default_rng(11)
+        values = rng.uniform(-1, 1, (500, 6))
+        values[3] = 0.0  # Neutral row
+        ages = rng.uniform(0, 120, (500, 6))
+        mask = rng.random((500, 6)) > 0.2
+        sources = ["a", "b_volatility", "c", "d", "e", "f"]
+
+        expected = AttentionFusionEngine(0.9, use_rust=False).decide_arrays(
+            values, ages, sources, mask
+        )
+        result = AttentionFusionEngine(0.9, batch_chunk_rows=chunk_rows).decide_arrays(
+            values, ages, sources, mask
+        )
+
+        np.testing.assert_allclose(result.weights, expected.weights, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(result.weighted_values, expected.weighted_values, atol=1e-12)
+        assert (result.actions == expected.actions).all()
+        assert result.weights[3].sum() == 0.0
+
+    @pytest.mark.parametrize("scenario", list(compact_scenarios()))
+    def test_native_pipeline_parity(self, core, scenario):
+        signals = compact_scenarios()[scenario]
+        gate = SafetyGate(max_volatility_for_buy=0.04)
+
+        expected = HybridAttentionEngine(use_rust=False).decide_compact(signals, gate)
+        result = HybridAttentionEngine(use_rust=True).decide_compact(signals, gate)
+
+        assert result.action == expected.action
+        assert result.override_code == expected.override_code
+        assert result.dominant_row == expected.dominant_row
+        assert result.volatility == expected.volatility
+        np.testing.assert_allclose(result.weight_array, expected.weight_array, rtol=1e-12)
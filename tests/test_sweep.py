@@ -0,0 +1,96 @@
+"""
+Tests for the parallel parameter sweep (sweep.py)
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.backtest import Backtester, SignalSeries
+from src.brain import AttentionFusionEngine
+from src.safety import SafetyGate
+from src.sweep import (
+    ParameterSweep,
+    SharedSignalSeries,
+    _attach,
+    _close_worker,
+    _init_worker,
+    expand_grid,
+)
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(11)
+    names = rng.choice(["twitter_sentiment", "price_volatility", "news_feed"], size=500)
+    values = np.where(
+        names == "price_volatility", rng.uniform(0.0, 0.1, size=500), rng.uniform(-1, 1, size=500)
+    )
+    return SignalSeries.from_columns(np.sort(rng.uniform(0, 3600, size=500)), names, values)
+
+
+def test_expand_grid_fills_defaults_and_rejects_unknown():
+    """Test the cartesian product and configured defaults."""
+    points = expand_grid({"temperature": [0.5, 1.0], "max_volatility_for_buy": [0.03, 0.05, 0.07]})
+
+    assert len(points) == 6
+    assert {p["temperature"] for p in points} == {0.5, 1.0}
+    assert all(p["max_volatility_for_sell"] == 0.08 for p in points)  # Settings default
+
+    with pytest.raises(ValueError):
+        expand_grid({"learning_rate": [0.1]})
+
+
+def test_shared_series_round_trips(series):
+    """Test that the shared block exposes each source's observations as views, by name."""
+    from multiprocessing import shared_memory
+
+    times = Backtester().decision_times(series, step=60.0)
+    with SharedSignalSeries(series, times) as shared:
+        shm = shared_memory.SharedMemory(name=shared.handle.name)
+        attached = _attach(shm, shared.handle)
+
+        np.testing.assert_array_equal(attached.times, times)
+        assert attached.sources == series.sources
+        for i, (timestamps, values) in enumerate(attached.per_source):
+            np.testing.assert_array_equal(timestamps, series.timestamps[series.source_ids == i])
+            np.testing.assert_array_equal(values, series.values[series.source_ids == i])
+            assert not timestamps.flags.owndata
+
+        del attached, timestamps, values
+        shm.close()
+
+
+def test_worker_limits_rayon_to_one_thread(series, monkeypatch):
+    """Test that pool workers don't each start an all-core rayon pool."""
+    monkeypatch.setenv("RAYON_NUM_THREADS", "8")  # Restored after the test
+    times = Backtester().decision_times(series, step=60.0)
+    with SharedSignalSeries(series, times) as shared:
+        _init_worker(shared.handle)
+        _close_worker()
+
+    assert os.environ["RAYON_NUM_THREADS"] == "1"
+
+
+def test_parallel_sweep_matches_single_backtests(series):
+    """Test that pooled results equal individual backtests, in grid order."""
+    grid = {"temperature": [0.5, 2.0], "max_volatility_for_buy": [0.02, 0.06]}
+    # Small chunks: workers fill the shared series a chunk at a time
+    results = ParameterSweep(series, max_age=300.0, workers=2, chunk_size=64).run(grid)
+
+    assert len(results) == 4
+    for params, result in zip(expand_grid(grid), results):
+        assert result["parameters"] == params
+        backtester = Backtester(
+            engine=AttentionFusionEngine(temperature=params["temperature"]),
+            safety_gate=SafetyGate(
+                max_volatility_for_buy=params["max_volatility_for_buy"],
+                max_volatility_for_sell=params["max_volatility_for_sell"],
+                min_confidence_threshold=params["min_confidence_threshold"],
+            ),
+        )
+        expected = backtester.run(series, max_age=300.0).summary()
+        assert result["actions"] == expected["actions"]
+        assert result["overrides"] == expected["overrides"]
+        assert result["elapsed_seconds"] >= 0
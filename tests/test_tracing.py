@@ -0,0 +1,109 @@
+"""
+Tests for cycle tracing (tracing.py)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import main
+from main import AgentOrchestrator, get_trace
+from src.config import Settings
+from src.schemas import Signal, SignalRecord, SystemState
+from src.tracing import Tracer
+
+
+def test_disabled_tracer_records_nothing():
+    """Test that a disabled tracer hands out a shared no-op scope."""
+    tracer = Tracer(enabled=False)
+
+    with tracer.span("cycle") as span:
+        assert span is None
+    assert tracer.span("a") is tracer.span("b")
+    assert tracer.spans() == []
+
+
+def test_nested_spans_and_ring_buffer():
+    """Test parent/trace ids, error tagging and oldest-first eviction."""
+    tracer = Tracer(enabled=True, capacity=3)
+
+    with tracer.span("cycle", mode="poll") as cycle:
+        with tracer.span("cognition"):
+            pass
+        with pytest.raises(ValueError):
+            with tracer.span("safety"):
+                raise ValueError("boom")
+
+    cognition, safety, recorded_cycle = tracer.spans()
+    assert recorded_cycle is cycle and cycle.parent_id is None
+    assert cognition.parent_id == safety.parent_id == cycle.span_id
+    assert {span.trace_id for span in tracer.spans()} == {cycle.span_id}
+    assert cycle.start_ns <= cognition.start_ns <= cognition.end_ns <= cycle.end_ns
+    assert safety.args == {"error": "ValueError"}
+    assert cycle.to_dict()["args"] == {"mode": "poll"}
+
+    with tracer.span("next"):
+        pass
+    assert [span.name for span in tracer.spans()] == ["safety", "cycle", "next"]
+    assert [span.name for span in tracer.spans(limit=1)] == ["next"]
+
+
+async def test_spans_follow_child_tasks():
+    """Test that spans opened in tasks nest under the span that created them."""
+    tracer = Tracer(enabled=True)
+
+    async def fetch(source):
+        with tracer.span(source, "sensor"):
+            await asyncio.sleep(0)
+
+    with tracer.span("perception") as perception:
+        await asyncio.gather(fetch("news_feed"), fetch("twitter_sentiment"))
+
+    sensors = [span for span in tracer.spans() if span.category == "sensor"]
+    assert {span.parent_id for span in sensors} == {perception.span_id}
+    assert len({span.lane for span in sensors}) == 2  # One lane per task
+
+    trace = tracer.export_chrome()
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    lanes = [event for event in trace["traceEvents"] if event["ph"] == "M"]
+    assert len(events) == 3 and len(lanes) == 3
+    assert all(event["dur"] >= 0 and event["ts"] > 1e15 for event in events)  # Epoch µs
+    json.dumps(trace)
+
+
+async def test_cycle_records_stage_and_sensor_spans(monkeypatch):
+    """Test the spans of one polling cycle, served by /trace."""
+    monkeypatch.setattr(main, "system_state", SystemState())
+    orchestrator = AgentOrchestrator(Settings())
+    tracer = orchestrator.tracer = orchestrator.perception_hub.tracer = Tracer(enabled=True)
+
+    async def fetch_all():
+        async def fetch():
+            return SignalRecord("news_feed", 0.6)
+
+        signal = await orchestrator.perception_hub._safe_fetch("news_feed", fetch)
+        return {"news_feed": signal, "price_volatility": Signal(source="price_volatility", value=0.01)}
+
+    monkeypatch.setattr(orchestrator.perception_hub, "fetch_all", fetch_all)
+    await orchestrator._run_cycle()
+
+    by_name = {span.name: span for span in tracer.spans()}
+    cycle = by_name["cycle"]
+    assert set(by_name) == {
+        "cycle", "perception", "news_feed", "cognition", "safety", "explanation", "publish"
+    }
+    assert by_name["news_feed"].parent_id == by_name["perception"].span_id
+    assert by_name["safety"].parent_id == cycle.span_id
+
+    response = await get_trace(limit=None, format="json", tracer=tracer)
+    body = json.loads(response.body)
+    assert body["enabled"] and len(body["spans"]) == 7
+
+    response = await get_trace(limit=2, format="chrome", tracer=tracer)
+    assert [e["name"] for e in json.loads(response.body)["traceEvents"][:2]] == [
+        "publish",
+        "cycle",
+    ]
+
+    await orchestrator.perception_hub.close()
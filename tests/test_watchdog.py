@@ -0,0 +1,55 @@
+"""
+Tests for the event loop watchdog (watchdog.py)
+"""
+
+import asyncio
+import time
+
+from src.metrics import MetricsCollector
+from src.prometheus import render_prometheus
+from src.watchdog import LoopWatchdog
+
+
+def blocking_log_flush(seconds):
+    """Stand-in for a synchronous call that blocks the loop."""
+    time.sleep(seconds)
+
+
+async def test_heartbeat_records_lag():
+    """Test that heartbeats land in the loop lag histogram."""
+    metrics = MetricsCollector()
+    watchdog = LoopWatchdog(interval=0.01, stall_threshold_ms=500, metrics=metrics)
+
+    watchdog.start()
+    assert watchdog.running
+    await asyncio.sleep(0.1)
+    await watchdog.stop()
+
+    stats = metrics.get_loop_stats()
+    assert not watchdog.running
+    assert stats["heartbeats"] >= 3
+    assert stats["stalls"] == 0 and not watchdog.reports
+    assert 0.0 <= stats["p50_lag_ms"] <= stats["max_lag_ms"]
+    assert "event_loop" in metrics.get_all_stats()
+
+
+async def test_blocking_call_is_reported_with_stack():
+    """Test that a blocked loop produces one stall report naming the culprit."""
+    metrics = MetricsCollector()
+    watchdog = LoopWatchdog(interval=0.01, stall_threshold_ms=50, metrics=metrics)
+
+    watchdog.start()
+    await asyncio.sleep(0.03)
+    blocking_log_flush(0.3)
+    await asyncio.sleep(0.05)
+    await watchdog.stop()
+
+    assert metrics.loop_stalls == 1
+    (report,) = watchdog.reports
+    assert report.blocked_ms > 50
+    assert "blocking_log_flush" in report.stack[-1]
+    assert metrics.get_loop_stats()["max_lag_ms"] >= 250
+
+    text = render_prometheus(metrics)
+    assert "decisify_event_loop_stalls_total 1\n" in text
+    assert 'decisify_event_loop_lag_seconds_bucket{le="0.0001"}' in text